@@ -0,0 +1,79 @@
+"""Benchmark of reading a field of loaded config against plain dataclass.
+
+Execute 'python -m benchmarks.attribute_access --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+
+from yamldataclassconfig.config import YamlDataClassConfig
+
+
+@dataclass
+class PlainConfig:
+    """Plain dataclass as baseline."""
+
+    property_a: int
+    property_b: str
+
+
+@dataclass
+class DefaultConfig(YamlDataClassConfig):
+    """Config class which reads fields through property descriptors."""
+
+    property_a: int
+    property_b: str
+
+
+@dataclass
+class SnapshotConfig(YamlDataClassConfig):
+    """Config class which reads fields from snapshot."""
+
+    SNAPSHOT: ClassVar[bool] = True
+
+    property_a: int
+    property_b: str
+
+
+@dataclass
+class FastAccessConfig(YamlDataClassConfig):
+    """Config class which reads fields as plain attributes once loaded."""
+
+    FAST_ACCESS: ClassVar[bool] = True
+
+    property_a: int
+    property_b: str
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=1000000, help="number of reads per repetition")
+    arguments = parser.parse_args()
+    # Reason: Ruff's bug
+    instances: Dict[str, Any] = {"plain dataclass": PlainConfig(1, "2")}  # noqa: UP006
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "config.yml"
+        path.write_text("property_a: 1\nproperty_b: '2'\n", encoding="UTF-8")
+        for name, cls in (("default", DefaultConfig), ("SNAPSHOT", SnapshotConfig), ("FAST_ACCESS", FastAccessConfig)):
+            config = cls.create()
+            config.load(path)
+            instances[name] = config
+    results = {}
+    for name, instance in instances.items():
+        timer = timeit.Timer("instance.property_a", globals={"instance": instance})
+        results[name] = min(timer.repeat(repeat=5, number=arguments.number)) / arguments.number
+    baseline = results["plain dataclass"]
+    for name, seconds in results.items():
+        print(f"{name:>15}: {seconds * 1e9:8.1f} ns/read  x{seconds / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
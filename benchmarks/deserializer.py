@@ -0,0 +1,79 @@
+"""Benchmark of generated deserializer against marshmallow schema.
+
+Execute 'python -m benchmarks.deserializer --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from typing import Any
+from typing import Dict
+from typing import List
+
+from dataclasses_json import DataClassJsonMixin
+from marshmallow import fields
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.config_property import set_deserialization_context
+from yamldataclassconfig.deserializer import DESERIALIZERS
+from yamldataclassconfig.deserializer import deserialize
+
+
+@dataclass
+class PartConfig(DataClassJsonMixin):
+    """Nested section like README example."""
+
+    property_c: datetime = field(
+        metadata={
+            "dataclasses_json": {
+                "encoder": datetime.isoformat,
+                "decoder": datetime.fromisoformat,
+                "mm_field": fields.DateTime(format="iso"),
+            },
+        },
+    )
+    name: str = ""
+    enabled: bool = False
+
+
+@dataclass
+class BenchmarkConfig(YamlDataClassConfig):
+    """Config class which has scalar fields and list of nested sections."""
+
+    property_a: int
+    property_b: str
+    part_config: PartConfig = field(metadata={"dataclasses_json": {"mm_field": PartConfig}})
+    # Reason: Ruff's bug
+    parts: List[PartConfig] = field(default_factory=list)  # noqa: UP006
+
+
+# Reason: Ruff's bug
+def create_data(parts: int) -> Dict[str, Any]:  # noqa: UP006
+    part = {"property_c": "2019-06-25 13:33:30", "name": "name", "enabled": True}
+    return {"property_a": 1, "property_b": "2", "part_config": part, "parts": [dict(part) for _ in range(parts)]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parts", type=int, default=100, help="number of nested sections in list")
+    parser.add_argument("--number", type=int, default=200, help="number of deserializations per repetition")
+    arguments = parser.parse_args()
+    data = create_data(arguments.parts)
+    set_deserialization_context(value=True)
+    results = {}
+    for name in DESERIALIZERS:
+        # Warm up caches of schema and generated function
+        deserialize(BenchmarkConfig, data, name)
+        timer = timeit.Timer(lambda name=name: deserialize(BenchmarkConfig, data, name))  # type: ignore[misc]
+        results[name] = min(timer.repeat(repeat=3, number=arguments.number)) / arguments.number
+    baseline = results["marshmallow"]
+    for name, seconds in results.items():
+        print(f"{name:>12}: {seconds * 1e6:10.1f} us/load  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
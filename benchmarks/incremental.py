@@ -0,0 +1,95 @@
+"""Benchmark of reloading large config after only one top-level key changed.
+
+Execute 'python -m benchmarks.incremental --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import timeit
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import ClassVar
+from typing import List
+from typing import Tuple
+
+import yaml
+from dataclasses_json import DataClassJsonMixin
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.deserializer import DESERIALIZERS
+
+
+@dataclass
+class ServiceConfig(DataClassJsonMixin):
+    """Nested section which makes up most of the file."""
+
+    name: str
+    host: str
+    port: int
+    # Reason: Ruff's bug
+    tags: List[str]  # noqa: UP006
+
+
+@dataclass
+class LargeConfig(YamlDataClassConfig):
+    """Config class which holds many services and a setting which changes."""
+
+    port: int
+    # Reason: Ruff's bug
+    services: List[ServiceConfig]  # noqa: UP006
+
+
+@dataclass
+class IncrementalLargeConfig(LargeConfig):
+    """Same config class which deserializes only changed fields on reload."""
+
+    INCREMENTAL_RELOAD: ClassVar[bool] = True
+
+
+# Reason: Ruff's bug
+def reload_changed(
+    config: LargeConfig,
+    path: Path,
+    contents: Tuple[str, str],  # noqa: UP006
+    deserializer: str,
+) -> None:
+    """Rewrite the file with the other port and reload the instance."""
+    path.write_text(contents[config.port % 2], encoding="UTF-8")
+    config.load(path, path_is_absolute=True, deserializer=deserializer, force=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--services", type=int, default=2000, help="number of services in the config file")
+    parser.add_argument("--deserializer", choices=DESERIALIZERS, default=DESERIALIZERS[0], help="deserializer")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions per variant")
+    arguments = parser.parse_args()
+    services = [
+        {
+            "name": f"service-{index}",
+            "host": f"10.0.{index // 256}.{index % 256}",
+            "port": 8000 + index % 100,
+            "tags": ["a", "b"],
+        }
+        for index in range(arguments.services)
+    ]
+    contents = (yaml.safe_dump({"port": 1, "services": services}), yaml.safe_dump({"port": 2, "services": services}))
+    results = {}
+    with tempfile.TemporaryDirectory() as str_temp_dir:
+        path = Path(str_temp_dir) / "config.yml"
+        path.write_text(contents[0], encoding="UTF-8")
+        for name, config_class in (("full", LargeConfig), ("incremental", IncrementalLargeConfig)):
+            config = config_class.create()
+            config.load(path, path_is_absolute=True, deserializer=arguments.deserializer)
+            function = partial(reload_changed, config, path, contents, arguments.deserializer)
+            results[name] = min(timeit.Timer(function).repeat(repeat=arguments.repeat, number=1))
+    baseline = results["full"]
+    for name, seconds in results.items():
+        print(f"{name:>11}: {seconds * 1000:8.2f} ms  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of reloading layered config after only the small overlay changed.
+
+Execute 'python -m benchmarks.layers --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import timeit
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+from typing import Dict
+
+import yaml
+
+from yamldataclassconfig.config import YamlDataClassConfig
+
+
+@dataclass
+class LayeredConfig(YamlDataClassConfig):
+    """Config class which holds large mapping of routes and a few settings per environment."""
+
+    port: int
+    # Reason: Ruff's bug
+    routes: Dict[str, Any]  # noqa: UP006
+
+
+def rewrite_overlay(path: Path, port: int) -> None:
+    """Rewrite the overlay and move its mtime forward so that the next load surely detects the change."""
+    stat = path.stat()
+    path.write_text(f"port: {port}\n", encoding="UTF-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def reload_fresh(base: Path, overlay: Path) -> None:
+    """Load all layers into new instance as every reload did without the cache of layers."""
+    config = LayeredConfig.create()
+    config.load(base, path_is_absolute=True, overlays=[overlay])
+
+
+def reload_changed(config: LayeredConfig, base: Path, overlay: Path) -> None:
+    """Change the overlay and reload the instance which has parsed the base."""
+    rewrite_overlay(overlay, config.port + 1)
+    config.load(base, path_is_absolute=True, overlays=[overlay])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--routes", type=int, default=5000, help="number of routes in the base config file")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions per variant")
+    arguments = parser.parse_args()
+    with tempfile.TemporaryDirectory() as str_temp_dir:
+        base = Path(str_temp_dir) / "config.yml"
+        overlay = Path(str_temp_dir) / "config.prod.yml"
+        routes = {
+            f"/route/{index}": {"upstream": f"backend-{index}", "timeout": index % 30}
+            for index in range(arguments.routes)
+        }
+        base.write_text(yaml.safe_dump({"port": 80, "routes": routes}), encoding="UTF-8")
+        overlay.write_text("port: 443\n", encoding="UTF-8")
+        config = LayeredConfig.create()
+        config.load(base, path_is_absolute=True, overlays=[overlay])
+        variants = {
+            "all layers": partial(reload_fresh, base, overlay),
+            "changed layer": partial(reload_changed, config, base, overlay),
+        }
+        results = {
+            name: min(timeit.Timer(function).repeat(repeat=arguments.repeat, number=1))
+            for name, function in variants.items()
+        }
+    baseline = results["all layers"]
+    for name, seconds in results.items():
+        print(f"{name:>14}: {seconds * 1000:8.2f} ms  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
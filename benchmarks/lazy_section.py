@@ -0,0 +1,109 @@
+"""Benchmark of loading config which has many nested sections eagerly and lazily.
+
+Execute 'python -m benchmarks.lazy_section --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from dataclasses import make_dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+
+import yaml
+from dataclasses_json import DataClassJsonMixin
+
+from yamldataclassconfig.config import YamlDataClassConfig
+
+
+@dataclass
+class Section(DataClassJsonMixin):
+    """Section which has typical scalar and list fields."""
+
+    host: str
+    port: int
+    timeout: float
+    enabled: bool
+    # Reason: Ruff's bug
+    tags: List[str]  # noqa: UP006
+
+
+def create_config_class(sections: int, *, lazy: bool) -> Any:  # noqa: ANN401
+    """Create config class which has specified number of section fields."""
+    return make_dataclass(
+        "LazyConfig" if lazy else "EagerConfig",
+        [(f"section_{index}", Section) for index in range(sections)],
+        bases=(YamlDataClassConfig,),
+        namespace={"LAZY_SECTIONS": lazy},
+    )
+
+
+def write_config(path: Path, sections: int) -> None:
+    # Reason: Ruff's bug
+    content: Dict[str, Any] = {  # noqa: UP006
+        f"section_{index}": {
+            "host": f"host-{index}",
+            "port": index,
+            "timeout": 1.5,
+            "enabled": True,
+            "tags": ["a", "b"],
+        }
+        for index in range(sections)
+    }
+    path.write_text(yaml.safe_dump(content), encoding="UTF-8")
+
+
+def load_and_touch(cls: Any, path: Path, touch: int) -> Any:  # noqa: ANN401
+    """Load the file and read a field of the first sections as a process which touches only a few of them."""
+    config = cls.create()
+    config.load(path, path_is_absolute=True, force=True)
+    for index in range(touch):
+        _ = getattr(config, f"section_{index}").host
+    return config
+
+
+def measure_memory(cls: Any, path: Path, touch: int, instances: int = 10) -> float:  # noqa: ANN401
+    """Measure bytes retained per loaded config.
+
+    Several instances are kept and averaged, so that memory kept by free lists of the interpreter doesn't skew it.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    configs = [load_and_touch(cls, path, touch) for _ in range(instances)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del configs
+    return (after - before) / instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=300, help="number of nested sections")
+    parser.add_argument("--touch", type=int, default=3, help="number of sections to access after load")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions per variant")
+    arguments = parser.parse_args()
+    with tempfile.TemporaryDirectory() as str_temp_dir:
+        path = Path(str_temp_dir) / "sections.yml"
+        write_config(path, arguments.sections)
+        for name, lazy in (("eager", False), ("lazy", True)):
+            cls = create_config_class(arguments.sections, lazy=lazy)
+            # Warm up caches of schema, validation plan and so on
+            load_and_touch(cls, path, arguments.touch)
+            timer = timeit.Timer(partial(load_and_touch, cls, path, arguments.touch))
+            seconds = min(timer.repeat(repeat=arguments.repeat, number=1))
+            size = measure_memory(cls, path, arguments.touch)
+            print(f"{name:>6}: {seconds * 1000:8.2f} ms  {size / 1024:8.1f} KiB retained")
+
+
+if __name__ == "__main__":
+    main()
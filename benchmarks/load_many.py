@@ -0,0 +1,81 @@
+"""Benchmark of loading many config files sequentially and by load_many().
+
+Execute 'python -m benchmarks.load_many --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import yaml
+
+from yamldataclassconfig.config import YamlDataClassConfig
+
+
+@dataclass
+class TenantConfig(YamlDataClassConfig):
+    """Config class of tenant which has moderately large mapping."""
+
+    tenant_id: int
+    name: str
+    # Reason: Ruff's bug
+    routes: Dict[str, Any]  # noqa: UP006
+
+
+# Reason: Ruff's bug
+def load_sequentially(paths: List[Path]) -> None:  # noqa: UP006
+    """Load files one by one as before load_many()."""
+    for path in paths:
+        config = TenantConfig.create()
+        config.load(path, path_is_absolute=True)
+
+
+# Reason: Ruff's bug
+def measure(load: Callable[[List[Path]], Any], paths: List[Path]) -> float:  # noqa: UP006
+    """Measure seconds to load all files."""
+    start = time.perf_counter()
+    load(paths)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=500, help="number of config files")
+    parser.add_argument("--routes", type=int, default=200, help="number of routes in each config file")
+    arguments = parser.parse_args()
+    variants = {
+        "sequential": load_sequentially,
+        "thread": lambda paths: TenantConfig.load_many(paths, path_is_absolute=True),
+        "process": lambda paths: TenantConfig.load_many(paths, path_is_absolute=True, executor="process"),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(arguments.tenants):
+            path = Path(directory) / f"tenant_{index}.yml"
+            routes = {
+                f"/route/{route}": {"upstream": f"backend-{route}", "timeout": route % 30}
+                for route in range(arguments.routes)
+            }
+            content = yaml.safe_dump({"tenant_id": index, "name": f"tenant-{index}", "routes": routes})
+            path.write_text(content, encoding="UTF-8")
+            paths.append(path)
+        # Warm up caches of schema, validation plan and so on
+        load_sequentially(paths[:1])
+        results = {name: measure(load, paths) for name, load in variants.items()}
+    print(f"CPU cores: {os.cpu_count()}")
+    baseline = results["sequential"]
+    for name, seconds in results.items():
+        print(f"{name:>10}: {seconds:8.3f} s  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark of memory per loaded config instance.
+
+Execute 'python -m benchmarks.memory --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import List
+from typing import Type
+
+from yamldataclassconfig.config import YamlDataClassConfig
+
+
+@dataclass
+class TenantConfig(YamlDataClassConfig):
+    """Config class which has typical scalar fields of tenant."""
+
+    tenant_id: int
+    name: str
+    host: str
+    port: int
+    enabled: bool
+    # Reason: Ruff's bug
+    tags: List[str]  # noqa: UP006
+
+
+@dataclass
+class SnapshotTenantConfig(TenantConfig):
+    """Config class which publishes snapshot on load."""
+
+    SNAPSHOT: ClassVar[bool] = True
+
+
+@dataclass
+class FastAccessTenantConfig(TenantConfig):
+    """Config class which reads fields as plain attributes once loaded."""
+
+    FAST_ACCESS: ClassVar[bool] = True
+
+
+def load_instance(cls: Type[TenantConfig]) -> Callable[[Path], Any]:  # noqa: UP006
+    """Return function which loads the file into new instance of the config class."""
+
+    def load(path: Path) -> Any:  # noqa: ANN401
+        config = cls.create()
+        config.load(path)
+        return config
+
+    return load
+
+
+# Reason: Ruff's bug
+def measure(load: Callable[[Path], Any], paths: List[Path]) -> float:  # noqa: UP006
+    """Measure bytes allocated per retained config including its values."""
+    # Warm up caches of schema, validation plan and so on
+    load(paths[0])
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = [load(path) for path in paths]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Exclude the list itself
+    return (after - before - len(retained) * 8) / len(retained)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=1000, help="number of config instances to keep")
+    arguments = parser.parse_args()
+    variants = {
+        "default": load_instance(TenantConfig),
+        "SNAPSHOT": load_instance(SnapshotTenantConfig),
+        "FAST_ACCESS": load_instance(FastAccessTenantConfig),
+        "load_snapshot()": TenantConfig.load_snapshot,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(arguments.tenants):
+            path = Path(directory) / f"tenant_{index}.yml"
+            path.write_text(
+                f"tenant_id: {index}\nname: tenant-{index}\nhost: host-{index}.example.com\nport: 8080\n"
+                "enabled: true\ntags: [a, b]\n",
+                encoding="UTF-8",
+            )
+            paths.append(path)
+        results = {name: measure(load, paths) for name, load in variants.items()}
+    baseline = results["default"]
+    for name, size in results.items():
+        print(f"{name:>16}: {size:8.0f} bytes/instance  x{size / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark of peak RSS while loading large config file.
+
+Each variant runs in its own process since peak RSS of a process never decreases.
+Requires the resource module, that is, Unix.
+
+Execute 'python -m benchmarks.peak_memory --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Dict
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.yaml_backend import get_yaml_backend
+
+VARIANTS = ("read_text", "load")
+
+
+@dataclass
+class LargeConfig(YamlDataClassConfig):
+    """Config class which holds large mapping of long texts."""
+
+    # Reason: Ruff's bug
+    sections: Dict[str, Any]  # noqa: UP006
+
+
+def write_large_config(path: Path, megabytes: int) -> int:
+    """Write config file of about specified size whose values are long texts and return its size in bytes."""
+    text = "lorem ipsum dolor sit amet " * 37
+    with path.open("w", encoding="UTF-8") as file:
+        file.write("sections:\n")
+        for index in range(megabytes * 1024 * 1024 // (len(text) + 20)):
+            file.write(f"  section_{index}: {text}\n")
+    return path.stat().st_size
+
+
+def max_rss_bytes() -> int:
+    """Peak RSS of this process in bytes."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports in kilobytes while macOS reports in bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def measure(variant: str, path: Path) -> None:
+    """Print increase of peak RSS by loading the file, called in a child process."""
+    config = LargeConfig.create()
+    backend = get_yaml_backend(LargeConfig.YAML_BACKEND)
+    before = max_rss_bytes()
+    if variant == "read_text":
+        # How load() read the file before streaming
+        backend.load(path.read_text(encoding="UTF-8"))
+    else:
+        config.load(path, path_is_absolute=True)
+    print(max_rss_bytes() - before)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=int, default=100, help="size of generated config file")
+    parser.add_argument("--measure", choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+    if arguments.measure is not None:
+        measure(arguments.measure, arguments.path)
+        return
+    with tempfile.TemporaryDirectory() as str_temp_dir:
+        path = Path(str_temp_dir) / "large.yml"
+        size = write_large_config(path, arguments.megabytes)
+        print(f"File size: {size / 1024 / 1024:.2f} MiB")
+        results = {}
+        for variant in VARIANTS:
+            command = [sys.executable, "-W", "ignore", "-m", "benchmarks.peak_memory"]
+            command += ["--measure", variant, "--path", str(path)]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout  # noqa: S603
+            results[variant] = int(output)
+    baseline = results["read_text"]
+    for variant, increase in results.items():
+        print(f"{variant:>10}: {increase / 1024 / 1024:8.1f} MiB peak RSS increase  x{increase / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
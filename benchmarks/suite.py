@@ -0,0 +1,238 @@
+"""Benchmark suite which times creating, each stage of loading and reading synthetic config.
+
+Stages of load() are timed separately: read, parse, validate, deserialize and apply, followed by whole load() and
+steady-state attribute reads of the loaded instance. Results are written as JSON, so that results of different
+versions can be compared by --baseline.
+
+The suite detects APIs of the installed version, so that it also runs against versions released before YAML backends,
+deserializers and so on were added. Such versions are timed through their equivalents, yaml.full_load(),
+schema().load() and validate_config_if_needed(), and stages which they have no equivalent for are written as null.
+
+Execute 'python -m benchmarks.suite --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import get_type_hints
+
+import yaml
+
+from benchmarks.synthetic import create_config_class
+from benchmarks.synthetic import create_content
+from yamldataclassconfig import __version__
+from yamldataclassconfig import utility
+from yamldataclassconfig import validation
+from yamldataclassconfig.config_property import set_deserialization_context
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+# Names which describe the only parser and deserializer of versions before they became selectable
+LEGACY_YAML_BACKEND = "full"
+LEGACY_DESERIALIZER = "marshmallow"
+
+
+def optional_module(name: str) -> Optional[ModuleType]:  # noqa: UP045
+    """Import module which older versions don't have, None when the installed version doesn't have it."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+YAML_BACKEND_MODULE = optional_module("yamldataclassconfig.yaml_backend")
+DESERIALIZER_MODULE = optional_module("yamldataclassconfig.deserializer")
+
+
+# Reason: Ruff's bug
+def yaml_backend_options() -> Tuple[List[str], str]:  # noqa: UP006
+    """Names of YAML backends and the default of the installed version."""
+    if YAML_BACKEND_MODULE is None:
+        return [LEGACY_YAML_BACKEND], LEGACY_YAML_BACKEND
+    return YAML_BACKEND_MODULE.yaml_backend_names(), YAML_BACKEND_MODULE.DEFAULT_YAML_BACKEND
+
+
+# Reason: Ruff's bug
+def deserializer_options() -> Tuple[List[str], str]:  # noqa: UP006
+    """Names of deserializers and the default of the installed version."""
+    if DESERIALIZER_MODULE is None:
+        return [LEGACY_DESERIALIZER], LEGACY_DESERIALIZER
+    return list(DESERIALIZER_MODULE.DESERIALIZERS), DESERIALIZER_MODULE.DESERIALIZERS[0]
+
+
+def parser_of(yaml_backend: str) -> Callable[[bytes], Any]:
+    if YAML_BACKEND_MODULE is None:
+        return yaml.full_load
+    return YAML_BACKEND_MODULE.get_yaml_backend(yaml_backend).load  # type: ignore[no-any-return]
+
+
+# Reason: Ruff's bug
+def deserializer_of(cls: type, deserializer: str) -> Callable[[Dict[str, Any]], Any]:  # noqa: UP006
+    """Return function which deserializes content as load() of the installed version does."""
+    if DESERIALIZER_MODULE is not None:
+        return partial(DESERIALIZER_MODULE.deserialize, cls, name=deserializer)
+
+    def deserialize(dictionary_config: Dict[str, Any]) -> Any:  # noqa: ANN401,UP006
+        set_deserialization_context(value=True)
+        try:
+            return cls.schema().load(dictionary_config)  # type: ignore[attr-defined]
+        finally:
+            set_deserialization_context(value=False)
+
+    return deserialize
+
+
+# Reason: Ruff's bug
+def validator_of(cls: type) -> Callable[[Dict[str, Any]], Any]:  # noqa: UP006
+    """Return function which validates content as load() of the installed version does."""
+    get_validation_plan = getattr(validation, "get_validation_plan", None)
+    if get_validation_plan is not None:
+        return get_validation_plan(cls).validate  # type: ignore[no-any-return]
+    # Type hints are resolved on every load() of such versions
+    return lambda dictionary_config: validation.validate_config_if_needed(dictionary_config, get_type_hints(cls))
+
+
+# Reason: Ruff's bug
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, float]:  # noqa: UP006
+    """Return seconds per call, calibrating the number of calls per repetition to take at least 0.2 seconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    timings = [seconds / number for seconds in timer.repeat(repeat=repeat, number=number)]
+    return {"min": min(timings), "median": statistics.median(timings), "number": number, "repeat": repeat}
+
+
+def read(path: Path) -> bytes:
+    open_config_file = getattr(utility, "open_config_file", None)
+    if open_config_file is None:
+        return path.read_bytes()
+    with open_config_file(path) as file:
+        return file.read()  # type: ignore[no-any-return]
+
+
+# Reason: Ruff's bug
+def load_options(load: Callable[..., Any], **options: Any) -> Dict[str, Any]:  # noqa: ANN401,UP006
+    """Options of load() which the installed version accepts."""
+    parameters = inspect.signature(load).parameters
+    return {name: value for name, value in options.items() if name in parameters}
+
+
+# Reason: Ruff's bug
+def run(arguments: argparse.Namespace, path: Path) -> Dict[str, Any]:  # noqa: UP006
+    """Time each stage and return results keyed by stage, None for stages which the installed version doesn't have."""
+    cls = create_config_class(arguments.fields, arguments.depth)
+    parse = parser_of(arguments.yaml_backend)
+    deserialize = deserializer_of(cls, arguments.deserializer)
+    config = cls.create()
+    options = load_options(
+        config.load,
+        path_is_absolute=True,
+        yaml_backend=arguments.yaml_backend,
+        deserializer=arguments.deserializer,
+        force=True,
+    )
+    # Warm up caches of schema, validation plan and so on
+    config.load(path, **options)
+    content = read(path)
+    dictionary_config = parse(content)
+    values = vars(deserialize(dictionary_config))
+    apply_values = getattr(config, "_apply_values", None)
+    # Reason: Ruff's bug
+    stages: Dict[str, Optional[Callable[[], Any]]] = {  # noqa: UP006,UP045
+        "create": cls.create,
+        "read": partial(read, path),
+        "parse": partial(parse, content),
+        "validate": partial(validator_of(cls), dictionary_config),
+        "deserialize": partial(deserialize, dictionary_config),
+        "apply": None if apply_values is None else partial(apply_values, values),
+        # Older versions reload without force since they don't skip unchanged files
+        "load": partial(config.load, path, **options),
+        "read_attribute": partial(getattr, config, "field_0"),
+    }
+    results: Dict[str, Any] = {}  # noqa: UP006  # Reason: Ruff's bug
+    for name, function in stages.items():
+        if function is None:
+            results[name] = None
+            print(f"{name:>15}: skipped", file=sys.stderr)
+            continue
+        results[name] = measure(function, arguments.repeat)
+        print(f"{name:>15}: {results[name]['min'] * 1e6:12.3f} us", file=sys.stderr)
+    return results
+
+
+# Reason: Ruff's bug
+def compare(results: Dict[str, Any], baseline_path: Path) -> None:  # noqa: UP006
+    """Print ratio of each stage to the baseline, above 1 means slower than the baseline."""
+    baseline = json.loads(baseline_path.read_text(encoding="UTF-8"))
+    print(f"Compared with {baseline_path} (yamldataclassconfig {baseline['meta']['version']}):", file=sys.stderr)
+    for name, result in results.items():
+        base = baseline["results"].get(name)
+        if result is not None and base is not None:
+            print(f"{name:>15}: x{result['min'] / base['min']:.2f}", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=20, help="number of fields per level")
+    parser.add_argument("--depth", type=int, default=2, help="nesting depth of sections")
+    parser.add_argument("--list-size", type=int, default=10, help="number of items of list fields")
+    backends, default_backend = yaml_backend_options()
+    parser.add_argument("--yaml-backend", choices=backends, default=default_backend, help="YAML parser backend")
+    deserializers, default_deserializer = deserializer_options()
+    parser.add_argument("--deserializer", choices=deserializers, default=default_deserializer, help="deserializer")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions per stage")
+    parser.add_argument("--output", type=Path, help="path to write JSON results, standard output when omitted")
+    parser.add_argument("--baseline", type=Path, help="path to JSON results of another version to compare with")
+    arguments = parser.parse_args()
+    with tempfile.TemporaryDirectory() as str_temp_dir:
+        path = Path(str_temp_dir) / "synthetic.yml"
+        content = create_content(arguments.fields, arguments.depth, arguments.list_size)
+        path.write_text(yaml.safe_dump(content), encoding="UTF-8")
+        results = run(arguments, path)
+        size = path.stat().st_size
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "parameters": {
+            "fields": arguments.fields,
+            "depth": arguments.depth,
+            "list_size": arguments.list_size,
+            "yaml_backend": arguments.yaml_backend,
+            "deserializer": arguments.deserializer,
+            "file_size": size,
+        },
+        "unit": "seconds per call",
+        "results": results,
+    }
+    if arguments.baseline is not None:
+        compare(results, arguments.baseline)
+    text = json.dumps(report, indent=2)
+    if arguments.output is None:
+        print(text)
+    else:
+        arguments.output.write_text(text + "\n", encoding="UTF-8")
+
+
+if __name__ == "__main__":
+    main()
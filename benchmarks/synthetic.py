@@ -0,0 +1,67 @@
+"""Synthetic config classes and matching YAML content for benchmarks.
+
+Each level of the generated config has the given number of fields which cycle through int, str, float, bool and list of
+ints, and all levels except the deepest one have one more field "child" which holds the next level as nested section.
+"""
+
+from __future__ import annotations
+
+from dataclasses import make_dataclass
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from dataclasses_json import DataClassJsonMixin
+
+from yamldataclassconfig.config import YamlDataClassConfig
+
+# Reason: Ruff's bug
+FIELD_TYPES: Tuple[Any, ...] = (int, str, float, bool, List[int])  # noqa: UP006
+
+
+def field_type(index: int) -> Any:  # noqa: ANN401
+    return FIELD_TYPES[index % len(FIELD_TYPES)]
+
+
+def field_value(index: int, list_size: int) -> Any:  # noqa: ANN401
+    type_ = field_type(index)
+    if type_ is int:
+        return index
+    if type_ is str:
+        return f"value-{index}"
+    if type_ is float:
+        return index + 0.5
+    if type_ is bool:
+        return index % 2 == 0
+    return list(range(list_size))
+
+
+# Reason: Ruff's bug
+def definitions(fields: int, child: Any) -> List[Tuple[str, Any]]:  # noqa: ANN401,UP006
+    """Fields of one level for make_dataclass()."""
+    result: List[Tuple[str, Any]] = [(f"field_{index}", field_type(index)) for index in range(fields)]  # noqa: UP006
+    if child is not None:
+        result.append(("child", child))
+    return result
+
+
+def create_config_class(fields: int, depth: int) -> Any:  # noqa: ANN401
+    """Create config class whose sections are nested to the depth, each level has the number of fields."""
+    child = None
+    for level in range(depth, 0, -1):
+        child = make_dataclass(f"SyntheticSection{level}", definitions(fields, child), bases=(DataClassJsonMixin,))
+    return make_dataclass("SyntheticConfig", definitions(fields, child), bases=(YamlDataClassConfig,))
+
+
+# Reason: Ruff's bug
+def create_content(fields: int, depth: int, list_size: int) -> Dict[str, Any]:  # noqa: UP006
+    """Create dictionary to dump as YAML content which matches the class created by create_config_class()."""
+    content: Dict[str, Any] = {}  # noqa: UP006  # Reason: Ruff's bug
+    level = content
+    for current in range(depth + 1):
+        level.update({f"field_{index}": field_value(index, list_size) for index in range(fields)})
+        if current < depth:
+            level["child"] = {}
+            level = level["child"]
+    return content
@@ -0,0 +1,73 @@
+"""Benchmark of YAML parser backends on large config file.
+
+Execute 'python -m benchmarks.yaml_backend --help' for guidance on options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Dict
+
+import yaml
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.yaml_backend import get_yaml_backend
+from yamldataclassconfig.yaml_backend import yaml_backend_names
+
+
+@dataclass
+class LargeConfig(YamlDataClassConfig):
+    """Config class which holds large mapping."""
+
+    # Reason: Ruff's bug
+    sections: Dict[str, Any]  # noqa: UP006
+
+
+def write_large_config(path: Path, sections: int) -> int:
+    """Write config file which has specified number of sections and return its size in bytes."""
+    content = {
+        "sections": {
+            f"section_{index}": {
+                "id": index,
+                "name": f"name_{index}",
+                "enabled": index % 2 == 0,
+                "ratio": index / 3,
+                "tags": [f"tag_{index}_{tag}" for tag in range(3)],
+            }
+            for index in range(sections)
+        },
+    }
+    path.write_text(yaml.safe_dump(content), encoding="UTF-8")
+    return path.stat().st_size
+
+
+def measure(path: Path, yaml_backend: str, repeat: int) -> float:
+    """Measure the fastest seconds to load config file with specified backend."""
+    config = LargeConfig.create()
+    timer = timeit.Timer(lambda: config.load(path, yaml_backend=yaml_backend, force=True))
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=20000, help="number of sections in generated config file")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions per backend")
+    arguments = parser.parse_args()
+    with tempfile.TemporaryDirectory() as str_temp_dir:
+        path = Path(str_temp_dir) / "large.yml"
+        size = write_large_config(path, arguments.sections)
+        print(f"File size: {size / 1024 / 1024:.2f} MiB")
+        results = {name: measure(path, name, arguments.repeat) for name in yaml_backend_names()}
+        baseline = results["full"]
+        for name, seconds in results.items():
+            libyaml = "libyaml" if get_yaml_backend(name).is_libyaml else "python"
+            print(f"{name:>8} ({libyaml:>7}): {seconds:8.3f} s  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Tests for YamlDataClassConfig.aload()."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from tests.conftest import SimpleTestConfig
+from yamldataclassconfig.config import YamlDataClassConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NAMES = ["alice", "bob", "carol"]
+
+
+def block_reading(monkeypatch: pytest.MonkeyPatch) -> threading.Event:
+    """Make reading YAML content block until the returned event is set."""
+    releasing = threading.Event()
+    original = YamlDataClassConfig._load_yaml_content  # noqa: SLF001  # pylint: disable=protected-access
+
+    def load_yaml_content(self: YamlDataClassConfig, config_path: Path, **kwargs: Any) -> Any:  # noqa: ANN401
+        releasing.wait()
+        return original(self, config_path, **kwargs)
+
+    monkeypatch.setattr(YamlDataClassConfig, "_load_yaml_content", load_yaml_content)
+    return releasing
+
+
+class TestAload:
+    """Tests for YamlDataClassConfig.aload()."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_aload(temporary_yaml_file: Path) -> None:
+        """Config should be loaded as load() does."""
+        config = SimpleTestConfig.create()
+        asyncio.run(config.aload(temporary_yaml_file))
+        assert (config.name, config.age) == ("test", 30)
+
+    @staticmethod
+    def test_concurrent(tmp_path: Path) -> None:
+        """Several configs should be loaded concurrently on the same loop."""
+        configs = [SimpleTestConfig.create() for _ in NAMES]
+        for age, name in enumerate(NAMES):
+            (tmp_path / f"{name}.yml").write_text(f"name: {name}\nage: {age}\n")
+
+        async def main() -> None:
+            await asyncio.gather(*(config.aload(tmp_path / f"{name}.yml") for config, name in zip(configs, NAMES)))
+
+        asyncio.run(main())
+        assert [(config.name, config.age) for config in configs] == list(zip(NAMES, range(len(NAMES))))
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_timeout(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Config should keep values of the last load when timeout expires."""
+        config = SimpleTestConfig.create()
+        config.load(temporary_yaml_file)
+        temporary_yaml_file.write_text("name: changed\nage: 31\n")
+        releasing = block_reading(monkeypatch)
+
+        async def main() -> None:
+            try:
+                await config.aload(temporary_yaml_file, timeout=0.01)
+            finally:
+                releasing.set()
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(main())
+        assert (config.name, config.age) == ("test", 30)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_cancel(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Config should stay unloaded when loading is cancelled."""
+        config = SimpleTestConfig.create()
+        releasing = block_reading(monkeypatch)
+
+        async def main() -> None:
+            task = asyncio.ensure_future(config.aload(temporary_yaml_file))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            releasing.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert not config._loaded  # noqa: SLF001  # pylint: disable=protected-access
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_unchanged(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unchanged file should not be read again."""
+        config = SimpleTestConfig.create()
+        asyncio.run(config.aload(temporary_yaml_file))
+
+        def fail(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError
+
+        monkeypatch.setattr(SimpleTestConfig, "_load_yaml_content", fail)
+        asyncio.run(config.aload(temporary_yaml_file))
+        assert config.name == "test"
@@ -0,0 +1,84 @@
+"""Tests for bulk.py."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from typing import List
+
+import pytest
+
+from tests.conftest import SimpleTestConfig
+from yamldataclassconfig.exceptions import ConfigLoadError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+NAMES = ["alice", "bob", "carol"]
+
+
+@pytest.fixture
+# Reason: Ruff's bug
+def yaml_files(tmp_path: Path) -> List[Path]:  # noqa: UP006
+    """Create a YAML file per name."""
+    paths = []
+    for age, name in enumerate(NAMES):
+        path = tmp_path / f"{name}.yml"
+        path.write_text(f"name: {name}\nage: {age}\n")
+        paths.append(path)
+    return paths
+
+
+class TestLoadMany:
+    """Tests for YamlDataClassConfig.load_many()."""
+
+    @staticmethod
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    # Reason: Ruff's bug
+    def test_load_many(yaml_files: List[Path], executor: str) -> None:  # noqa: UP006
+        """Each file should be loaded into its own instance keyed by the given path in order."""
+        configs = SimpleTestConfig.load_many(yaml_files, path_is_absolute=True, executor=executor, max_workers=2)
+        assert list(configs) == yaml_files
+        assert [(config.name, config.age) for config in configs.values()] == list(zip(NAMES, range(len(NAMES))))
+
+    @staticmethod
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    # Reason: Ruff's bug
+    def test_errors(yaml_files: List[Path], executor: str) -> None:  # noqa: UP006
+        """Errors of all failed paths should be aggregated after all paths finished."""
+        yaml_files[0].write_text("name: alice\nage: unknown\n")
+        missing = yaml_files[0].parent / "missing.yml"
+        with pytest.raises(ExceptionGroup, match="Failed to load 2 of 4 config files") as exc_info:
+            SimpleTestConfig.load_many([*yaml_files, missing], path_is_absolute=True, executor=executor)
+        errors = [error for error in exc_info.value.exceptions if isinstance(error, ConfigLoadError)]
+        assert len(errors) == len(exc_info.value.exceptions)
+        assert [error.path for error in errors] == [yaml_files[0], missing]
+        assert isinstance(errors[0].__cause__, ExceptionGroup)
+        assert isinstance(errors[1].__cause__, FileNotFoundError)
+
+    @staticmethod
+    # Reason: Ruff's bug
+    def test_stamp(yaml_files: List[Path], monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: UP006
+        """Instances loaded in worker processes should skip loading the unchanged file again."""
+        config = SimpleTestConfig.load_many(yaml_files[:1], path_is_absolute=True, executor="process")[yaml_files[0]]
+
+        def fail(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError
+
+        monkeypatch.setattr(SimpleTestConfig, "_load_yaml_content", fail)
+        config.load(yaml_files[0], path_is_absolute=True)
+        assert config.name == NAMES[0]
+
+    @staticmethod
+    def test_empty() -> None:
+        assert SimpleTestConfig.load_many([]) == {}
+
+    @staticmethod
+    def test_unknown_executor() -> None:
+        with pytest.raises(ValueError, match="Unknown load executor 'fiber'"):
+            SimpleTestConfig.load_many(["config.yml"], executor="fiber")
@@ -0,0 +1,203 @@
+"""Tests for change_detection.py."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+from typing import List
+
+import pytest
+import yaml
+
+from yamldataclassconfig.change_detection import FileStamp
+from yamldataclassconfig.config import YamlDataClassConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MTIME_NS = 1_600_000_000_000_000_000
+
+
+@dataclass
+class StampedConfig(YamlDataClassConfig):
+    """Config class which detects unchanged file by path, size and mtime."""
+
+    name: str
+
+
+@dataclass
+class HashedConfig(YamlDataClassConfig):
+    """Config class which detects unchanged file by path, size and content hash."""
+
+    CONTENT_HASH: ClassVar[bool] = True
+
+    name: str
+
+
+@dataclass
+class SnapshotStampedConfig(StampedConfig):
+    """Config class which publishes values as snapshot."""
+
+    SNAPSHOT: ClassVar[bool] = True
+
+
+@dataclass
+class FastAccessStampedConfig(StampedConfig):
+    """Config class which reads loaded values without descriptors."""
+
+    FAST_ACCESS: ClassVar[bool] = True
+
+
+@dataclass
+class IncrementalStampedConfig(StampedConfig):
+    """Config class which deserializes only changed fields on reload."""
+
+    INCREMENTAL_RELOAD: ClassVar[bool] = True
+
+
+def rewrite(path: Path, content: str, mtime_ns: int = MTIME_NS) -> None:
+    """Rewrite the file and set its mtime."""
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# Reason: Ruff's bug
+def count_reads(monkeypatch: pytest.MonkeyPatch) -> List[Any]:  # noqa: UP006
+    """Record path of every call of reading YAML content."""
+    calls: List[Any] = []  # noqa: UP006
+    original = YamlDataClassConfig._load_yaml_content  # noqa: SLF001  # pylint: disable=protected-access
+
+    def load_yaml_content(self: YamlDataClassConfig, config_path: Path, **kwargs: Any) -> Any:  # noqa: ANN401
+        calls.append(config_path)
+        return original(self, config_path, **kwargs)
+
+    monkeypatch.setattr(YamlDataClassConfig, "_load_yaml_content", load_yaml_content)
+    return calls
+
+
+class TestFileStamp:
+    """Tests for FileStamp."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_of(temporary_yaml_file: Path) -> None:
+        """Stamp should have path, size and mtime, and digest only when requested."""
+        rewrite(temporary_yaml_file, "name: test\n")
+        stamp = FileStamp.of(temporary_yaml_file)
+        assert stamp == (str(temporary_yaml_file), MTIME_NS, len("name: test\n"), None)
+        assert FileStamp.of(temporary_yaml_file, content_hash=True).digest is not None
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("other", "expected"),
+        [
+            (FileStamp("a.yml", 1, 10), True),
+            (FileStamp("b.yml", 1, 10), False),
+            (FileStamp("a.yml", 2, 10), False),
+            (FileStamp("a.yml", 1, 11), False),
+        ],
+    )
+    def test_matches_without_digest(other: FileStamp, *, expected: bool) -> None:
+        """Path, size and mtime should be compared when either digest is missing."""
+        assert FileStamp("a.yml", 1, 10).matches(other) is expected
+        assert FileStamp("a.yml", 1, 10, "x").matches(other) is expected
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("other", "expected"),
+        [
+            (FileStamp("a.yml", 2, 10, "x"), True),
+            (FileStamp("a.yml", 1, 10, "y"), False),
+            (FileStamp("a.yml", 2, 11, "x"), False),
+        ],
+    )
+    def test_matches_with_digest(other: FileStamp, *, expected: bool) -> None:
+        """Digest should take precedence over mtime when both stamps have it."""
+        assert FileStamp("a.yml", 1, 10, "x").matches(other) is expected
+
+
+class TestLoadUnchanged:
+    """Tests for skipping load of unchanged file."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_skip_unchanged(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unchanged file should be read only once."""
+        calls = count_reads(monkeypatch)
+        config = StampedConfig.create()
+        for _ in range(3):
+            config.load(temporary_yaml_file)
+        assert config.name == "test"
+        assert calls == [temporary_yaml_file]
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_reload_changed(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Changed mtime or size should cause reload."""
+        calls = count_reads(monkeypatch)
+        config = StampedConfig.create()
+        rewrite(temporary_yaml_file, "name: test\n")
+        config.load(temporary_yaml_file)
+        rewrite(temporary_yaml_file, "name: next\n", MTIME_NS + 1)
+        config.load(temporary_yaml_file)
+        assert config.name == "next"
+        rewrite(temporary_yaml_file, "name: longer\n", MTIME_NS + 1)
+        config.load(temporary_yaml_file)
+        assert config.name == "longer"
+        assert calls == [temporary_yaml_file] * 3
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_reload_changed_options(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Different options or force should cause reload."""
+        calls = count_reads(monkeypatch)
+        config = StampedConfig.create()
+        config.load(temporary_yaml_file)
+        config.load(temporary_yaml_file, yaml_backend="safe")
+        config.load(temporary_yaml_file, yaml_backend="safe", deserializer="generated")
+        config.load(temporary_yaml_file, yaml_backend="safe", deserializer="generated", force=True)
+        assert calls == [temporary_yaml_file] * 4
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    @pytest.mark.parametrize(
+        "config_class",
+        [StampedConfig, SnapshotStampedConfig, FastAccessStampedConfig, IncrementalStampedConfig],
+    )
+    def test_reload_after_assignment(temporary_yaml_file: Path, config_class: type[StampedConfig]) -> None:
+        """Unchanged file should be applied again after a field was assigned."""
+        config = config_class.create()
+        config.load(temporary_yaml_file)
+        config.name = "mutated"
+        config.load(temporary_yaml_file)
+        assert config.name == "test"
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_content_hash(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Content hash should detect rewrite within same mtime and ignore touch."""
+        calls = count_reads(monkeypatch)
+        config = HashedConfig.create()
+        rewrite(temporary_yaml_file, "name: test\n")
+        config.load(temporary_yaml_file)
+        rewrite(temporary_yaml_file, "name: test\n", MTIME_NS + 1)
+        config.load(temporary_yaml_file)
+        assert calls == [temporary_yaml_file]
+        rewrite(temporary_yaml_file, "name: next\n", MTIME_NS + 1)
+        config.load(temporary_yaml_file)
+        assert config.name == "next"
+        assert calls == [temporary_yaml_file] * 2
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: [invalid\n"])
+    def test_retry_after_failure(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Failed load should not be recorded as loaded."""
+        calls = count_reads(monkeypatch)
+        config = StampedConfig.create()
+        for _ in range(2):
+            with pytest.raises(yaml.YAMLError):
+                config.load(temporary_yaml_file)
+        assert calls == [temporary_yaml_file] * 2
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
@@ -121,6 +122,34 @@ class TestConfigPropertyDeserialization:
         with pytest.raises(ValidationError, match="Missing data for required field"):
             config.load(config_file, path_is_absolute=True)
 
+    def test_deserialization_context_per_task(self) -> None:
+        """Deserialization context of a task should not leak into other tasks on the same thread."""
+        config = ConfigWithRegularDefault.create()
+
+        async def deserialize(entered: asyncio.Event, leaving: asyncio.Event) -> None:
+            set_deserialization_context(value=True)
+            try:
+                entered.set()
+                await leaving.wait()
+            finally:
+                set_deserialization_context(value=False)
+
+        async def access(entered: asyncio.Event, leaving: asyncio.Event) -> None:
+            await entered.wait()
+            try:
+                with pytest.raises(ConfigNotLoadedError):
+                    _ = config.count
+            finally:
+                leaving.set()
+
+        async def main() -> None:
+            # Events are created in the running loop since they bind to the loop on creation before Python 3.10
+            entered = asyncio.Event()
+            leaving = asyncio.Event()
+            await asyncio.gather(deserialize(entered, leaving), access(entered, leaving))
+
+        asyncio.run(main())
+
     def test_manual_deserialization_context(self) -> None:
         """Test manual deserialization context management."""
         config = ConfigWithRegularDefault.create()
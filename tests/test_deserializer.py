@@ -0,0 +1,223 @@
+"""Tests for deserializer.py."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from decimal import Decimal  # noqa: TC003  # Reason: Type hints are resolved at runtime.
+from enum import Enum
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import pytest
+from marshmallow import ValidationError
+
+from tests.conftest import DataClassConfigA
+from tests.conftest import DataClassConfigB
+from tests.conftest import PartConfigA
+from tests.conftest import PartConfigB
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.config_property import set_deserialization_context
+from yamldataclassconfig.deserializer import deserialize
+from yamldataclassconfig.deserializer import get_from_dict
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+UserId = NewType("UserId", int)
+
+
+class Color(Enum):
+    """For test."""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class CollectionConfig(YamlDataClassConfig):  # pylint: disable=too-many-instance-attributes
+    """Config class which has collections of nested dataclasses."""
+
+    # Reason: Ruff's bug
+    parts: List[PartConfigA] = field(default_factory=list)  # noqa: UP006
+    part_map: Dict[str, PartConfigB] = field(default_factory=dict)  # noqa: UP006
+    optional_part: Optional[PartConfigA] = None  # noqa: UP045
+    tags: Tuple[str, ...] = ()  # noqa: UP006
+    color: Optional[Color] = None  # noqa: UP045
+    amount: Optional[Decimal] = None  # noqa: UP045
+    user_id: Optional[UserId] = None  # noqa: UP045
+    extra: Any = None
+
+
+@dataclass
+class ScalarConfig(YamlDataClassConfig):
+    """Config class whose values marshmallow converts or refuses."""
+
+    port: int = 0
+    ratio: float = 0.0
+    flag: bool = False
+    name: str = ""
+    # Reason: Ruff's bug
+    ports: List[int] = field(default_factory=list)  # noqa: UP006
+    part: Optional[PartConfigA] = None  # noqa: UP045
+
+
+@dataclass
+class UnsupportedConfig(YamlDataClassConfig):
+    """Config class which the generator doesn't cover."""
+
+    # Reason: Ruff's bug
+    value: Union[int, str] = 0  # noqa: UP007
+
+
+@dataclass
+class GeneratedConfig(YamlDataClassConfig):
+    """Config class which selects generated deserializer by class variable."""
+
+    DESERIALIZER: ClassVar[str] = "generated"
+
+    part_config_b: PartConfigB = field(metadata={"dataclasses_json": {"mm_field": PartConfigB}})
+    name: str = ""
+
+
+@dataclass
+class PartConfigAHolder(YamlDataClassConfig):
+    """Config class which holds PartConfigA."""
+
+    part: PartConfigA = field(metadata={"dataclasses_json": {"mm_field": PartConfigA}})
+
+
+PART_A = {"property_a": 1, "property_b": "2"}
+PART_B = {"property_c": "2019-06-25 13:33:30"}
+
+
+def load_by(name: str, cls: type, data: Dict[str, Any]) -> Any:  # noqa: ANN401,UP006
+    """Deserialize and return comparable result or error."""
+    set_deserialization_context(value=True)
+    try:
+        instance = deserialize(cls, data, name)
+    except ValidationError as error:
+        return ("ValidationError", error.messages)
+    except KeyError as error:
+        return ("KeyError", error.args)
+    # Reason: dataclasses-json raises them for some invalid values after marshmallow.
+    except (AttributeError, ValueError) as error:
+        return (type(error).__name__, str(error))
+    finally:
+        set_deserialization_context(value=False)
+    return instance.__dict__
+
+
+class TestGeneratedDeserializer:
+    """Tests for generated deserializer against marshmallow schema."""
+
+    @staticmethod
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.parametrize(
+        ("config_class", "data"),
+        [
+            (DataClassConfigA, {"part_config_a": PART_A, "part_config_b": PART_B}),
+            (DataClassConfigA, {"part_config_a": {**PART_A, "unknown": 3}, "part_config_b": PART_B}),
+            (DataClassConfigA, {"part_config_b": PART_B}),
+            (DataClassConfigA, {"part_config_a": None, "part_config_b": None}),
+            (DataClassConfigB, {"part_config_a": PART_A, "property_c": 3, "property_d": "4"}),
+            (DataClassConfigB, {"property_c": None, "property_d": None}),
+            (DataClassConfigB, {"FILE_PATH": 1, "_loaded": "x", "unknown": 1}),
+            (DataClassConfigB, {}),
+            (
+                CollectionConfig,
+                {
+                    "parts": [PART_A, {"property_a": 3, "property_b": "4"}],
+                    "part_map": {"x": PART_B},
+                    "optional_part": PART_A,
+                    "tags": ["a", "b"],
+                    "color": "red",
+                    "amount": "1.5",
+                    "user_id": 7,
+                    "extra": {"anything": [1, 2]},
+                },
+            ),
+            (CollectionConfig, {"optional_part": None, "color": None, "parts": []}),
+        ],
+    )
+    def test_same_as_marshmallow(config_class: type, data: Dict[str, Any]) -> None:  # noqa: UP006
+        """Generated deserializer should return the same result or error as marshmallow schema."""
+        assert load_by("generated", config_class, data) == load_by("marshmallow", config_class, data)
+
+    @staticmethod
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"port": "8080", "ratio": 1, "flag": "yes", "ports": ["1", 2]},
+            {"port": 1.5, "ratio": "1.5"},
+            {"port": True},
+            {"name": 5},
+            {"ports": ["a", "b"]},
+            {"ports": "ab"},
+            {"part": {"property_a": "1", "property_b": "2"}},
+            {"part": {"property_a": 1, "property_b": 2}},
+            {"part": {**PART_A, "unknown": 3}},
+            {"part": {"property_b": "2"}},
+            {"part": {"property_a": None, "property_b": "2"}},
+            {"part": "x"},
+            ["port"],
+        ],
+    )
+    def test_conversion_same_as_marshmallow(data: Any) -> None:  # noqa: ANN401
+        """Values which marshmallow converts or refuses should be deserialized to the same type or error."""
+        assert repr(load_by("generated", ScalarConfig, data)) == repr(load_by("marshmallow", ScalarConfig, data))
+
+    @staticmethod
+    def test_generated_once() -> None:
+        """Function should be generated once per class."""
+        from_dict = get_from_dict(CollectionConfig)
+        assert from_dict is not None
+        assert get_from_dict(CollectionConfig) is from_dict
+
+    @staticmethod
+    def test_fallback_to_marshmallow() -> None:
+        """Class which the generator doesn't cover should be deserialized by marshmallow schema."""
+        assert get_from_dict(UnsupportedConfig) is None
+        assert load_by("generated", UnsupportedConfig, {"value": "x"}) == {"value": "x"}
+
+    @staticmethod
+    def test_unknown_deserializer() -> None:
+        """ValueError should be raised for unknown deserializer."""
+        with pytest.raises(ValueError, match="Unknown deserializer 'unknown'"):
+            deserialize(DataClassConfigB, {}, "unknown")
+
+    @staticmethod
+    def test_warn_none_for_non_optional() -> None:
+        """RuntimeWarning should be issued for None of non-optional nested field like dataclasses-json."""
+        with pytest.warns(RuntimeWarning, match="'NoneType' object value of non-optional type property_a"):
+            load_by("generated", PartConfigAHolder, {"part": {"property_a": None, "property_b": "2"}})
+
+
+class TestLoadWithGeneratedDeserializer:
+    """Tests for selecting deserializer on load."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\npart_config_b:\n  property_c: '2019-06-25 13:33:30'\n"])
+    def test_select_per_class(temporary_yaml_file: Path) -> None:
+        """Deserializer specified by class variable should be used."""
+        config = GeneratedConfig.create()
+        config.load(temporary_yaml_file)
+        assert config.name == "test"
+        assert config.part_config_b.property_c == datetime(2019, 6, 25, 13, 33, 30)  # noqa: DTZ001
+
+    @staticmethod
+    def test_select_per_call(resource_path_root: Path) -> None:
+        """Deserializer specified by argument should be used."""
+        config = DataClassConfigA.create()
+        config.load(resource_path_root / "config_a.yml", deserializer="generated")
+        assert config.part_config_a == PartConfigA(property_a=1, property_b="2")
+        assert config.part_config_b.property_c == datetime(2019, 6, 25, 13, 33, 30)  # noqa: DTZ001
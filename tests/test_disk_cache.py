@@ -0,0 +1,185 @@
+"""Tests for disk_cache.py."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import make_dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
+
+import pytest
+from dataclasses_json import config
+from marshmallow import fields
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.disk_cache import SUFFIX
+from yamldataclassconfig.disk_cache import clear_disk_cache
+from yamldataclassconfig.disk_cache import schema_fingerprint
+from yamldataclassconfig.yaml_backend import YamlBackend
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class CachedConfig(YamlDataClassConfig):
+    """Config class whose CACHE_DIR is set by each test."""
+
+    name: str
+    # Reason: Ruff's bug
+    tags: List[str] = field(default_factory=list)  # noqa: UP006
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable on-disk cache of CachedConfig in temporary directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(CachedConfig, "CACHE_DIR", str(directory))
+    return directory
+
+
+# Reason: Ruff's bug
+def count_parses(monkeypatch: pytest.MonkeyPatch) -> List[Any]:  # noqa: UP006
+    """Record every stream which YAML backends parse."""
+    calls: List[Any] = []  # noqa: UP006
+    original = YamlBackend.load
+
+    def load(self: YamlBackend, stream: Any) -> Any:  # noqa: ANN401
+        calls.append(stream)
+        return original(self, stream)
+
+    monkeypatch.setattr(YamlBackend, "load", load)
+    return calls
+
+
+def load(path: Path) -> CachedConfig:
+    config = CachedConfig.create()
+    config.load(path, path_is_absolute=True)
+    return config
+
+
+class TestDiskCache:
+    """Tests for loading through on-disk cache."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\ntags: [a, b]\n"])
+    # Reason: Ruff's bug
+    def test_hit(temporary_yaml_file: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Loading the same content again should skip parsing."""
+        calls = count_parses(monkeypatch)
+        first = load(temporary_yaml_file)
+        second = load(temporary_yaml_file)
+        assert len(calls) == 1
+        assert len(list(cache_dir.glob(f"*{SUFFIX}"))) == 1
+        assert (second.name, second.tags) == (first.name, first.tags) == ("test", ["a", "b"])
+        assert second.tags is not first.tags
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_changed_content(temporary_yaml_file: Path, cache_dir: Path) -> None:
+        """Changed content should be loaded into new entry."""
+        load(temporary_yaml_file)
+        temporary_yaml_file.write_text("name: changed\n")
+        assert load(temporary_yaml_file).name == "changed"
+        assert len(list(cache_dir.glob(f"*{SUFFIX}"))) == 2  # noqa: PLR2004
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    # Reason: Ruff's bug
+    def test_corrupt(
+        temporary_yaml_file: Path,
+        cache_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Corrupt entry should be detected and rebuilt."""
+        load(temporary_yaml_file)
+        (entry,) = cache_dir.glob(f"*{SUFFIX}")
+        entry.write_bytes(entry.read_bytes()[:-1])
+        calls = count_parses(monkeypatch)
+        with caplog.at_level(logging.WARNING):
+            assert load(temporary_yaml_file).name == "test"
+        assert "Ignored corrupt config cache entry" in caplog.text
+        assert load(temporary_yaml_file).name == "test"
+        assert len(calls) == 1
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    # Reason: Ruff's bug
+    def test_unwritable(
+        temporary_yaml_file: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Directory which can't be written should be logged without failing load."""
+        regular_file = tmp_path / "file"
+        regular_file.write_text("", encoding="UTF-8")
+        monkeypatch.setattr(CachedConfig, "CACHE_DIR", str(regular_file / "cache"))
+        with caplog.at_level(logging.WARNING):
+            assert load(temporary_yaml_file).name == "test"
+            assert load(temporary_yaml_file).name == "test"
+        assert "Skipped caching config" in caplog.text
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_aload(temporary_yaml_file: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Asynchronous load should share entries with load()."""
+        load(temporary_yaml_file)
+        calls = count_parses(monkeypatch)
+        config = CachedConfig.create()
+        asyncio.run(config.aload(temporary_yaml_file, path_is_absolute=True))
+        assert config.name == "test"
+        assert calls == []
+        temporary_yaml_file.write_text("name: changed\n")
+        asyncio.run(config.aload(temporary_yaml_file, path_is_absolute=True))
+        assert config.name == "changed"
+        assert len(calls) == 1
+        assert len(list(cache_dir.glob(f"*{SUFFIX}"))) == 2  # noqa: PLR2004
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_clear(temporary_yaml_file: Path, cache_dir: Path) -> None:
+        load(temporary_yaml_file)
+        assert clear_disk_cache(cache_dir) == 1
+        assert not list(cache_dir.glob(f"*{SUFFIX}"))
+
+
+class TestSchemaFingerprint:
+    """Tests for schema_fingerprint()."""
+
+    @staticmethod
+    def test_changed_schema() -> None:
+        """Changing type or default of a field of nested dataclass should change fingerprint."""
+
+        def create(value_type: type, default: Any) -> type:  # noqa: ANN401
+            part = make_dataclass("Part", [("value", value_type, field(default=default))])
+            return make_dataclass("Config", [("part", part)])
+
+        fingerprints = {schema_fingerprint(cls) for cls in (create(int, 0), create(int, 1), create(str, 0))}
+        assert len(fingerprints) == 3  # noqa: PLR2004
+        assert schema_fingerprint(create(int, 0)) in fingerprints
+
+    @staticmethod
+    def test_metadata() -> None:
+        """Changing decoder or mm_field of a field should change fingerprint, while the same metadata should not."""
+
+        def create(**metadata: Any) -> type:  # noqa: ANN401
+            return make_dataclass("Config", [("value", str, field(default="", metadata=config(**metadata)))])
+
+        fingerprints = {
+            schema_fingerprint(cls)
+            for cls in (
+                create(),
+                create(decoder=str.upper),
+                create(decoder=str.lower),
+                create(mm_field=fields.Email()),
+            )
+        }
+        assert len(fingerprints) == 4  # noqa: PLR2004
+        assert schema_fingerprint(create(decoder=str.upper)) in fingerprints
+        assert schema_fingerprint(create(mm_field=fields.Email())) in fingerprints
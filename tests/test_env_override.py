@@ -0,0 +1,186 @@
+"""Tests for env_override.py."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+import yaml
+from dataclasses_json import DataClassJsonMixin
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.env_override import apply_env_overrides
+from yamldataclassconfig.env_override import env_override_map
+from yamldataclassconfig.exceptions import ConfigValidationError
+from yamldataclassconfig.yaml_backend import register_yaml_backend
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CONTENT = "name: base\nport: 80\npart_config:\n  property_a: a\n  property_c: 1\n"
+
+
+class UpperLoader(yaml.SafeLoader):  # pylint: disable=too-many-ancestors
+    """Loader which upper-cases scalars tagged by !upper."""
+
+
+def construct_upper(loader: UpperLoader, node: yaml.ScalarNode) -> str:
+    return str(loader.construct_scalar(node)).upper()
+
+
+UpperLoader.add_constructor("!upper", construct_upper)
+register_yaml_backend("upper", UpperLoader)
+
+
+@dataclass
+class PartConfig(DataClassJsonMixin):
+    """Nested section."""
+
+    property_a: str = ""
+    property_c: int = 0
+
+
+@dataclass
+class EnvConfig(YamlDataClassConfig):
+    """Config class whose values can be overridden by environment variables."""
+
+    ENV_PREFIX: ClassVar[Optional[str]] = "APP"  # noqa: UP045  # Reason: Ruff's bug
+
+    name: str = ""
+    port: int = 0
+    debug: bool = False
+    ratio: float = 0.0
+    # Reason: Ruff's bug
+    timeout: Optional[int] = None  # noqa: UP045
+    hosts: List[str] = field(default_factory=list)  # noqa: UP006
+    labels: Dict[str, str] = field(default_factory=dict)  # noqa: UP006
+    part_config: PartConfig = field(default_factory=PartConfig)
+
+
+def load(path: Path) -> EnvConfig:
+    config = EnvConfig.create()
+    config.load(path, path_is_absolute=True)
+    return config
+
+
+class TestEnvOverrideMap:
+    """Tests for env_override_map()."""
+
+    @staticmethod
+    def test_names() -> None:
+        """Variable names should join prefix and field path in upper case, sections before their fields."""
+        mapping = env_override_map(EnvConfig, "APP")
+        assert list(mapping)[-2:] == ["APP__PART_CONFIG__PROPERTY_A", "APP__PART_CONFIG__PROPERTY_C"]
+        assert mapping["APP__PART_CONFIG__PROPERTY_C"].path == ("part_config", "property_c")
+        assert "APP__PART_CONFIG" in mapping
+        assert "APP__FILE_PATH" not in mapping
+
+    @staticmethod
+    def test_built_once() -> None:
+        """Map should be reused for the same prefix and rebuilt for another prefix."""
+        assert env_override_map(EnvConfig, "APP") is env_override_map(EnvConfig, "APP")
+        assert "OTHER__PORT" in env_override_map(EnvConfig, "OTHER")
+        assert "PORT" in env_override_map(EnvConfig, "")
+
+    @staticmethod
+    def test_does_not_change_given_dictionary(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only copies of dictionaries on the path should be changed."""
+        monkeypatch.setenv("APP__PART_CONFIG__PROPERTY_C", "2")
+        original = {"part_config": {"property_c": 1}, "hosts": ["a"]}
+        result = apply_env_overrides(EnvConfig, "APP", original, "pyyaml")
+        assert result == {"part_config": {"property_c": 2}, "hosts": ["a"]}
+        assert original == {"part_config": {"property_c": 1}, "hosts": ["a"]}
+        assert result["hosts"] is original["hosts"]
+
+
+class TestEnvOverride:
+    """Tests for ENV_PREFIX."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_coercion(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Values should be coerced to the types of fields."""
+        environment = {
+            "APP__NAME": "from env",
+            "APP__PORT": "8080",
+            "APP__DEBUG": "Yes",
+            "APP__RATIO": "0.5",
+            "APP__TIMEOUT": "null",
+            "APP__HOSTS": "[a, b]",
+            "APP__LABELS": "{team: core}",
+            "APP__PART_CONFIG__PROPERTY_C": "3",
+        }
+        for name, value in environment.items():
+            monkeypatch.setenv(name, value)
+        config = load(temporary_yaml_file)
+        assert (config.name, config.port, config.debug, config.ratio) == ("from env", 8080, True, 0.5)
+        assert config.timeout is None
+        assert config.hosts == ["a", "b"]
+        assert config.labels == {"team": "core"}
+        assert config.part_config == PartConfig("a", 3)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_field_overrides_section(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Variable of field should be applied after variable of its section."""
+        monkeypatch.setenv("APP__PART_CONFIG__PROPERTY_C", "5")
+        monkeypatch.setenv("APP__PART_CONFIG", "{property_a: env, property_c: 4}")
+        assert load(temporary_yaml_file).part_config == PartConfig("env", 5)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_invalid_value(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Value which can't be coerced should be reported with the variable name."""
+        monkeypatch.setenv("APP__DEBUG", "maybe")
+        with pytest.raises(ConfigValidationError, match="Environment variable APP__DEBUG expected bool, got 'maybe'"):
+            load(temporary_yaml_file)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_reload_on_environment_change(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Load of unchanged file should not be skipped when overrides changed."""
+        config = load(temporary_yaml_file)
+        monkeypatch.setenv("APP__PORT", "8080")
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        assert config.port == 8080  # noqa: PLR2004
+        monkeypatch.delenv("APP__PORT")
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        assert config.port == 80  # noqa: PLR2004
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_disabled_by_default(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Environment variables should be ignored when ENV_PREFIX is None."""
+        monkeypatch.setenv("PORT", "8080")
+        monkeypatch.setattr(EnvConfig, "ENV_PREFIX", None)
+        assert load(temporary_yaml_file).port == 80  # noqa: PLR2004
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_yaml_backend_of_load(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Values should be parsed by the YAML backend given to load(), aload() and load_all()."""
+        monkeypatch.setenv("APP__LABELS", "{team: !upper core}")
+        config = EnvConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True, yaml_backend="upper")
+        assert config.labels == {"team": "CORE"}
+        config = EnvConfig.create()
+        asyncio.run(config.aload(temporary_yaml_file, path_is_absolute=True, yaml_backend="upper"))
+        assert config.labels == {"team": "CORE"}
+        (config,) = EnvConfig.load_all(temporary_yaml_file, path_is_absolute=True, yaml_backend="upper")
+        assert config.labels == {"team": "CORE"}
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_disk_cache_key(temporary_yaml_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entry of on-disk cache should not be reused for other overrides."""
+        monkeypatch.setattr(EnvConfig, "CACHE_DIR", str(tmp_path / "cache"))
+        assert load(temporary_yaml_file).port == 80  # noqa: PLR2004
+        monkeypatch.setenv("APP__PORT", "8080")
+        assert load(temporary_yaml_file).port == 8080  # noqa: PLR2004
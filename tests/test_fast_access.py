@@ -0,0 +1,113 @@
+"""Tests for fast_access.py."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import sys
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+import pytest
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.exceptions import ConfigNotLoadedError
+from yamldataclassconfig.fast_access import config_class_of
+from yamldataclassconfig.fast_access import fast_access_class
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+
+@dataclass
+class FastAccessConfig(YamlDataClassConfig):
+    """Config class which reads fields as plain attributes once loaded."""
+
+    FAST_ACCESS: ClassVar[bool] = True
+
+    name: str
+    age: int = 0
+
+
+class TestFastAccess:
+    """Tests for fast access mode."""
+
+    @staticmethod
+    def test_not_loaded() -> None:
+        """ConfigNotLoadedError should be raised before load."""
+        config = FastAccessConfig.create()
+        with pytest.raises(ConfigNotLoadedError):
+            _ = config.name
+        assert type(config) is FastAccessConfig
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_load(temporary_yaml_file: Path) -> None:
+        """Loaded instance should read fields from instance dictionary without descriptors."""
+        config = FastAccessConfig.create()
+        config.load(temporary_yaml_file)
+        assert (config.name, config.age) == ("test", 30)
+        assert isinstance(config, FastAccessConfig)
+        assert type(config) is fast_access_class(FastAccessConfig)
+        assert type(config).__getattribute__ is object.__getattribute__
+        assert config_class_of(config) is FastAccessConfig
+        assert vars(config)["name"] == "test"
+        assert "__name" not in vars(config)
+        assert repr(config).startswith("FastAccessConfig(")
+        assert asdict(config)["name"] == "test"
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_reload(temporary_yaml_file: Path) -> None:
+        """Reload should update values and keep the instance switched."""
+        config = FastAccessConfig.create()
+        config.load(temporary_yaml_file)
+        temporary_yaml_file.write_text("name: next\nage: 31\n")
+        config.load(temporary_yaml_file, force=True)
+        assert (config.name, config.age) == ("next", 31)
+        assert type(config) is fast_access_class(FastAccessConfig)
+        temporary_yaml_file.write_text("name: next\nage: invalid\n")
+        with pytest.raises(ExceptionGroup):
+            config.load(temporary_yaml_file, force=True)
+        assert (config.name, config.age) == ("next", 31)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_type(temporary_yaml_file: Path) -> None:
+        """type() of loaded instance should be the subclass while isinstance() and config_class_of() find the class."""
+        config = FastAccessConfig.create()
+        config.load(temporary_yaml_file)
+        assert type(config) is not FastAccessConfig
+        assert isinstance(config, FastAccessConfig)
+        assert config_class_of(config) is FastAccessConfig
+        assert type(config).__name__ == FastAccessConfig.__name__
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_pickle(temporary_yaml_file: Path) -> None:
+        """Loaded instance should be pickled as the config class and restored as loaded instance."""
+        config = FastAccessConfig.create()
+        config.load(temporary_yaml_file)
+        payload = pickle.dumps(config)
+        assert b"FastAccessConfig" in payload
+        restored: FastAccessConfig
+        for restored in (pickle.loads(payload), copy.deepcopy(config)):  # noqa: S301
+            assert type(restored) is fast_access_class(FastAccessConfig)
+            assert (restored.name, restored.age) == ("test", 30)
+            assert restored == config
+
+    @staticmethod
+    def test_conflict_with_snapshot() -> None:
+        """ValueError should be raised when both FAST_ACCESS and SNAPSHOT are enabled."""
+        with pytest.raises(ValueError, match="FAST_ACCESS and SNAPSHOT"):
+
+            class Conflict(YamlDataClassConfig):  # pylint: disable=unused-variable
+                FAST_ACCESS: ClassVar[bool] = True
+                SNAPSHOT: ClassVar[bool] = True
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import MISSING
 from dataclasses import dataclass
+from dataclasses import fields
 from typing import Any
 from typing import Dict
 
 import pytest
 
 from tests.conftest import NonDataclassForTesting
+from yamldataclassconfig.config import YamlDataClassConfig
 from yamldataclassconfig.field_processor import DataClass
 from yamldataclassconfig.field_processor import TypeHint
 from yamldataclassconfig.field_processor import apply_automatic_defaults
@@ -79,3 +82,42 @@ class TestFieldProcessorModule:
         # This should raise ValueError for non-dataclass
         with pytest.raises(ValueError, match="Provided class is not a dataclass"):
             DataClass(NonDataclassForTesting)
+
+    def test_subclass_keeps_parent_fields(self) -> None:
+        """Subclassing config class should not replace fields of the parent class."""
+
+        @dataclass
+        class Parent(YamlDataClassConfig):
+            name: str
+
+        @dataclass
+        class Child(Parent):
+            age: int
+
+        assert [field.name for field in fields(Parent)] == [
+            "FILE_PATH",
+            "_loaded",
+            "_needs_property_descriptors",
+            "name",
+        ]
+        assert Parent.create().__dict__["name"] == ""
+        assert Child.create().__dict__["age"] == 0
+
+    def test_subclass_doesnt_get_automatic_defaults(self) -> None:
+        """Defining config subclass should leave fields without defaults, create() fills them instead."""
+
+        @dataclass
+        class Parent(YamlDataClassConfig):
+            name: str
+
+        @dataclass
+        class Child(Parent):
+            age: int
+
+        # Pylint's bug: doesn't recognize __dataclass_fields__ on dataclasses
+        for cls in (Parent, Child):
+            assert cls.__dataclass_fields__["name"].default is MISSING  # pylint: disable=no-member
+        assert Child.__dataclass_fields__["age"].default is MISSING  # pylint: disable=no-member
+        with pytest.raises(TypeError):
+            Child()  # type: ignore[call-arg]  # pylint: disable=no-value-for-parameter
+        assert Child.create(name="a").__dict__["age"] == 0
@@ -0,0 +1,81 @@
+"""Tests for lazy imports of yamldataclassconfig package."""
+
+from __future__ import annotations
+
+import subprocess  # nosec B404
+import sys
+from importlib import import_module
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import yamldataclassconfig
+
+HEAVY_MODULES = ["dataclasses_json", "marshmallow", "yaml"]
+# Importing the package should take far less than importing dataclasses-json measured in the same interpreter,
+# while importing dataclasses-json and marshmallow eagerly takes more.
+# The ratio is used instead of fixed time so that the test doesn't depend on the speed of the machine.
+IMPORT_TIME_RATIO = 0.5
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """Run Python code in a fresh interpreter so that modules imported by other tests don't affect."""
+    # Reason: Arguments are fixed in tests.
+    return subprocess.run(  # noqa: S603  # nosec B603
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        # Since tests/__init__.py changes current directory
+        cwd=Path(yamldataclassconfig.__file__).parents[1],
+        text=True,
+    )
+
+
+# Reason: Ruff's bug
+def imported_modules(code: str) -> List[str]:  # noqa: UP006
+    """Heavy modules imported after running the code."""
+    result = run_python(f"import sys\n{code}\nprint(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    return result.stdout.split()
+
+
+class TestLazyImport:
+    """Tests for deferring import of heavy dependencies."""
+
+    @staticmethod
+    def test_import_package() -> None:
+        """Importing package should not import heavy dependencies."""
+        assert imported_modules("import yamldataclassconfig") == []
+
+    @staticmethod
+    def test_import_config() -> None:
+        """Importing config class should not import PyYAML until load."""
+        assert "yaml" not in imported_modules("from yamldataclassconfig import YamlDataClassConfig")
+
+    @staticmethod
+    def test_import_time_budget() -> None:
+        """Cumulative import time of package should be within budget relative to dataclasses-json."""
+        # The package is imported first so that modules shared with dataclasses-json are charged to the package
+        result = run_python("import yamldataclassconfig\nimport dataclasses_json", "-X", "importtime")
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            columns = line.split("|")
+            if columns[-1].strip() in ("yamldataclassconfig", "dataclasses_json"):
+                cumulative[columns[-1].strip()] = int(columns[1])
+        assert cumulative["yamldataclassconfig"] < cumulative["dataclasses_json"] * IMPORT_TIME_RATIO
+
+    @staticmethod
+    def test_exports() -> None:
+        """Every name in __all__ of submodules should be exported by package."""
+        for module_name in yamldataclassconfig._SUBMODULES:  # noqa: SLF001
+            module = import_module(f"yamldataclassconfig.{module_name}")
+            for name in module.__all__:
+                assert getattr(yamldataclassconfig, name) is getattr(module, name)
+                assert name in yamldataclassconfig.__all__
+                assert name in dir(yamldataclassconfig)
+
+    @staticmethod
+    def test_unknown_attribute() -> None:
+        """AttributeError should be raised for unknown attribute."""
+        with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+            _ = yamldataclassconfig.unknown
@@ -0,0 +1,245 @@
+"""Tests for incremental.py."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+from dataclasses_json import DataClassJsonMixin
+from marshmallow import ValidationError
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.incremental import changed_fields
+from yamldataclassconfig.incremental import equal_tree
+from yamldataclassconfig.instrumentation import LoadPhaseEvent
+from yamldataclassconfig.instrumentation import add_load_listener
+from yamldataclassconfig.instrumentation import remove_load_listener
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+CONTENT = "name: base\nport: 80\ndatabase:\n  host: localhost\n  port: 5432\nservers:\n  - host: a\n    port: 1\n"
+
+
+@dataclass
+class DatabaseConfig(DataClassJsonMixin):
+    """Nested section."""
+
+    host: str
+    port: int
+
+
+@dataclass
+class IncrementalConfig(YamlDataClassConfig):
+    """Config class which deserializes only changed fields on reload."""
+
+    INCREMENTAL_RELOAD: ClassVar[bool] = True
+    ENV_PREFIX: ClassVar[Optional[str]] = "INCREMENTAL"  # noqa: UP045  # Reason: Ruff's bug
+
+    name: str
+    port: int
+    database: DatabaseConfig
+    # Reason: Ruff's bug
+    servers: List[DatabaseConfig] = field(default_factory=list)  # noqa: UP006
+    extra: Optional[List[int]] = None  # noqa: UP006,UP045
+    options: Dict[str, Any] = field(default_factory=dict)  # noqa: UP006
+
+
+@dataclass
+class SnapshotIncrementalConfig(IncrementalConfig):
+    """Config class which publishes incrementally loaded values as snapshot."""
+
+    SNAPSHOT: ClassVar[bool] = True
+
+
+@dataclass
+class FastAccessIncrementalConfig(IncrementalConfig):
+    """Config class which reads incrementally loaded values without descriptors."""
+
+    FAST_ACCESS: ClassVar[bool] = True
+
+
+@dataclass
+class LazyIncrementalConfig(IncrementalConfig):
+    """Config class which leaves changed sections lazy."""
+
+    LAZY_SECTIONS: ClassVar[bool] = True
+
+
+def reload(config: IncrementalConfig, path: Path, content: str, **kwargs: Any) -> None:  # noqa: ANN401
+    path.write_text(content, encoding="UTF-8")
+    config.load(path, path_is_absolute=True, force=True, **kwargs)
+
+
+class TestEqualTree:
+    """Tests for equal_tree()."""
+
+    @staticmethod
+    def test_type() -> None:
+        """Values which are equal in Python but differ in type should differ."""
+        assert not equal_tree(1, True)  # noqa: FBT003
+        assert not equal_tree({"a": [1]}, {"a": [1.0]})
+        assert equal_tree({"a": [1, {"b": None}]}, {"a": [1, {"b": None}]})
+        assert not equal_tree({"a": 1}, {"a": 1, "b": 2})
+        assert not equal_tree([1], [1, 2])
+
+
+class TestChangedFields:
+    """Tests for changed_fields()."""
+
+    @staticmethod
+    def test_changed() -> None:
+        """Only keys whose values differ or which are added should be changed."""
+        previous = {"name": "base", "port": 80}
+        current = {"name": "base", "port": 81, "extra": 1}
+        assert changed_fields(IncrementalConfig, previous, current) == frozenset({"port", "extra"})
+
+    @staticmethod
+    def test_full() -> None:
+        """Removed key, unknown key and content which is not mapping should require loading fully."""
+        previous = {"name": "base", "port": 80}
+        assert changed_fields(IncrementalConfig, previous, {"name": "base"}) is None
+        assert changed_fields(IncrementalConfig, previous, {"name": "base", "port": 80, "unknown": 1}) is None
+        assert changed_fields(IncrementalConfig, previous, None) is None
+
+
+class TestIncrementalReload:
+    """Tests for INCREMENTAL_RELOAD."""
+
+    @staticmethod
+    @pytest.mark.parametrize("deserializer", ["marshmallow", "generated"])
+    @pytest.mark.parametrize(
+        "config_class",
+        [IncrementalConfig, SnapshotIncrementalConfig, FastAccessIncrementalConfig, LazyIncrementalConfig],
+    )
+    def test_reuse(tmp_path: Path, config_class: type[IncrementalConfig], deserializer: str) -> None:
+        """Changed fields should be updated and unchanged ones should be reused by identity."""
+        path = tmp_path / "config.yml"
+        config = config_class.create()
+        reload(config, path, CONTENT, deserializer=deserializer)
+        database = config.database
+        servers = config.servers
+        content = CONTENT.replace("port: 80", "port: 81").replace("host: a", "host: b")
+        reload(config, path, content, deserializer=deserializer)
+        assert config.port == 81  # noqa: PLR2004
+        assert config.name == "base"
+        assert config.database is database
+        assert config.servers is not servers
+        assert config.servers[0].host == "b"
+        assert config.snapshot().database is database
+
+    @staticmethod
+    def test_phases(tmp_path: Path) -> None:
+        """Only changed fields should be validated and deserialized after diff phase."""
+        path = tmp_path / "config.yml"
+        config = IncrementalConfig.create()
+        reload(config, path, CONTENT)
+        events: List[LoadPhaseEvent] = []  # noqa: UP006  # Reason: Ruff's bug
+        add_load_listener(events.append)
+        try:
+            reload(config, path, CONTENT + "extra: [1, 2]\n")
+        finally:
+            remove_load_listener(events.append)
+        assert [event.phase for event in events if event.is_end] == [
+            "resolve",
+            "stamp",
+            "parse",
+            "diff",
+            "validate",
+            "deserialize",
+            "apply",
+        ]
+        assert config.extra == [1, 2]
+
+    @staticmethod
+    def test_type_change(tmp_path: Path) -> None:
+        """Value whose type changed should be deserialized again even if it is equal in Python."""
+        path = tmp_path / "config.yml"
+        config = IncrementalConfig.create()
+        reload(config, path, CONTENT + "options:\n  verbose: 1\n")
+        reload(config, path, CONTENT + "options:\n  verbose: true\n")
+        assert config.options["verbose"] is True
+
+    @staticmethod
+    def test_removed_key(tmp_path: Path) -> None:
+        """Removed key should be reported or fall back to default by loading fully."""
+        path = tmp_path / "config.yml"
+        config = IncrementalConfig.create()
+        reload(config, path, CONTENT + "extra: [1]\n")
+        reload(config, path, CONTENT)
+        assert config.extra is None
+        with pytest.raises(ValidationError, match="name"):
+            reload(config, path, CONTENT.replace("name: base\n", ""))
+
+    @staticmethod
+    def test_errors(tmp_path: Path) -> None:
+        """Errors of changed fields should be raised together and keep the last loaded values."""
+        path = tmp_path / "config.yml"
+        config = IncrementalConfig.create()
+        reload(config, path, CONTENT)
+        with pytest.raises(ExceptionGroup):
+            reload(config, path, CONTENT.replace("port: 80", "port: eighty"))
+        with pytest.raises(ValidationError) as error:
+            reload(config, path, CONTENT.replace("  port: 5432\n", "").replace("    port: 1\n", ""))
+        assert set(error.value.messages_dict) == {"database", "servers"}
+        assert config.port == 80  # noqa: PLR2004
+        assert config.database.port == 5432  # noqa: PLR2004
+        reload(config, path, CONTENT.replace("port: 80", "port: 81"))
+        assert config.port == 81  # noqa: PLR2004
+
+    @staticmethod
+    def test_env_override(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Change of environment overrides should load fully and overrides of unchanged fields should be kept."""
+        path = tmp_path / "config.yml"
+        config = IncrementalConfig.create()
+        reload(config, path, CONTENT)
+        monkeypatch.setenv("INCREMENTAL__DATABASE__PORT", "6543")
+        reload(config, path, CONTENT)
+        database = config.database
+        assert database.port == 6543  # noqa: PLR2004
+        reload(config, path, CONTENT.replace("port: 80", "port: 81"))
+        assert config.database is database
+        monkeypatch.delenv("INCREMENTAL__DATABASE__PORT")
+        reload(config, path, CONTENT.replace("port: 80", "port: 81"))
+        assert config.database.port == 5432  # noqa: PLR2004
+
+    @staticmethod
+    def test_overlays(tmp_path: Path) -> None:
+        """Merged layers should be compared with the last merged content."""
+        path = tmp_path / "config.yml"
+        path.write_text(CONTENT, encoding="UTF-8")
+        overlay = tmp_path / "overlay.yml"
+        overlay.write_text("port: 443\n", encoding="UTF-8")
+        config = IncrementalConfig.create()
+        config.load(path, path_is_absolute=True, overlays=[overlay])
+        database = config.database
+        overlay.write_text("port: 8443\n", encoding="UTF-8")
+        config.load(path, path_is_absolute=True, overlays=[overlay], force=True)
+        assert config.port == 8443  # noqa: PLR2004
+        assert config.database is database
+
+    @staticmethod
+    def test_aload(tmp_path: Path) -> None:
+        """Asynchronous load should reload incrementally as well."""
+        path = tmp_path / "config.yml"
+        config = IncrementalConfig.create()
+        reload(config, path, CONTENT)
+        database = config.database
+        path.write_text(CONTENT.replace("port: 80", "port: 81"), encoding="UTF-8")
+        asyncio.run(config.aload(path, path_is_absolute=True, force=True))
+        assert config.port == 81  # noqa: PLR2004
+        assert config.database is database
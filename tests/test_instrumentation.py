@@ -0,0 +1,147 @@
+"""Tests for instrumentation.py."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+from typing import TYPE_CHECKING
+from typing import Generator
+from typing import List
+
+import pytest
+
+from tests.conftest import SimpleTestConfig
+from yamldataclassconfig.instrumentation import NULL_PHASE
+from yamldataclassconfig.instrumentation import LoadPhaseEvent
+from yamldataclassconfig.instrumentation import add_load_listener
+from yamldataclassconfig.instrumentation import phase
+from yamldataclassconfig.instrumentation import remove_load_listener
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+CONTENT = "name: test\nage: 30\n"
+
+
+@pytest.fixture
+def events() -> Generator[List[LoadPhaseEvent], None, None]:  # noqa: UP006  # Reason: Ruff's bug
+    """Record events while the test runs."""
+    recorded: List[LoadPhaseEvent] = []  # noqa: UP006  # Reason: Ruff's bug
+    add_load_listener(recorded.append)
+    yield recorded
+    remove_load_listener(recorded.append)
+
+
+def ended(events: List[LoadPhaseEvent]) -> List[str]:  # noqa: UP006  # Reason: Ruff's bug
+    return [event.phase for event in events if event.is_end]
+
+
+class TestInstrumentation:
+    """Tests for load listeners."""
+
+    @staticmethod
+    def test_no_listener() -> None:
+        """Phase should be the shared context manager which does nothing while no listener is registered."""
+        assert phase("parse", SimpleTestConfig, "config.yml") is NULL_PHASE
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_load(temporary_yaml_file: Path, events: List[LoadPhaseEvent]) -> None:  # noqa: UP006
+        """Each phase of load() should emit start and end events with class, path and size."""
+        config = SimpleTestConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        assert [event.phase for event in events if not event.is_end] == ended(events)
+        assert ended(events) == ["resolve", "stamp", "parse", "validate", "deserialize", "apply"]
+        size = temporary_yaml_file.stat().st_size
+        for event in events[4:]:
+            assert event.cls is SimpleTestConfig
+            assert str(event.path) == str(temporary_yaml_file)
+            assert event.size == size
+        for start, end in zip(events[::2], events[1::2]):
+            assert start.start_ns == end.start_ns
+            assert end.duration_ns is not None
+            assert end.duration_ns >= 0
+            assert end.error is None
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_unchanged(temporary_yaml_file: Path, events: List[LoadPhaseEvent]) -> None:  # noqa: UP006
+        """Skipped load should end after stamp phase."""
+        config = SimpleTestConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        events.clear()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        assert ended(events) == ["resolve", "stamp"]
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: [unclosed\n"])
+    def test_error(temporary_yaml_file: Path, events: List[LoadPhaseEvent]) -> None:  # noqa: UP006
+        """End event of failed phase should carry the exception."""
+        config = SimpleTestConfig.create()
+        with pytest.raises(Exception, match="flow sequence"):
+            config.load(temporary_yaml_file, path_is_absolute=True)
+        assert events[-1].phase == "parse"
+        assert events[-1].error is not None
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_aload(temporary_yaml_file: Path, events: List[LoadPhaseEvent]) -> None:  # noqa: UP006
+        """Phases running in the executor should be observed as well."""
+        config = SimpleTestConfig.create()
+        asyncio.run(config.aload(temporary_yaml_file, path_is_absolute=True))
+        assert ended(events) == ["resolve", "stamp", "parse", "validate", "deserialize", "apply"]
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_load_many_process(temporary_yaml_file: Path, events: List[LoadPhaseEvent]) -> None:  # noqa: UP006
+        """Phases in worker processes should be replayed in the calling process."""
+        SimpleTestConfig.load_many([temporary_yaml_file], path_is_absolute=True, executor="process")
+        assert ended(events) == ["stamp", "parse", "validate", "deserialize", "apply"]
+        assert all(event.cls is SimpleTestConfig for event in events)
+        assert events[1].hit is False
+        assert events[3].size == temporary_yaml_file.stat().st_size
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: unknown\n"])
+    def test_load_many_process_error(temporary_yaml_file: Path, events: List[LoadPhaseEvent]) -> None:  # noqa: UP006
+        """Failed phase in worker process should be replayed with the exception."""
+        with pytest.raises(ExceptionGroup):
+            SimpleTestConfig.load_many([temporary_yaml_file], path_is_absolute=True, executor="process")
+        assert ended(events) == ["stamp", "parse", "validate"]
+        assert isinstance(events[-1].error, ExceptionGroup)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_layers(temporary_yaml_file: Path, tmp_path: Path, events: List[LoadPhaseEvent]) -> None:  # noqa: UP006
+        """Layered loading should report parse per layer and merge."""
+        overlay = tmp_path / "overlay.yml"
+        overlay.write_text("age: 31\n", encoding="UTF-8")
+        config = SimpleTestConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True, overlays=[overlay])
+        assert ended(events) == ["resolve", "stamp", "parse", "parse", "merge", "validate", "deserialize", "apply"]
+        assert events[-1].size == temporary_yaml_file.stat().st_size + overlay.stat().st_size
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_failing_listener(temporary_yaml_file: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Exception raised by listener should be logged without breaking load."""
+
+        def fail(_: LoadPhaseEvent) -> None:
+            raise RuntimeError
+
+        add_load_listener(fail)
+        try:
+            config = SimpleTestConfig.create()
+            with caplog.at_level(logging.ERROR):
+                config.load(temporary_yaml_file, path_is_absolute=True)
+        finally:
+            remove_load_listener(fail)
+        assert config.age == 30  # noqa: PLR2004
+        assert "Load listener" in caplog.text
+        assert phase("parse", SimpleTestConfig, "config.yml") is NULL_PHASE
@@ -0,0 +1,117 @@
+"""Tests for introspection.py."""
+
+from __future__ import annotations
+
+from dataclasses import MISSING
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+import yamldataclassconfig.introspection as introspection_module
+from tests.conftest import ComplexNonConfigDataclass
+from tests.conftest import SimpleTestConfig
+from yamldataclassconfig.factory import KeyArguments
+from yamldataclassconfig.introspection import field_table
+from yamldataclassconfig.introspection import forget_field_tables
+from yamldataclassconfig.introspection import introspect
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class ExampleHints:  # pylint: disable=too-few-public-methods
+    """Class whose annotations are strings since annotations are postponed."""
+
+    # Reason: Ruff's bug
+    items: List[str]  # noqa: UP006
+    mapping: Dict[str, int]  # noqa: UP006
+    optional: Optional[int]  # noqa: UP045
+    count: int
+
+
+@dataclass
+class ExampleFields:
+    """Dataclass which has various kinds of fields."""
+
+    SETTING: ClassVar[int] = 1
+
+    required: int
+    # Reason: Ruff's bug
+    items: List[str] = field(default_factory=list)  # noqa: UP006
+    name: str = "name"
+    computed: int = field(default=0, init=False)
+
+
+class TestIntrospect:
+    """Tests for introspect()."""
+
+    @staticmethod
+    def test_resolve_once() -> None:
+        """Same introspection should be returned for the same class."""
+        assert introspect(ExampleHints) is introspect(ExampleHints)
+
+    @staticmethod
+    def test_origins_and_args() -> None:
+        """Origins and arguments of each type hint should be resolved."""
+        introspection = introspect(ExampleHints)
+        assert introspection.type_hints["items"] == List[str]
+        assert introspection.origins == {"items": list, "mapping": dict, "optional": Union, "count": None}
+        assert introspection.args["mapping"] == (str, int)
+        assert introspection.args["optional"] == (int, type(None))
+        assert introspection.args["count"] == ()
+
+    @staticmethod
+    def test_shared_by_key_arguments(monkeypatch: pytest.MonkeyPatch) -> None:
+        """KeyArguments should not resolve type hints again."""
+        introspect(ComplexNonConfigDataclass)
+        introspect(SimpleTestConfig)
+        calls: List[Any] = []  # noqa: UP006
+
+        def get_type_hints(cls: type) -> Dict[str, Any]:  # noqa: UP006
+            calls.append(cls)
+            return {}
+
+        monkeypatch.setattr(introspection_module, "get_type_hints", get_type_hints)
+        for _ in range(3):
+            KeyArguments(ComplexNonConfigDataclass).build_init_kwargs()
+        SimpleTestConfig.create()
+        assert calls == []
+
+
+class TestFieldTable:
+    """Tests for field_table()."""
+
+    @staticmethod
+    def test_entries() -> None:
+        """Entries should be indexed by name without ClassVar pseudo-fields."""
+        table = field_table(ExampleFields)
+        assert list(table.entries) == ["required", "items", "name", "computed"]
+        items = table.entries["items"]
+        assert (items.private_name, items.type, items.default, items.default_factory) == (
+            "__items",
+            List[str],
+            MISSING,
+            list,
+        )
+        assert table.entries["name"].default == "name"
+        assert table.get("unknown") is None
+        assert [entry.name for entry in table.init_entries] == ["required", "items", "name"]
+
+    @staticmethod
+    def test_cache() -> None:
+        """Table should be cached only for class processed by @dataclass decorator."""
+
+        class NotDecorated(ExampleFields):
+            """Subclass which inherits fields."""
+
+        assert field_table(ExampleFields) is field_table(ExampleFields)
+        assert field_table(NotDecorated) is not field_table(NotDecorated)
+        table = field_table(ExampleFields)
+        forget_field_tables(NotDecorated)
+        assert field_table(ExampleFields) is not table
@@ -0,0 +1,181 @@
+"""Tests for layers.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.exceptions import ConfigValidationError
+from yamldataclassconfig.layers import merge_layers
+from yamldataclassconfig.yaml_backend import YamlBackend
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+BASE = (
+    "name: base\nport: 80\ndatabase:\n  host: localhost\n  options:\n    timeout: 5\n    retry: 3\n"
+    "tags:\n  - a\n  - b\n"
+)
+PROD = "port: 443\ndatabase:\n  host: db.example.com\n  options:\n    timeout: 30\ntags:\n  - prod\n"
+
+
+@dataclass
+class LayeredConfig(YamlDataClassConfig):
+    """Config class loaded from base config and overlays."""
+
+    name: str = ""
+    port: int = 0
+    # Reason: Ruff's bug
+    database: Dict[str, Any] = field(default_factory=dict)  # noqa: UP006
+    tags: List[str] = field(default_factory=list)  # noqa: UP006
+    comment: Optional[str] = None  # noqa: UP045
+
+
+# Reason: Ruff's bug
+def count_parses(monkeypatch: pytest.MonkeyPatch) -> List[str]:  # noqa: UP006
+    """Record name of every file which YAML backends parse."""
+    calls: List[str] = []  # noqa: UP006
+    original = YamlBackend.load
+
+    def load(self: YamlBackend, stream: Any) -> Any:  # noqa: ANN401
+        calls.append(os.path.basename(stream.name))  # noqa: PTH119
+        return original(self, stream)
+
+    monkeypatch.setattr(YamlBackend, "load", load)
+    return calls
+
+
+def write_layers(tmp_path: Path, **contents: str) -> Dict[str, Path]:  # noqa: UP006  # Reason: Ruff's bug
+    paths = {}
+    for name, content in contents.items():
+        path = tmp_path / f"{name}.yml"
+        path.write_text(content, encoding="UTF-8")
+        paths[name] = path
+    return paths
+
+
+def touch_with_new_content(path: Path, content: str) -> None:
+    """Rewrite the file so that its stamp surely changes even within the mtime resolution."""
+    stat = path.stat()
+    path.write_text(content, encoding="UTF-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestMergeLayers:
+    """Tests for merge_layers()."""
+
+    @staticmethod
+    def test_semantics() -> None:
+        """Mappings should be merged recursively while lists and null should replace."""
+        base = {"a": {"b": 1, "c": [1, 2], "d": {"e": 1}}, "f": 1}
+        overlay = {"a": {"b": 2, "c": [3], "d": None}, "g": 2}
+        assert merge_layers([base, overlay]) == {"a": {"b": 2, "c": [3], "d": None}, "f": 1, "g": 2}
+
+    @staticmethod
+    def test_mapping_replaces_scalar() -> None:
+        """Mapping should replace non-mapping value of earlier layer and vice versa."""
+        assert merge_layers([{"a": 1, "b": {"c": 1}}, {"a": {"c": 2}, "b": 3}]) == {"a": {"c": 2}, "b": 3}
+
+    @staticmethod
+    def test_copies_layers() -> None:
+        """Merged result should share no mutable objects with layers."""
+        base = {"a": {"b": [{"c": 1}]}}
+        overlay = {"d": {"e": [1]}}
+        merged = merge_layers([base, overlay])
+        merged["a"]["b"][0]["c"] = 2
+        merged["d"]["e"].append(2)
+        assert base == {"a": {"b": [{"c": 1}]}}
+        assert overlay == {"d": {"e": [1]}}
+
+
+class TestLayeredLoad:
+    """Tests for load() with overlays."""
+
+    @staticmethod
+    def test_load(tmp_path: Path) -> None:
+        """Overlays should be merged over the file in order."""
+        host = "database:\n  options:\n    retry: 1\ncomment: host\n"
+        paths = write_layers(tmp_path, base=BASE, prod=PROD, host=host)
+        config = LayeredConfig.create()
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"], paths["host"]])
+        assert config.name == "base"
+        assert config.port == 443  # noqa: PLR2004
+        assert config.database == {"host": "db.example.com", "options": {"timeout": 30, "retry": 1}}
+        assert config.tags == ["prod"]
+        assert config.comment == "host"
+
+    @staticmethod
+    def test_reparses_only_changed_layer(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Reload should parse only the overlay which changed."""
+        paths = write_layers(tmp_path, base=BASE, prod=PROD)
+        calls = count_parses(monkeypatch)
+        config = LayeredConfig.create()
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"]])
+        assert calls == ["base.yml", "prod.yml"]
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"]])
+        assert calls == ["base.yml", "prod.yml"]
+        touch_with_new_content(paths["prod"], "port: 8443\n")
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"]])
+        assert calls == ["base.yml", "prod.yml", "prod.yml"]
+        assert config.port == 8443  # noqa: PLR2004
+        assert config.database == {"host": "localhost", "options": {"timeout": 5, "retry": 3}}
+
+    @staticmethod
+    def test_mutation_does_not_leak_into_cache(tmp_path: Path) -> None:
+        """Mutating loaded values should not change values of the next load."""
+        paths = write_layers(tmp_path, base=BASE, prod=PROD)
+        config = LayeredConfig.create()
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"]])
+        config.database["options"]["timeout"] = 0
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"]], force=True)
+        assert config.database["options"]["timeout"] == 30  # noqa: PLR2004
+
+    @staticmethod
+    def test_switch_between_single_and_layered(tmp_path: Path) -> None:
+        """Loading without overlays after layered load should not be skipped as unchanged."""
+        paths = write_layers(tmp_path, base=BASE, prod=PROD)
+        config = LayeredConfig.create()
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"]])
+        config.load(paths["base"], path_is_absolute=True)
+        assert config.port == 80  # noqa: PLR2004
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["prod"]])
+        assert config.port == 443  # noqa: PLR2004
+
+    @staticmethod
+    def test_empty_overlay(tmp_path: Path) -> None:
+        """Empty overlay should change nothing."""
+        paths = write_layers(tmp_path, base=BASE, empty="")
+        config = LayeredConfig.create()
+        config.load(paths["base"], path_is_absolute=True, overlays=[paths["empty"]])
+        assert config.port == 80  # noqa: PLR2004
+
+    @staticmethod
+    def test_non_mapping_layer(tmp_path: Path) -> None:
+        """Layer whose top level is not a mapping should be rejected."""
+        paths = write_layers(tmp_path, base=BASE, invalid="- a\n")
+        config = LayeredConfig.create()
+        with pytest.raises(ConfigValidationError, match="must be a mapping, got list"):
+            config.load(paths["base"], path_is_absolute=True, overlays=[paths["invalid"]])
+
+    @staticmethod
+    def test_merged_content_is_validated(tmp_path: Path) -> None:
+        """Type error introduced by overlay should be detected."""
+        paths = write_layers(tmp_path, base=BASE, invalid="port: https\n")
+        config = LayeredConfig.create()
+        with pytest.raises(ExceptionGroup):
+            config.load(paths["base"], path_is_absolute=True, overlays=[paths["invalid"]])
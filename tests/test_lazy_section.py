@@ -0,0 +1,154 @@
+"""Tests for lazy_section.py."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import pickle
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import ClassVar
+from typing import Dict
+from typing import Optional
+
+import pytest
+from dataclasses_json import DataClassJsonMixin
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.lazy_section import is_placeholder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+CONTENT = "first:\n  value: 1\n  label: one\nsecond:\n  value: 2\ncount: 3\npart:\n  host: real\n  port: 99\n"
+
+
+@dataclass
+class Section(DataClassJsonMixin):
+    """Nested section."""
+
+    value: int
+    label: str = ""
+
+
+@dataclass
+class Part(DataClassJsonMixin):
+    """Nested section whose fields have defaults."""
+
+    host: str = "default"
+    port: int = 1
+
+
+@dataclass
+class LazyConfig(YamlDataClassConfig):
+    """Config class whose sections are deserialized on the first access."""
+
+    LAZY_SECTIONS: ClassVar[bool] = True
+
+    first: Section
+    # Reason: Ruff's bug
+    second: Optional[Section] = None  # noqa: UP045
+    third: Optional[Section] = None  # noqa: UP045
+    count: int = 0
+    part: Part = field(default_factory=Part)
+
+
+@dataclass
+class UnsupportedLazyConfig(YamlDataClassConfig):
+    """Config class which the generated deserializer doesn't cover."""
+
+    LAZY_SECTIONS: ClassVar[bool] = True
+
+    first: Section
+    # Reason: Ruff's bug
+    mapping: Dict[int, str] = field(default_factory=dict)  # noqa: UP006
+
+
+def load(path: Path, deserializer: str = "marshmallow") -> LazyConfig:
+    config = LazyConfig.create()
+    config.load(path, path_is_absolute=True, deserializer=deserializer)
+    return config
+
+
+class TestLazySection:
+    """Tests for LAZY_SECTIONS."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    @pytest.mark.parametrize("deserializer", ["marshmallow", "generated"])
+    def test_materialize(temporary_yaml_file: Path, deserializer: str) -> None:
+        """Section should be deserialized on the first access and become plain instance of the section class."""
+        config = load(temporary_yaml_file, deserializer)
+        first = config.first
+        assert isinstance(first, Section)
+        assert type(first) is not Section
+        assert is_placeholder(first)
+        assert (first.value, first.label) == (1, "one")
+        assert type(first) is Section
+        assert not is_placeholder(first)
+        assert config.second == Section(2)
+        assert config.third is None
+        assert config.count == 3  # noqa: PLR2004
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    @pytest.mark.parametrize("deserializer", ["marshmallow", "generated"])
+    def test_defaulted_field(temporary_yaml_file: Path, deserializer: str) -> None:
+        """Field which has default on the section class should be read from the data on the first access."""
+        config = load(temporary_yaml_file, deserializer)
+        assert is_placeholder(config.part)
+        assert dataclasses.asdict(config.part) == {"host": "real", "port": 99}
+        config = load(temporary_yaml_file, deserializer)
+        assert (config.part.host, config.part.port) == ("real", 99)
+        assert config.to_dict()["part"] == {"host": "real", "port": 99}
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["first:\n  value: unknown\n"])
+    def test_error_on_access(temporary_yaml_file: Path) -> None:
+        """Error in data of section should be raised on the first access."""
+        config = load(temporary_yaml_file)
+        with pytest.raises(ExceptionGroup, match="Configuration validation failed"):
+            _ = config.first.value
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_set(temporary_yaml_file: Path) -> None:
+        """Assigned value should not be overwritten by data of section."""
+        config = load(temporary_yaml_file)
+        config.first.value = 10
+        assert (config.first.value, config.first.label) == (10, "one")
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_copy(temporary_yaml_file: Path) -> None:
+        """Copy and pickle of unaccessed section should stay lazy."""
+        config = load(temporary_yaml_file)
+        for section in (copy.deepcopy(config.first), pickle.loads(pickle.dumps(config.first))):  # noqa: S301
+            assert is_placeholder(section)
+            assert section == Section(1, "one")
+        assert is_placeholder(config.first)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["first:\n  value: 1\nmapping:\n  1: a\n"])
+    @pytest.mark.parametrize("deserializer", ["marshmallow", "generated"])
+    def test_top_level_by_marshmallow(temporary_yaml_file: Path, deserializer: str) -> None:
+        """Top level of class which the generator doesn't cover should be deserialized by marshmallow lazily."""
+        config = UnsupportedLazyConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True, deserializer=deserializer)
+        assert config.mapping == {1: "a"}
+        assert is_placeholder(config.first)
+        assert config.first == Section(1)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_unknown_deserializer(temporary_yaml_file: Path) -> None:
+        """Unknown deserializer should be reported as eager loading does."""
+        with pytest.raises(ValueError, match="Unknown deserializer 'unknown'"):
+            load(temporary_yaml_file, "unknown")
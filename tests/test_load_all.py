@@ -0,0 +1,48 @@
+"""Tests for YamlDataClassConfig.load_all()."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+import yaml
+
+from tests.conftest import SimpleTestConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+
+class TestLoadAll:
+    """Tests for YamlDataClassConfig.load_all()."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: alice\nage: 0\n---\nname: bob\nage: 1\n---\n"])
+    def test_load_all(temporary_yaml_file: Path) -> None:
+        """Each document should be loaded into its own instance and empty documents should be skipped."""
+        configs = list(SimpleTestConfig.load_all(temporary_yaml_file, path_is_absolute=True))
+        assert [(config.name, config.age) for config in configs] == [("alice", 0), ("bob", 1)]
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: alice\nage: 0\n---\nname: [bob\n"])
+    def test_lazy(temporary_yaml_file: Path) -> None:
+        """Documents should be parsed as the iterator advances."""
+        configs = SimpleTestConfig.load_all(temporary_yaml_file, path_is_absolute=True)
+        assert next(configs).name == "alice"
+        with pytest.raises(yaml.YAMLError):
+            next(configs)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: alice\nage: 0\n---\nname: bob\nage: unknown\n"])
+    def test_validation(temporary_yaml_file: Path) -> None:
+        """Each document should be validated."""
+        configs = SimpleTestConfig.load_all(temporary_yaml_file, path_is_absolute=True)
+        assert next(configs).name == "alice"
+        with pytest.raises(ExceptionGroup, match="Configuration validation failed"):
+            next(configs)
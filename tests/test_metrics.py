@@ -0,0 +1,142 @@
+"""Tests for metrics.py."""
+
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Generator
+
+import pytest
+
+from tests.conftest import SimpleTestConfig
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.instrumentation import LoadPhaseEvent
+from yamldataclassconfig.metrics import MetricsRegistry
+from yamldataclassconfig.watcher import ConfigWatcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+CONTENT = "name: test\nage: 30\n"
+KEY = f"{SimpleTestConfig.__module__}.{SimpleTestConfig.__qualname__}"
+# Line of sample in Prometheus text format
+SAMPLE = re.compile(r'^[a-z_]+\{([a-z_]+="[^"\\\n]*(\\.[^"\\\n]*)*",?)+\} \S+$')
+
+
+@dataclass
+class CachedConfig(YamlDataClassConfig):
+    """Config class whose CACHE_DIR is set by the test."""
+
+    name: str = ""
+
+
+@pytest.fixture
+def registry() -> Generator[MetricsRegistry, None, None]:
+    """Registry which collects metrics while the test runs."""
+    installed = MetricsRegistry().install()
+    yield installed
+    installed.uninstall()
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_load(temporary_yaml_file: Path, registry: MetricsRegistry) -> None:
+        """Loads, bytes, cache lookups and phases should be counted."""
+        config = SimpleTestConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        metrics = registry.snapshot()[KEY]
+        assert metrics["loads"] == 1
+        assert metrics["failures"] == 0
+        assert metrics["bytes_read"] == temporary_yaml_file.stat().st_size
+        assert metrics["cache_hits"]["unchanged"] == 1
+        assert metrics["cache_misses"]["unchanged"] == 1
+        assert metrics["cache_hit_ratio"] == 0.5  # noqa: PLR2004
+        parse = metrics["phases"]["parse"]
+        assert parse["count"] == 1
+        assert parse["buckets"]["+Inf"] == 1
+        assert parse["sum"] > 0
+        assert list(parse["buckets"].values()) == sorted(parse["buckets"].values())
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: thirty\n"])
+    def test_validation_error(temporary_yaml_file: Path, registry: MetricsRegistry) -> None:
+        """Failed load and its validation errors should be counted."""
+        with pytest.raises(ExceptionGroup):
+            SimpleTestConfig.create().load(temporary_yaml_file, path_is_absolute=True)
+        metrics = registry.snapshot()[KEY]
+        assert (metrics["loads"], metrics["failures"], metrics["validation_errors"]) == (0, 1, 1)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_load_many_process(temporary_yaml_file: Path, registry: MetricsRegistry) -> None:
+        """Phases in worker processes should be counted as well."""
+        SimpleTestConfig.load_many([temporary_yaml_file], path_is_absolute=True, executor="process")
+        metrics = registry.snapshot()[KEY]
+        assert metrics["loads"] == 1
+        assert metrics["bytes_read"] == temporary_yaml_file.stat().st_size
+        assert metrics["cache_misses"]["unchanged"] == 1
+        assert set(metrics["phases"]) == {"stamp", "parse", "validate", "deserialize", "apply"}
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_disk_cache(
+        temporary_yaml_file: Path,
+        tmp_path: Path,
+        registry: MetricsRegistry,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Lookups of on-disk cache should be counted, bytes should be counted once."""
+        monkeypatch.setattr(CachedConfig, "CACHE_DIR", str(tmp_path / "cache"))
+        CachedConfig.create().load(temporary_yaml_file, path_is_absolute=True)
+        CachedConfig.create().load(temporary_yaml_file, path_is_absolute=True)
+        metrics = registry.snapshot()[f"{CachedConfig.__module__}.{CachedConfig.__qualname__}"]
+        assert (metrics["cache_hits"]["disk"], metrics["cache_misses"]["disk"]) == (1, 1)
+        assert metrics["bytes_read"] == 2 * temporary_yaml_file.stat().st_size
+
+    @staticmethod
+    @pytest.mark.parametrize("content", [CONTENT])
+    def test_watcher_reload(temporary_yaml_file: Path, registry: MetricsRegistry) -> None:
+        """Reload by watcher should be counted as load."""
+        config = SimpleTestConfig.create()
+        watcher = ConfigWatcher(config, temporary_yaml_file, path_is_absolute=True, backend="polling")
+        watcher.reload()
+        assert registry.snapshot()[KEY]["loads"] == 1
+
+    @staticmethod
+    def test_no_lookup() -> None:
+        """Hit ratio should be None before any lookup and durations should fall into the bucket of upper bound."""
+        registry = MetricsRegistry(buckets=(0.001, 0.01))
+        registry.observe(LoadPhaseEvent("parse", SimpleTestConfig, "config.yml", 10, 0, 1_000_000))
+        registry.observe(LoadPhaseEvent("parse", SimpleTestConfig, "config.yml", 10, 0, 20_000_000))
+        metrics = registry.snapshot()[KEY]
+        assert metrics["cache_hit_ratio"] is None
+        assert metrics["phases"]["parse"]["buckets"] == {"0.001": 1, "0.01": 1, "+Inf": 2}
+        registry.reset()
+        assert registry.snapshot() == {}
+
+    @staticmethod
+    def test_to_prometheus() -> None:
+        """Export should be valid Prometheus text format with escaped labels."""
+        registry = MetricsRegistry(buckets=(0.001,))
+        cls = type('Quoted"Config', (), {"__module__": "tests"})
+        registry.observe(LoadPhaseEvent("apply", cls, "config.yml", 10, 0, 500))
+        text = registry.to_prometheus()
+        assert text.endswith("\n")
+        label = 'config_class="tests.Quoted\\"Config"'
+        loads = f"yamldataclassconfig_loads_total{{{label}}} 1\n"
+        assert f"# TYPE yamldataclassconfig_loads_total counter\n{loads}" in text
+        assert f'yamldataclassconfig_phase_duration_seconds_bucket{{{label},phase="apply",le="0.001"}} 1' in text
+        assert f'yamldataclassconfig_phase_duration_seconds_count{{{label},phase="apply"}} 1' in text
+        for line in text.splitlines():
+            assert line.startswith("# ") or SAMPLE.match(line), line
@@ -0,0 +1,123 @@
+"""Tests for schema_cache.py."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import make_dataclass
+from typing import TYPE_CHECKING
+from typing import Optional
+
+import pytest
+from dataclasses_json import DataClassJsonMixin
+from marshmallow import fields
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.schema_cache import SchemaCache
+from yamldataclassconfig.schema_cache import clear_schema_cache
+from yamldataclassconfig.schema_cache import schema_cache_info
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class CachedSchemaConfig(YamlDataClassConfig):
+    """Config class for schema cache tests."""
+
+    name: str = field(metadata={"dataclasses_json": {"mm_field": fields.String()}})
+
+
+class TestSchemaCache:
+    """Tests for SchemaCache."""
+
+    @staticmethod
+    def test_hit() -> None:
+        """Same schema should be returned while the class doesn't change."""
+        cache = SchemaCache()
+        schema = cache.get(CachedSchemaConfig)
+        assert cache.get(CachedSchemaConfig) is schema
+        assert cache.info() == (1, 1, 0, 1)
+
+    @staticmethod
+    def test_invalidate_when_metadata_changes() -> None:
+        """Schema should be rebuilt when metadata of field is replaced."""
+
+        @dataclass
+        class MutableConfig(YamlDataClassConfig):
+            """Config class whose metadata is modified."""
+
+            name: str = field(metadata={"dataclasses_json": {"mm_field": fields.String()}})
+
+        cache = SchemaCache()
+        schema = cache.get(MutableConfig)
+        # Pylint's bug: doesn't recognize __dataclass_fields__ on dataclasses
+        metadata = MutableConfig.__dataclass_fields__["name"].metadata  # pylint: disable=no-member
+        metadata["dataclasses_json"]["mm_field"] = fields.Integer()
+        rebuilt = cache.get(MutableConfig)
+        assert rebuilt is not schema
+        assert isinstance(rebuilt.fields["name"], fields.Integer)
+        assert cache.info() == (0, 1, 1, 1)
+
+    @staticmethod
+    def test_invalidate_when_nested_class_changes() -> None:
+        """Schema should be rebuilt when metadata of field in nested dataclass is replaced."""
+
+        @dataclass
+        class NestedConfig(DataClassJsonMixin):
+            """Nested config class whose metadata is modified."""
+
+            name: str = field(metadata={"dataclasses_json": {"mm_field": fields.String()}})
+
+        # Since dataclasses-json doesn't resolve string annotations, the type is passed as an object
+        parent_config = make_dataclass(
+            "ParentConfig",
+            [("nested", Optional[NestedConfig], field(default=None))],
+            bases=(YamlDataClassConfig,),
+        )
+        cache = SchemaCache()
+        schema = cache.get(parent_config)
+        # Pylint's bug: doesn't recognize __dataclass_fields__ on dataclasses
+        metadata = NestedConfig.__dataclass_fields__["name"].metadata  # pylint: disable=no-member
+        metadata["dataclasses_json"]["mm_field"] = fields.Integer()
+        assert cache.get(parent_config) is not schema
+        assert cache.info() == (0, 1, 1, 1)
+
+    @staticmethod
+    def test_concurrent_hits() -> None:
+        """Hits from concurrent threads shouldn't be lost."""
+        cache = SchemaCache()
+        cache.get(CachedSchemaConfig)
+        threads = 8
+        repeat = 1000
+        with ThreadPoolExecutor(threads) as executor:
+            for _ in range(threads):
+                executor.submit(lambda: [cache.get(CachedSchemaConfig) for _ in range(repeat)])
+        assert cache.info() == (threads * repeat, 1, 0, 1)
+
+    @staticmethod
+    def test_clear() -> None:
+        """Entries and statistics should be cleared."""
+        cache = SchemaCache()
+        cache.get(CachedSchemaConfig)
+        cache.clear()
+        assert cache.info() == (0, 0, 0, 0)
+
+
+class TestLoadWithSchemaCache:
+    """Tests for schema cache shared by load()."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_load_reuses_schema(temporary_yaml_file: Path) -> None:
+        """Schema should be built only once for repeated loads."""
+        clear_schema_cache()
+        expected_loads = 3
+        for _ in range(expected_loads):
+            config = CachedSchemaConfig.create()
+            config.load(temporary_yaml_file)
+            assert config.name == "test"
+        info = schema_cache_info()
+        assert info.misses == 1
+        assert info.hits == expected_loads - 1
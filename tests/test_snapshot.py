@@ -0,0 +1,143 @@
+"""Tests for snapshot.py."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import ClassVar
+from typing import List
+
+import pytest
+
+from tests.conftest import SimpleTestConfig
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.exceptions import ConfigNotLoadedError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class SnapshotConfig(YamlDataClassConfig):
+    """Config class which publishes snapshot on load."""
+
+    SNAPSHOT: ClassVar[bool] = True
+
+    left: int
+    right: int
+    # Reason: Ruff's bug
+    tags: List[str] = field(default_factory=list)  # noqa: UP006
+
+
+class TestSnapshot:
+    """Tests for snapshot mode."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["left: 1\nright: 2\n"])
+    def test_load(temporary_yaml_file: Path) -> None:
+        """Fields should be read from snapshot published by load."""
+        config = SnapshotConfig.create()
+        config.load(temporary_yaml_file)
+        snapshot = config.snapshot()
+        assert (config.left, config.right, config.tags) == (1, 2, [])
+        assert tuple(snapshot) == (1, 2, [])
+        assert snapshot._asdict() == {"left": 1, "right": 2, "tags": []}
+        assert repr(snapshot) == "SnapshotConfigSnapshot(left=1, right=2, tags=[])"
+        assert config.snapshot() is snapshot
+        assert "__left" not in vars(config)
+        with pytest.raises(AttributeError):
+            snapshot.left = 3
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["left: 1\nright: 2\n"])
+    def test_reload(temporary_yaml_file: Path) -> None:
+        """Reload should publish new snapshot and keep the old one unchanged."""
+        config = SnapshotConfig.create()
+        config.load(temporary_yaml_file)
+        old = config.snapshot()
+        temporary_yaml_file.write_text("left: 3\nright: 4\n")
+        config.load(temporary_yaml_file, force=True)
+        assert (old.left, old.right) == (1, 2)
+        assert (config.left, config.right) == (3, 4)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["left: 1\nright: 2\n"])
+    def test_set_after_load(temporary_yaml_file: Path) -> None:
+        """Setting field after load should publish new snapshot."""
+        config = SnapshotConfig.create()
+        config.load(temporary_yaml_file)
+        old = config.snapshot()
+        config.left = 5
+        assert config.left == config.snapshot().left == 5  # noqa: PLR2004
+        assert old.left == 1
+
+    @staticmethod
+    def test_not_loaded() -> None:
+        """ConfigNotLoadedError should be raised before load."""
+        config = SnapshotConfig.create()
+        with pytest.raises(ConfigNotLoadedError):
+            _ = config.left
+        with pytest.raises(ConfigNotLoadedError):
+            config.snapshot()
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_copy_without_snapshot_mode(temporary_yaml_file: Path) -> None:
+        """Snapshot should be copied from fields when snapshot mode is disabled."""
+        config = SimpleTestConfig.create()
+        config.load(temporary_yaml_file)
+        snapshot = config.snapshot()
+        assert snapshot._asdict() == {"name": "test", "age": 30}
+        assert config.snapshot() is not snapshot
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_load_snapshot(temporary_yaml_file: Path) -> None:
+        """Compact snapshot should be loaded without keeping config instance."""
+        snapshot = SimpleTestConfig.load_snapshot(temporary_yaml_file)
+        assert (snapshot.name, snapshot.age) == ("test", 30)
+        assert not hasattr(snapshot, "__dict__")
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_store_once(temporary_yaml_file: Path) -> None:
+        """Values set by __init__ before descriptors are installed should be discarded on load."""
+
+        @dataclass
+        class StoreOnceConfig(YamlDataClassConfig):
+            name: str
+            age: int
+
+        config = StoreOnceConfig.create()
+        assert "name" in vars(config)
+        config.load(temporary_yaml_file)
+        assert "name" not in vars(config)
+        assert vars(config)["__name"] == config.name == "test"
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["left: 0\nright: 0\n"])
+    def test_consistent_during_reload(temporary_yaml_file: Path) -> None:
+        """Readers should never see a mix of old and new values."""
+        config = SnapshotConfig.create()
+        config.load(temporary_yaml_file)
+        stopping = threading.Event()
+        mixed: List[object] = []  # noqa: UP006
+
+        def read() -> None:
+            while not stopping.is_set():
+                snapshot = config.snapshot()
+                if snapshot.left != snapshot.right:
+                    mixed.append(snapshot)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for index in range(1, 50):
+                temporary_yaml_file.write_text(f"left: {index}\nright: {index}\n")
+                config.load(temporary_yaml_file, force=True)
+        finally:
+            stopping.set()
+            reader.join()
+        assert not mixed
@@ -0,0 +1,184 @@
+"""Tests for subscription.py."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import ClassVar
+from typing import List
+from typing import Optional
+
+import pytest
+from dataclasses_json import DataClassJsonMixin
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.subscription import FieldChange
+from yamldataclassconfig.watcher import ConfigWatcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CONTENT = "name: base\ndatabase:\n  host: localhost\n  port: 5432\n"
+
+
+@dataclass
+class DatabaseConfig(DataClassJsonMixin):
+    """Nested section."""
+
+    host: str = ""
+    port: int = 0
+
+
+@dataclass
+class SubscribedConfig(YamlDataClassConfig):
+    """Config class whose fields are subscribed by the tests."""
+
+    name: str = ""
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
+    # Reason: Ruff's bug
+    replica: Optional[DatabaseConfig] = None  # noqa: UP045
+
+
+@dataclass
+class SnapshotSubscribedConfig(SubscribedConfig):
+    """Config class which publishes values as snapshot."""
+
+    SNAPSHOT: ClassVar[bool] = True
+
+
+@dataclass
+class IncrementalSubscribedConfig(SubscribedConfig):
+    """Config class which reuses unchanged sections on reload."""
+
+    INCREMENTAL_RELOAD: ClassVar[bool] = True
+
+
+@dataclass
+class LazySubscribedConfig(SubscribedConfig):
+    """Config class whose sections are deserialized on the first access."""
+
+    LAZY_SECTIONS: ClassVar[bool] = True
+
+
+def reload(config: SubscribedConfig, path: Path, content: str) -> None:
+    path.write_text(content, encoding="UTF-8")
+    config.load(path, path_is_absolute=True, force=True)
+
+
+class TestSubscribe:
+    """Tests for subscribe() and unsubscribe()."""
+
+    @staticmethod
+    @pytest.mark.parametrize("config_class", [SubscribedConfig, SnapshotSubscribedConfig, IncrementalSubscribedConfig])
+    def test_batched(tmp_path: Path, config_class: type[SubscribedConfig]) -> None:
+        """Each subscriber should be called once per reload with only its changed paths."""
+        path = tmp_path / "config.yml"
+        config = config_class.create()
+        # Reason: Ruff's bug
+        database: List[List[FieldChange]] = []  # noqa: UP006
+        name: List[List[FieldChange]] = []  # noqa: UP006
+        config.subscribe(["database.host", "database.port", "name"], database.append)
+        config.subscribe("name", name.append)
+        reload(config, path, CONTENT)
+        assert database == []
+        reload(config, path, CONTENT.replace("localhost", "db.example.com").replace("5432", "6543"))
+        host = FieldChange("database.host", "localhost", "db.example.com")
+        assert database == [[host, FieldChange("database.port", 5432, 6543)]]
+        assert name == []
+        reload(config, path, CONTENT.replace("localhost", "db.example.com").replace("5432", "6543"))
+        assert len(database) == 1
+
+    @staticmethod
+    def test_section(tmp_path: Path) -> None:
+        """Subscriber of section should get the old and new section, and paths through None section should be None."""
+        path = tmp_path / "config.yml"
+        config = SubscribedConfig.create()
+        changes: List[List[FieldChange]] = []  # noqa: UP006  # Reason: Ruff's bug
+        config.subscribe(["database", "replica.host"], changes.append)
+        reload(config, path, CONTENT)
+        old = config.database
+        reload(config, path, CONTENT.replace("5432", "6543") + "replica:\n  host: replica\n")
+        database = FieldChange("database", old, config.database)
+        assert changes == [[database, FieldChange("replica.host", None, "replica")]]
+
+    @staticmethod
+    def test_unsubscribe(tmp_path: Path) -> None:
+        """Unsubscribed callback should not be called and unknown subscription should be reported."""
+        path = tmp_path / "config.yml"
+        config = SubscribedConfig.create()
+        changes: List[List[FieldChange]] = []  # noqa: UP006  # Reason: Ruff's bug
+        subscription = config.subscribe("name", changes.append)
+        reload(config, path, CONTENT)
+        config.unsubscribe(subscription)
+        reload(config, path, CONTENT.replace("name: base", "name: other"))
+        assert changes == []
+        with pytest.raises(ValueError, match="not in"):
+            config.unsubscribe(subscription)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("path", "message"),
+        [
+            ("nmae", "Unknown field 'nmae'. Available fields: name, database, replica"),
+            ("database.hots", "Unknown field 'database.hots'. Available fields: host, port"),
+            ("name.length", "Field 'name' is not a section"),
+            ("_loaded", "Unknown field '_loaded'"),
+        ],
+    )
+    def test_unknown_path(path: str, message: str) -> None:
+        """Path which doesn't match fields should be reported on subscribe."""
+        with pytest.raises(ValueError, match=message.replace(".", r"\.")):
+            SubscribedConfig.create().subscribe(path, print)
+
+    @staticmethod
+    def test_failing_subscriber(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Exception raised by subscriber should be logged without breaking reload or other subscribers."""
+        path = tmp_path / "config.yml"
+        config = SubscribedConfig.create()
+        changes: List[List[FieldChange]] = []  # noqa: UP006  # Reason: Ruff's bug
+
+        def fail(_: List[FieldChange]) -> None:  # noqa: UP006  # Reason: Ruff's bug
+            raise RuntimeError
+
+        config.subscribe("name", fail)
+        config.subscribe("name", changes.append)
+        reload(config, path, CONTENT)
+        with caplog.at_level(logging.ERROR):
+            reload(config, path, CONTENT.replace("name: base", "name: other"))
+        assert config.name == "other"
+        assert changes == [[FieldChange("name", "base", "other")]]
+        assert "Subscriber" in caplog.text
+
+    @staticmethod
+    def test_failing_path(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Error of reading value at subscribed path should be logged without breaking reload or other subscribers."""
+        path = tmp_path / "config.yml"
+        config = LazySubscribedConfig.create()
+        database: List[List[FieldChange]] = []  # noqa: UP006  # Reason: Ruff's bug
+        changes: List[List[FieldChange]] = []  # noqa: UP006  # Reason: Ruff's bug
+        config.subscribe("database.port", database.append)
+        config.subscribe("name", changes.append)
+        reload(config, path, CONTENT)
+        with caplog.at_level(logging.ERROR):
+            reload(config, path, CONTENT.replace("name: base", "name: other").replace("5432", "invalid"))
+        assert config.name == "other"
+        assert database == []
+        assert changes == [[FieldChange("name", "base", "other")]]
+        assert "Subscriber" in caplog.text
+
+    @staticmethod
+    def test_aload_and_watcher(tmp_path: Path) -> None:
+        """Reload by aload() and ConfigWatcher should notify as well."""
+        path = tmp_path / "config.yml"
+        config = SubscribedConfig.create()
+        changes: List[List[FieldChange]] = []  # noqa: UP006  # Reason: Ruff's bug
+        config.subscribe("name", changes.append)
+        reload(config, path, CONTENT)
+        path.write_text(CONTENT.replace("name: base", "name: async"), encoding="UTF-8")
+        asyncio.run(config.aload(path, path_is_absolute=True, force=True))
+        path.write_text(CONTENT.replace("name: base", "name: watched"), encoding="UTF-8")
+        ConfigWatcher(config, path, path_is_absolute=True, backend="polling").reload()
+        assert changes == [[FieldChange("name", "base", "async")], [FieldChange("name", "async", "watched")]]
@@ -8,8 +8,11 @@ from typing import Union
 
 import pytest
 
+from tests.conftest import SimpleTestConfig
 from yamldataclassconfig import build_path
+from yamldataclassconfig.exceptions import ConfigFileTooLargeError
 from yamldataclassconfig.utility import create_file_path_field
+from yamldataclassconfig.utility import open_config_file
 from yamldataclassconfig.utility import resolve_path
 
 
@@ -113,3 +116,33 @@ class TestResolvePath:
         expected = Path.cwd() / relative_path
         assert result == expected
         assert isinstance(result, Path)
+
+
+class TestOpenConfigFile:
+    """Tests for open_config_file()."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_open_config_file(temporary_yaml_file: Path) -> None:
+        """File within maximum size should be opened in binary mode."""
+        with open_config_file(temporary_yaml_file, temporary_yaml_file.stat().st_size) as file:
+            assert file.read() == temporary_yaml_file.read_bytes()
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\nage: 30\n"])
+    def test_too_large(temporary_yaml_file: Path) -> None:
+        with pytest.raises(ConfigFileTooLargeError, match="exceeds the maximum of 1 bytes"):
+            open_config_file(temporary_yaml_file, 1)
+
+    @staticmethod
+    def test_load(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """load() should decode streamed UTF-8 content and respect MAX_FILE_SIZE."""
+        temporary_yaml_file = tmp_path / "temp.yml"
+        temporary_yaml_file.write_text("name: テスト\nage: 30\n", encoding="UTF-8")
+        config = SimpleTestConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        assert config.name == "テスト"
+        monkeypatch.setattr(SimpleTestConfig, "MAX_FILE_SIZE", 1)
+        with pytest.raises(ConfigFileTooLargeError):
+            config.load(temporary_yaml_file, path_is_absolute=True, force=True)
+        assert config.name == "テスト"
@@ -5,8 +5,10 @@ from __future__ import annotations
 import dataclasses
 import sys
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Type
 from typing import Union
 
@@ -15,9 +17,12 @@ import pytest
 import yamldataclassconfig.validation as validation_module
 from tests.conftest import SimpleTestConfig
 from yamldataclassconfig.exceptions import ConfigValidationError
+from yamldataclassconfig.validation import SKIP
 from yamldataclassconfig.validation import ExpectedType
 from yamldataclassconfig.validation import Validation
+from yamldataclassconfig.validation import ValidationPlan
 from yamldataclassconfig.validation import YamlFieldValidations
+from yamldataclassconfig.validation import get_validation_plan
 from yamldataclassconfig.validation import validate_config_if_needed
 
 # Reason: ExceptionGroup is only available in Python 3.11+.
@@ -315,3 +320,42 @@ class TestValidateConfigIfNeeded:
 
         # Should not raise any exception
         validate_config_if_needed(config, type_hints)
+
+
+class TestValidationPlan:
+    """Test ValidationPlan class."""
+
+    def test_compile(self) -> None:
+        """Type hints should be compiled into types for isinstance() check or SKIP."""
+        type_hints = {
+            "name": str,
+            "items": List[str],
+            "optional": Optional[int],
+            "config": SimpleTestConfig,
+            "setting": ClassVar[str],
+        }
+        plan = ValidationPlan(type_hints)
+        assert plan.checks == {"name": str, "items": list, "optional": int, "config": SKIP}
+
+    def test_validate_many_fields(self) -> None:
+        """All invalid fields should be reported at once."""
+        field_count = 10000
+        plan = ValidationPlan({f"field_{index}": int for index in range(field_count)})
+        plan.validate({f"field_{index}": index for index in range(field_count)})
+        with pytest.raises(ExceptionGroup) as exc_info:
+            plan.validate({"field_0": "0", "field_1": 1, "field_2": None, "field_3": 3.0, "unknown": "x"})
+        assert [str(error) for error in exc_info.value.exceptions] == [
+            "Field 'field_0' expected int, got str",
+            "Field 'field_3' expected int, got float",
+        ]
+
+    def test_disabled_when_only_file_path(self) -> None:
+        """Validation should be skipped when only FILE_PATH is in type hints."""
+        ValidationPlan({"FILE_PATH": str}).validate({"FILE_PATH": 1})
+
+    def test_get_validation_plan(self) -> None:
+        """Validation plan should be compiled once per class."""
+        plan = get_validation_plan(SimpleTestConfig)
+        assert get_validation_plan(SimpleTestConfig) is plan
+        assert plan.checks["name"] is str
+        assert plan.checks["age"] is int
@@ -0,0 +1,192 @@
+"""Tests for watcher.py."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+
+import pytest
+import yaml
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.watcher import ConfigWatcher
+from yamldataclassconfig.watcher import InotifyBackend
+from yamldataclassconfig.watcher import PollingBackend
+from yamldataclassconfig.watcher import load_libc
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BACKENDS = ["polling", pytest.param("inotify", marks=pytest.mark.skipif(load_libc() is None, reason="Linux only"))]
+
+
+@dataclass
+class WatchedConfig(YamlDataClassConfig):
+    """Config class to reload."""
+
+    name: str
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    """Wait until predicate returns True."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def create_watcher(
+    config: WatchedConfig,
+    path: Path,
+    backend: str,
+    on_error: Optional[Callable[[BaseException], Any]] = None,  # noqa: UP045  # Reason: Ruff's bug
+) -> ConfigWatcher:
+    """Create watcher which reacts quickly."""
+    return ConfigWatcher(
+        config,
+        path,
+        path_is_absolute=True,
+        backend=backend,
+        debounce=0.05,
+        poll_interval=0.01,
+        on_error=on_error,
+    )
+
+
+class TestConfigWatcher:
+    """Tests for ConfigWatcher."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: old\n"])
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_reload_on_write(temporary_yaml_file: Path, backend: str) -> None:
+        """Config should be reloaded when the file is rewritten."""
+        config = WatchedConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        with create_watcher(config, temporary_yaml_file, backend):
+            temporary_yaml_file.write_text("name: new file\n")
+            assert wait_until(lambda: config.name == "new file")
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: old\n"])
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_reload_on_rename(temporary_yaml_file: Path, backend: str) -> None:
+        """Config should be reloaded when another file is renamed over the file like editors do."""
+        config = WatchedConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        with create_watcher(config, temporary_yaml_file, backend):
+            temporary = temporary_yaml_file.with_name("temp.yml.swp")
+            temporary.write_text("name: renamed\n")
+            temporary.replace(temporary_yaml_file)
+            assert wait_until(lambda: config.name == "renamed")
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: old\n"])
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_keep_on_error(temporary_yaml_file: Path, backend: str) -> None:
+        """Config should keep the last values and error should be passed to on_error when reload fails."""
+        config = WatchedConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        errors: List[BaseException] = []  # noqa: UP006  # Reason: Ruff's bug
+        with create_watcher(config, temporary_yaml_file, backend, on_error=errors.append) as watcher:
+            temporary_yaml_file.write_text("name: [invalid\n")
+            assert wait_until(lambda: len(errors) > 0)
+            assert isinstance(errors[0], yaml.YAMLError)
+            assert config.name == "old"
+            assert watcher.is_alive
+        assert not watcher.is_alive
+
+    @staticmethod
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_reload_with_load_options(tmp_path: Path, backend: str) -> None:
+        """Reload should reuse overlays and options of the last load and watch the overlays as well."""
+        base = tmp_path / "config.yml"
+        base.write_text("name: base\n")
+        overlay = tmp_path / "overlay" / "local.yml"
+        overlay.parent.mkdir()
+        overlay.write_text("name: overlay\n")
+        config = WatchedConfig.create()
+        config.load(base, path_is_absolute=True, overlays=[overlay], yaml_backend="safe", deserializer="generated")
+        with create_watcher(config, base, backend) as watcher:
+            assert watcher.options == ((base, overlay), "safe", "generated")
+            overlay.write_text("name: overlay changed\n")
+            assert wait_until(lambda: config.name == "overlay changed")
+            base.write_text("name: base changed\n")
+            time.sleep(0.2)
+            assert config.name == "overlay changed"
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: old\n"])
+    def test_other_path_uses_defaults(temporary_yaml_file: Path, tmp_path: Path) -> None:
+        """Watcher of a file other than the last loaded one should load it with options of the class."""
+        overlay = tmp_path / "overlay.yml"
+        overlay.write_text("name: overlay\n")
+        config = WatchedConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True, overlays=[overlay], deserializer="generated")
+        other = tmp_path / "other.yml"
+        watcher = ConfigWatcher(config, other, path_is_absolute=True)
+        assert watcher.options == ((other,), WatchedConfig.YAML_BACKEND, WatchedConfig.DESERIALIZER)
+        assert ConfigWatcher(config).options.paths == (temporary_yaml_file, overlay)
+
+    @staticmethod
+    @pytest.mark.skipif(load_libc() is None, reason="Linux only")
+    @pytest.mark.parametrize("content", ["name: old\n"])
+    def test_stop_timeout(temporary_yaml_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """File descriptors should be closed only after the thread exits even when stop() timed out."""
+        config = WatchedConfig.create()
+        config.load(temporary_yaml_file, path_is_absolute=True)
+        watcher = create_watcher(config, temporary_yaml_file, "inotify")
+        reloading = threading.Event()
+        release = threading.Event()
+
+        def reload() -> None:
+            reloading.set()
+            release.wait()
+
+        monkeypatch.setattr(watcher, "reload", reload)
+        watcher.start()
+        backend = watcher._backend  # noqa: SLF001  # pylint: disable=protected-access
+        assert isinstance(backend, InotifyBackend)
+        temporary_yaml_file.write_text("name: new file\n")
+        assert reloading.wait(5)
+        watcher.stop(0.01)
+        assert watcher.is_alive
+        os.fstat(backend.fd)
+        release.set()
+        watcher.stop()
+        assert not watcher.is_alive
+        assert backend.closed
+
+    @staticmethod
+    @pytest.mark.skipif(load_libc() is None, reason="Linux only")
+    def test_fallback_to_polling(tmp_path: Path) -> None:
+        """Auto backend should fall back to polling when inotify fails and inotify backend should raise."""
+        path = tmp_path / "missing" / "config.yml"
+        with create_watcher(WatchedConfig.create(), path, "auto") as watcher:
+            assert isinstance(watcher._backend, PollingBackend)  # noqa: SLF001  # pylint: disable=protected-access
+        with pytest.raises(FileNotFoundError):
+            create_watcher(WatchedConfig.create(), path, "inotify").start()
+
+    @staticmethod
+    def test_unknown_backend() -> None:
+        """ValueError should be raised for unknown backend."""
+        with pytest.raises(ValueError, match="Unknown watcher backend 'unknown'"):
+            ConfigWatcher(WatchedConfig.create(), backend="unknown")
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: old\n"])
+    def test_start_twice(temporary_yaml_file: Path) -> None:
+        """RuntimeError should be raised when the watcher is already started."""
+        with create_watcher(WatchedConfig.create(), temporary_yaml_file, "polling") as watcher, pytest.raises(
+            RuntimeError,
+        ):
+            watcher.start()
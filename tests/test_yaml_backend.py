@@ -0,0 +1,104 @@
+"""Tests for yaml_backend.py."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+import pytest
+import yaml
+
+from yamldataclassconfig.config import YamlDataClassConfig
+from yamldataclassconfig.yaml_backend import DEFAULT_YAML_BACKEND
+from yamldataclassconfig.yaml_backend import get_yaml_backend
+from yamldataclassconfig.yaml_backend import register_yaml_backend
+from yamldataclassconfig.yaml_backend import yaml_backend_names
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class SafeBackendConfig(YamlDataClassConfig):
+    """Config class which selects backend by class variable."""
+
+    YAML_BACKEND: ClassVar[str] = "safe"
+
+    name: str
+
+
+class TestYamlBackend:
+    """Tests for YAML parser backend registry."""
+
+    @staticmethod
+    def test_builtin_backends() -> None:
+        """Built-in backends should be registered."""
+        assert {"auto", "c_full", "c_safe", "full", "safe"} <= set(yaml_backend_names())
+        assert get_yaml_backend("full").loader is yaml.FullLoader
+        assert get_yaml_backend("safe").loader is yaml.SafeLoader
+
+    @staticmethod
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML is built without libyaml")
+    def test_libyaml_backends() -> None:
+        """Backends prefixed by c_ and default backend should use libyaml when it is available."""
+        assert get_yaml_backend("c_full").is_libyaml
+        assert get_yaml_backend("c_safe").is_libyaml
+        assert get_yaml_backend(DEFAULT_YAML_BACKEND).is_libyaml
+        assert not get_yaml_backend("full").is_libyaml
+
+    @staticmethod
+    def test_fallback_to_first_available_loader() -> None:
+        """Loader which is None should be skipped."""
+        backend = register_yaml_backend("test_fallback", None, yaml.SafeLoader)
+        assert backend.loader is yaml.SafeLoader
+        assert get_yaml_backend("test_fallback") is backend
+
+    @staticmethod
+    def test_no_available_loader() -> None:
+        """ValueError should be raised when no loader is available."""
+        with pytest.raises(ValueError, match="No loader is available for YAML backend 'test_none'"):
+            register_yaml_backend("test_none", None)
+
+    @staticmethod
+    def test_unknown_backend() -> None:
+        """ValueError should be raised for unknown backend."""
+        with pytest.raises(ValueError, match="Unknown YAML backend 'unknown'"):
+            get_yaml_backend("unknown")
+
+    @staticmethod
+    @pytest.mark.parametrize("name", ["auto", "c_full", "c_safe", "full", "safe"])
+    def test_load(name: str) -> None:
+        """Every built-in backend should parse the same document."""
+        backend = get_yaml_backend(name)
+        assert backend.load("a: 1\nb: [x, y]\n") == {"a": 1, "b": ["x", "y"]}
+        assert list(backend.load_all("a: 1\n---\na: 2\n")) == [{"a": 1}, {"a": 2}]
+
+
+class TestLoadWithYamlBackend:
+    """Tests for selecting YAML parser backend on load."""
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    @pytest.mark.parametrize("name", ["full", "c_safe"])
+    def test_select_per_call(temporary_yaml_file: Path, name: str) -> None:
+        """Backend specified by argument should be used."""
+        config = SafeBackendConfig.create()
+        config.load(temporary_yaml_file, yaml_backend=name)
+        assert config.name == "test"
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: !!python/name:os.system\n"])
+    def test_select_per_class(temporary_yaml_file: Path) -> None:
+        """Backend specified by class variable should be used."""
+        config = SafeBackendConfig.create()
+        with pytest.raises(yaml.constructor.ConstructorError):
+            config.load(temporary_yaml_file)
+
+    @staticmethod
+    @pytest.mark.parametrize("content", ["name: test\n"])
+    def test_unknown_backend(temporary_yaml_file: Path) -> None:
+        """ValueError should be raised for unknown backend."""
+        config = SafeBackendConfig.create()
+        with pytest.raises(ValueError, match="Unknown YAML backend 'unknown'"):
+            config.load(temporary_yaml_file, yaml_backend="unknown")
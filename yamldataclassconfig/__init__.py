@@ -1,21 +1,85 @@
-"""This module implements helpers to import config file writen by YAML to Python Data Classes."""
+"""This module implements helpers to import config file writen by YAML to Python Data Classes.
+
+Submodules are imported on the first access to their attributes, so that `import yamldataclassconfig` doesn't import
+heavy dependencies like PyYAML, dataclasses-json and marshmallow until they are used.
+"""
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
 from typing import List
 
-# Reason: ExceptionGroup is only available in Python 3.11+.
-from yamldataclassconfig.config import *  # noqa: F403  # pylint: disable=redefined-builtin
-from yamldataclassconfig.nullable import *  # noqa: F403
-from yamldataclassconfig.type_defaults import *  # noqa: F403
-from yamldataclassconfig.utility import *  # noqa: F403
+if TYPE_CHECKING:
+    from yamldataclassconfig.bulk import *  # noqa: F403
+    from yamldataclassconfig.config import *  # noqa: F403  # pylint: disable=redefined-builtin
+    from yamldataclassconfig.disk_cache import *  # noqa: F403
+    from yamldataclassconfig.instrumentation import *  # noqa: F403
+    from yamldataclassconfig.metrics import *  # noqa: F403
+    from yamldataclassconfig.nullable import *  # noqa: F403
+    from yamldataclassconfig.schema_cache import *  # noqa: F403
+    from yamldataclassconfig.snapshot import *  # noqa: F403
+    from yamldataclassconfig.subscription import *  # noqa: F403
+    from yamldataclassconfig.type_defaults import *  # noqa: F403
+    from yamldataclassconfig.utility import *  # noqa: F403
+    from yamldataclassconfig.watcher import *  # noqa: F403
+    from yamldataclassconfig.yaml_backend import *  # noqa: F403
 
 __version__ = "2.0.5"
 
+# Submodule which defines each exported name, keep in sync with __all__ of submodules
+# Reason: Ruff's bug
+_EXPORTS: Dict[str, str] = {  # noqa: UP006
+    "LOAD_EXECUTORS": "bulk",
+    "YamlDataClassConfig": "config",
+    "clear_disk_cache": "disk_cache",
+    "LOAD_PHASES": "instrumentation",
+    "LoadPhaseEvent": "instrumentation",
+    "add_load_listener": "instrumentation",
+    "remove_load_listener": "instrumentation",
+    "DEFAULT_DURATION_BUCKETS": "metrics",
+    "MetricsRegistry": "metrics",
+    "is_nullable_type": "nullable",
+    "SchemaCacheInfo": "schema_cache",
+    "clear_schema_cache": "schema_cache",
+    "schema_cache_info": "schema_cache",
+    "ConfigSnapshot": "snapshot",
+    "FieldChange": "subscription",
+    "Subscription": "subscription",
+    "get_default_for_type": "type_defaults",
+    "build_path": "utility",
+    "create_file_path_field": "utility",
+    "WATCHER_BACKENDS": "watcher",
+    "ConfigWatcher": "watcher",
+    "DEFAULT_YAML_BACKEND": "yaml_backend",
+    "YamlBackend": "yaml_backend",
+    "get_yaml_backend": "yaml_backend",
+    "register_yaml_backend": "yaml_backend",
+    "yaml_backend_names": "yaml_backend",
+}
+
+_SUBMODULES = frozenset(_EXPORTS.values())
+
+# Reason: Ruff's bug
+__all__: List[str] = list(_EXPORTS)  # noqa: UP006  # pylint: disable=undefined-all-variable
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import submodule which defines the name on the first access (PEP 562)."""
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    # Cache so that later access doesn't call this function
+    globals()[name] = value
+    return value
+
+
 # Reason: Ruff's bug
-__all__: List[str] = []  # noqa: UP006
-# pylint: disable=undefined-variable
-__all__ += config.__all__  # type: ignore[name-defined]  # noqa: F405
-__all__ += nullable.__all__  # type: ignore[name-defined]  # noqa: F405
-__all__ += type_defaults.__all__  # type: ignore[name-defined]  # noqa: F405
-__all__ += utility.__all__  # type: ignore[name-defined]  # noqa: F405
+def __dir__() -> List[str]:  # noqa: UP006
+    return sorted({*globals(), *_EXPORTS})
@@ -0,0 +1,174 @@
+"""Concurrent loading of many config files into instances of the same config class.
+
+With the thread executor, each file is loaded by load() of a new instance in a worker thread, which overlaps reading
+files. With the process executor, reading, parsing and validating run in worker processes so that they scale with the
+number of cores, and only deserializing into instances runs in the calling process since instances are not shared
+between processes. While any load listener is registered, events of stamp, parse and validate phases in worker
+processes are recorded and replayed in the calling process before deserializing, so metrics cover both executors.
+"""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+from typing import Union
+from typing import cast
+
+from yamldataclassconfig.change_detection import FileStamp
+from yamldataclassconfig.exceptions import ConfigLoadError
+from yamldataclassconfig.instrumentation import RecordedCall
+from yamldataclassconfig.instrumentation import is_observed
+from yamldataclassconfig.instrumentation import phase
+from yamldataclassconfig.instrumentation import record
+from yamldataclassconfig.instrumentation import replay
+from yamldataclassconfig.utility import open_config_file
+from yamldataclassconfig.utility import resolve_path
+from yamldataclassconfig.validation import get_validation_plan
+from yamldataclassconfig.yaml_backend import get_yaml_backend
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from yamldataclassconfig.config import YamlDataClassConfig
+
+# Reason: ExceptionGroup is only available in Python 3.11+.
+if sys.version_info < (3, 11):  # pragma nocover
+    # pylint: disable-next=import-error,redefined-builtin
+    from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
+
+__all__ = ["LOAD_EXECUTORS"]
+
+LOAD_EXECUTORS = ("thread", "process")
+
+T = TypeVar("T", bound="YamlDataClassConfig")
+
+
+# Reason: Ruff's bug
+def parse_and_validate(
+    cls: Type[YamlDataClassConfig],  # noqa: UP006
+    path: Path,
+    yaml_backend: str,
+) -> Tuple[FileStamp, Dict[str, Any]]:  # noqa: UP006
+    """Stamp, read, parse and validate the file in worker process."""
+    # Take stamp before reading so that a change during loading is detected on the next load
+    with phase("stamp", cls, path) as observed:
+        stamp = FileStamp.of(path, content_hash=cls.CONTENT_HASH)
+        # New instance has no last load to compare with
+        observed.hit = False
+    with phase("parse", cls, path, stamp.size), open_config_file(path, cls.MAX_FILE_SIZE) as file:
+        dictionary_config = get_yaml_backend(yaml_backend).load(file)
+    with phase("validate", cls, path, stamp.size):
+        get_validation_plan(cls).validate(dictionary_config)
+    return stamp, cast("Dict[str, Any]", dictionary_config)
+
+
+# Reason: Ruff's bug
+def parse_in_worker(
+    cls: Type[YamlDataClassConfig],  # noqa: UP006
+    path: Path,
+    yaml_backend: str,
+    *,
+    observed: bool,
+) -> RecordedCall:
+    """Run parse_and_validate() in worker process, recording its phases when the calling process observes loading."""
+    if not observed:
+        return RecordedCall((), parse_and_validate(cls, path, yaml_backend))
+    return record(parse_and_validate, cls, path, yaml_backend)
+
+
+# Reason: Ruff's bug
+def load_one(cls: Type[T], path: Path, yaml_backend: str, deserializer: str) -> T:  # noqa: UP006
+    """Load the file into new instance in worker thread."""
+    config = cls.create()
+    config.load(path, path_is_absolute=True, yaml_backend=yaml_backend, deserializer=deserializer)
+    return config
+
+
+# Reason: Ruff's bug
+def load_many(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+    cls: Type[T],  # noqa: UP006
+    paths: Iterable[Union[Path, str]],  # noqa: UP007
+    *,
+    path_is_absolute: bool,
+    yaml_backend: str,
+    deserializer: str,
+    executor: str,
+    max_workers: Optional[int],  # noqa: UP045
+) -> Dict[Union[Path, str], T]:  # noqa: UP006,UP007
+    """Load files concurrently, see YamlDataClassConfig.load_many()."""
+    if executor not in LOAD_EXECUTORS:
+        msg = f"Unknown load executor '{executor}'. Available executors: {', '.join(LOAD_EXECUTORS)}"
+        raise ValueError(msg)
+    # Reason: Ruff's bug
+    items: Dict[Union[Path, str], Path] = {  # noqa: UP006,UP007
+        path: resolve_path(path, path_is_absolute=path_is_absolute) for path in paths
+    }
+    if not items:
+        return {}
+    # Install descriptors before worker threads create instances
+    cls._install_property_descriptors()  # pylint: disable=protected-access
+    pool: Executor
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers) as pool:
+            loaded = {
+                path: pool.submit(load_one, cls, resolved, yaml_backend, deserializer)
+                for path, resolved in items.items()
+            }
+            return collect(loaded, lambda _, config: config)
+    observed = is_observed()
+    with ProcessPoolExecutor(max_workers) as pool:
+        parsed = {
+            path: pool.submit(parse_in_worker, cls, resolved, yaml_backend, observed=observed)
+            for path, resolved in items.items()
+        }
+
+        def apply(_: Union[Path, str], recorded: RecordedCall) -> T:  # noqa: UP007  # Reason: Ruff's bug
+            replay(recorded.events)
+            if recorded.error is not None:
+                raise recorded.error
+            stamp, dictionary_config = recorded.result
+            config = cls.create()
+            # pylint: disable-next=protected-access
+            config._apply_parsed(dictionary_config, stamp, yaml_backend, deserializer)  # noqa: SLF001
+            return config
+
+        return collect(parsed, apply)
+
+
+# Reason: Ruff's bug
+def collect(
+    futures: Dict[Union[Path, str], Future[Any]],  # noqa: UP006,UP007
+    finish: Callable[[Union[Path, str], Any], T],  # noqa: UP007
+) -> Dict[Union[Path, str], T]:  # noqa: UP006,UP007
+    """Finish results in order of paths, raising errors of all failed paths at once after all paths finished."""
+    results = {}
+    errors = []
+    for path, future in futures.items():
+        try:
+            results[path] = finish(path, future.result())
+        # Reason: Any error of each path is reported by ExceptionGroup.
+        except Exception as error:  # noqa: BLE001,PERF203  # pylint: disable=broad-exception-caught
+            errors.append(create_load_error(path, error))
+    if errors:
+        group_msg = f"Failed to load {len(errors)} of {len(futures)} config files"
+        raise ExceptionGroup(group_msg, errors)
+    return results
+
+
+# Reason: Ruff's bug
+def create_load_error(path: Union[Path, str], error: BaseException) -> ConfigLoadError:  # noqa: UP007
+    load_error = ConfigLoadError(path)
+    load_error.__cause__ = error
+    return load_error
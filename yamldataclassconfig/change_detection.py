@@ -0,0 +1,84 @@
+"""Detection of config file changes between loads."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["FileStamp", "LayerStamps", "LoadOptions"]
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Hash content of the file without reading whole of it into memory at once."""
+    import hashlib  # noqa: PLC0415  # pylint: disable=import-outside-toplevel  # Reason: Only CONTENT_HASH needs it.
+
+    digest = hashlib.blake2b()
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileStamp(NamedTuple):
+    """Identity of a config file's content at the time it was loaded."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    # Reason: Ruff's bug
+    digest: Optional[str] = None  # noqa: UP045
+
+    @classmethod
+    def of(cls, path: Path, *, content_hash: bool = False) -> FileStamp:
+        """Take stamp of the file, hashing its content only when content_hash is True."""
+        stat = path.stat()
+        return cls(str(path), stat.st_mtime_ns, stat.st_size, hash_file(path) if content_hash else None)
+
+    def matches(self, other: FileStamp) -> bool:
+        """Return True if both stamps are considered to indicate the same content.
+
+        When both stamps have digest, the digest takes precedence over mtime, so that touching the file without
+        changing its content doesn't cause reload and rewriting it within the mtime resolution still does.
+        """
+        if self.path != other.path or self.size != other.size:
+            return False
+        if self.digest is not None and other.digest is not None:
+            return self.digest == other.digest
+        return self.mtime_ns == other.mtime_ns
+
+
+class LayerStamps(Tuple[FileStamp, ...]):
+    """Stamps of layered config files in order of merging."""
+
+    __slots__ = ()
+
+    @property
+    def path(self) -> str:
+        """Path to the first layer, that is, the base config file."""
+        return self[0].path
+
+    @property
+    def size(self) -> int:
+        """Total size of layers."""
+        return sum(stamp.size for stamp in self)
+
+    def matches(self, other: LayerStamps) -> bool:
+        """Return True if each layer is considered to have the same content."""
+        return len(self) == len(other) and all(stamp.matches(other_stamp) for stamp, other_stamp in zip(self, other))
+
+
+class LoadOptions(NamedTuple):
+    """Options of the last load() which ConfigWatcher reuses to reload."""
+
+    # Paths of the file and the overlays in order of merging
+    # Reason: Ruff's bug
+    paths: Tuple[Path, ...]  # noqa: UP006
+    yaml_backend: str
+    deserializer: str
@@ -7,28 +7,55 @@ from dataclasses import dataclass
 from dataclasses import field
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
+from typing import ClassVar
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 from typing import cast
-from typing import get_type_hints
 
-import yaml
 from dataclasses_json import DataClassJsonMixin
 from marshmallow import fields
 
+from yamldataclassconfig.change_detection import FileStamp
+from yamldataclassconfig.change_detection import LayerStamps
+from yamldataclassconfig.change_detection import LoadOptions
 from yamldataclassconfig.config_property import create_property_descriptors
 from yamldataclassconfig.config_property import set_deserialization_context
+from yamldataclassconfig.deserializer import DEFAULT_DESERIALIZER
+from yamldataclassconfig.deserializer import deserialize
+from yamldataclassconfig.exceptions import ConfigNotLoadedError
 from yamldataclassconfig.factory import KeyArguments
+from yamldataclassconfig.fast_access import FAST_ACCESS_BASE
+from yamldataclassconfig.fast_access import config_class_of
+from yamldataclassconfig.fast_access import fast_access_class
 from yamldataclassconfig.field_processor import apply_automatic_defaults
+from yamldataclassconfig.instrumentation import phase
+from yamldataclassconfig.lazy_section import deserialize_lazily
+from yamldataclassconfig.snapshot import create_snapshot
+from yamldataclassconfig.snapshot import snapshot_fields
+from yamldataclassconfig.subscription import Subscription
+from yamldataclassconfig.subscription import notify
 from yamldataclassconfig.utility import build_path
+from yamldataclassconfig.utility import open_config_file
 from yamldataclassconfig.utility import resolve_path
-from yamldataclassconfig.validation import validate_config_if_needed
+from yamldataclassconfig.validation import get_validation_plan
+from yamldataclassconfig.yaml_backend import DEFAULT_YAML_BACKEND
+from yamldataclassconfig.yaml_backend import get_yaml_backend
 
 if TYPE_CHECKING:
     from pathlib import Path
     from typing import Self
 
+    from yamldataclassconfig.snapshot import ConfigSnapshot
+    from yamldataclassconfig.subscription import FieldChange
+
 __all__ = [
     "YamlDataClassConfig",
 ]
@@ -56,6 +83,32 @@ class YamlDataClassConfig(DataClassJsonMixin, metaclass=ABCMeta):
         init=False,
         metadata={"dataclasses_json": {"mm_field": fields.Boolean()}},
     )
+    # Name of YAML parser backend registered in yamldataclassconfig.yaml_backend
+    YAML_BACKEND: ClassVar[str] = DEFAULT_YAML_BACKEND
+    # "marshmallow" or "generated", see yamldataclassconfig.deserializer
+    DESERIALIZER: ClassVar[str] = DEFAULT_DESERIALIZER
+    # Compare content hash in addition to path and size to detect unchanged config file on load()
+    CONTENT_HASH: ClassVar[bool] = False
+    # Publish loaded values as an immutable snapshot by single reference swap instead of updating them one by one
+    SNAPSHOT: ClassVar[bool] = False
+    # Read fields of loaded instance as fast as plain dataclass, see yamldataclassconfig.fast_access
+    FAST_ACCESS: ClassVar[bool] = False
+    # Deserialize nested sections on the first access to them, see yamldataclassconfig.lazy_section
+    LAZY_SECTIONS: ClassVar[bool] = False
+    # Maximum size of config file in bytes, ConfigFileTooLargeError is raised for larger file, unlimited when None
+    # Reason: Ruff's bug
+    MAX_FILE_SIZE: ClassVar[Optional[int]] = None  # noqa: UP045
+    # Directory of on-disk cache of deserialized values which load() reuses for the same content and schema,
+    # see yamldataclassconfig.disk_cache
+    # Reason: Ruff's bug
+    CACHE_DIR: ClassVar[Optional[str]] = None  # noqa: UP045
+    # Prefix of environment variables which override loaded values, disabled when None,
+    # see yamldataclassconfig.env_override
+    # Reason: Ruff's bug
+    ENV_PREFIX: ClassVar[Optional[str]] = None  # noqa: UP045
+    # Deserialize only top-level fields whose parsed values changed since the last load on reload,
+    # see yamldataclassconfig.incremental
+    INCREMENTAL_RELOAD: ClassVar[bool] = False
 
     @classmethod
     # UP037: To support Python 3.10 or lower
@@ -78,6 +131,12 @@ class YamlDataClassConfig(DataClassJsonMixin, metaclass=ABCMeta):
     def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
         """Automatically add property validation and default values to subclasses."""
         super().__init_subclass__(**kwargs)
+        if FAST_ACCESS_BASE in cls.__dict__:
+            # Generated subclass for fast access shares fields with the config class which is already processed
+            return
+        if cls.FAST_ACCESS and cls.SNAPSHOT:
+            msg = f"FAST_ACCESS and SNAPSHOT of {cls.__name__} can't be enabled at the same time"
+            raise ValueError(msg)
 
         # Automatically apply defaults to prevent mypy positional argument warnings
         apply_automatic_defaults(cls)
@@ -87,26 +146,245 @@ class YamlDataClassConfig(DataClassJsonMixin, metaclass=ABCMeta):
         cls._needs_property_descriptors = True
 
     # Reason: Ruff's bug
-    def load(self, path: Optional[Union[Path, str]] = None, *, path_is_absolute: bool = False) -> None:  # noqa: UP007,UP045
+    def load(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        self,
+        path: Optional[Union[Path, str]] = None,  # noqa: UP007,UP045
+        *,
+        path_is_absolute: bool = False,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+        deserializer: Optional[str] = None,  # noqa: UP045
+        force: bool = False,
+        overlays: Sequence[Union[Path, str]] = (),  # noqa: UP007
+    ) -> None:
         """This method loads from YAML file to properties of self instance with validation.
 
         Why doesn't load when __init__ is to make the following requirements compatible:
         1. Access config as global
         2. Independent on config for development or use config for unit testing when unit testing
+
+        When the same file is loaded again with the same options and it has not changed since the last load,
+        this method returns without reading, parsing and validating it.
+        The file is considered unchanged when its path, size and mtime_ns are the same,
+        or when its path, size and content hash are the same if CONTENT_HASH is True.
+
+        When overlays are given, the file and the overlays are deep-merged in order as layers,
+        see yamldataclassconfig.layers. Only layers which changed since the last load are parsed again.
+        Layered loading doesn't use CACHE_DIR.
+
+        Args:
+            path: Path to YAML file, FILE_PATH is used when omitted
+            path_is_absolute: If True, use path as absolute
+            yaml_backend: Name of YAML parser backend, YAML_BACKEND is used when omitted
+            deserializer: Name of deserializer, DESERIALIZER is used when omitted
+            force: If True, load even if the file has not changed since the last load
+            overlays: Paths to YAML files merged over the file in order, later ones take precedence
         """
         # Install property descriptors on first load if not already done
         # This avoids conflicts with @dataclass decorator processing
-        if getattr(self.__class__, "_needs_property_descriptors", False):
-            create_property_descriptors(self.__class__)
-            self.__class__._needs_property_descriptors = False  # noqa: SLF001  # pylint: disable=protected-access
+        self._install_property_descriptors()
 
-        config_path = self._resolve_config_path(path, path_is_absolute=path_is_absolute)
-        dictionary_config = self._load_yaml_content(config_path)
+        cls = config_class_of(self)
+        with phase("resolve", cls, self.FILE_PATH if path is None else path):
+            config_path = self._resolve_config_path(path, path_is_absolute=path_is_absolute)
+            overlay_paths = [resolve_path(overlay, path_is_absolute=path_is_absolute) for overlay in overlays]
+            layer_paths = [config_path, *overlay_paths]
+        yaml_backend = self.YAML_BACKEND if yaml_backend is None else yaml_backend
+        deserializer = self.DESERIALIZER if deserializer is None else deserializer
+        self._load_options = LoadOptions(tuple(layer_paths), yaml_backend, deserializer)
+        if overlays:
+            self._load_layers(layer_paths, yaml_backend, deserializer, force=force)
+            return
+        # Take stamp before reading so that a change during loading is detected on the next load
+        with phase("stamp", cls, config_path) as observed:
+            stamp = FileStamp.of(config_path, content_hash=self.CONTENT_HASH)
+            unchanged = observed.hit = not force and self._is_unchanged(stamp, yaml_backend, deserializer)
+        if unchanged:
+            return
+        if self.CACHE_DIR is not None:
+            values = self._deserialize_through_disk_cache(config_path, stamp, yaml_backend, deserializer)
+            self._publish(values, stamp, yaml_backend, deserializer)
+            return
+        dictionary_config, changed = self._read_and_validate(config_path, yaml_backend, deserializer, stamp.size)
+        self._apply_parsed(dictionary_config, stamp, yaml_backend, deserializer, changed)
+
+    # Reason: Ruff's bug
+    async def aload(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        self,
+        path: Optional[Union[Path, str]] = None,  # noqa: UP007,UP045
+        *,
+        path_is_absolute: bool = False,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+        deserializer: Optional[str] = None,  # noqa: UP045
+        force: bool = False,
+        timeout: Optional[float] = None,  # noqa: UP045
+    ) -> None:
+        """Load like load() without blocking the event loop.
+
+        Reading, parsing, validating and deserializing run in the default executor of the running loop, and only
+        applying the deserialized values runs on the loop. Since values are applied at once after all blocking stages,
+        the instance keeps the values of the last load when this coroutine is cancelled or times out.
+
+        Args:
+            path: Path to YAML file, FILE_PATH is used when omitted
+            path_is_absolute: If True, use path as absolute
+            yaml_backend: Name of YAML parser backend, YAML_BACKEND is used when omitted
+            deserializer: Name of deserializer, DESERIALIZER is used when omitted
+            force: If True, load even if the file has not changed since the last load
+            timeout: Seconds to wait for loading, asyncio.TimeoutError is raised when expired
+
+        Raises:
+            asyncio.TimeoutError: When timeout expires
+        """
+        import asyncio  # noqa: PLC0415  # pylint: disable=import-outside-toplevel  # Reason: Only aload() needs it.
 
-        type_hints = get_type_hints(self.__class__)
-        validate_config_if_needed(dictionary_config, type_hints)
+        self._install_property_descriptors()
+        cls = config_class_of(self)
+        with phase("resolve", cls, self.FILE_PATH if path is None else path):
+            config_path = self._resolve_config_path(path, path_is_absolute=path_is_absolute)
+        yaml_backend = self.YAML_BACKEND if yaml_backend is None else yaml_backend
+        deserializer = self.DESERIALIZER if deserializer is None else deserializer
+        self._load_options = LoadOptions((config_path,), yaml_backend, deserializer)
+        loop = asyncio.get_running_loop()
 
-        self._load_and_apply_config(dictionary_config)
+        # Reason: Ruff's bug
+        def take_stamp() -> Tuple[FileStamp, bool]:  # noqa: UP006
+            with phase("stamp", cls, config_path) as observed:
+                stamp = FileStamp.of(config_path, content_hash=self.CONTENT_HASH)
+                unchanged = observed.hit = not force and self._is_unchanged(stamp, yaml_backend, deserializer)
+            return stamp, unchanged
+
+        async def load_stages() -> None:
+            stamp, unchanged = await loop.run_in_executor(None, take_stamp)
+            if unchanged:
+                return
+            if self.CACHE_DIR is not None:
+                arguments = (config_path, stamp, yaml_backend, deserializer)
+                values = await loop.run_in_executor(None, self._deserialize_through_disk_cache, *arguments)
+                self._publish(values, stamp, yaml_backend, deserializer)
+                return
+            reading = (config_path, yaml_backend, deserializer, stamp.size)
+            dictionary_config, changed = await loop.run_in_executor(None, self._read_and_validate, *reading)
+            parsed = (dictionary_config, stamp, yaml_backend, deserializer, changed)
+            values = await loop.run_in_executor(None, self._deserialize_parsed, *parsed)
+            self._publish(values, stamp, yaml_backend, deserializer, dictionary_config)
+
+        await asyncio.wait_for(load_stages(), timeout)
+
+    @classmethod
+    # Reason: Ruff's bug
+    def load_snapshot(
+        cls,
+        path: Optional[Union[Path, str]] = None,  # noqa: UP007,UP045
+        *,
+        path_is_absolute: bool = False,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+        deserializer: Optional[str] = None,  # noqa: UP045
+    ) -> ConfigSnapshot:
+        """Load YAML file into compact snapshot without keeping config instance.
+
+        The snapshot is a tuple which stores each value once and has neither instance dictionary nor state of loading,
+        so it is suitable for keeping a large number of configs in memory, for example, one per tenant.
+
+        Args:
+            path: Path to YAML file, FILE_PATH is used when omitted
+            path_is_absolute: If True, use path as absolute
+            yaml_backend: Name of YAML parser backend, YAML_BACKEND is used when omitted
+            deserializer: Name of deserializer, DESERIALIZER is used when omitted
+        """
+        config = cls.create()
+        config.load(path, path_is_absolute=path_is_absolute, yaml_backend=yaml_backend, deserializer=deserializer)
+        return config.snapshot()
+
+    @classmethod
+    # Reason: Ruff's bug
+    def load_all(
+        cls,
+        path: Optional[Union[Path, str]] = None,  # noqa: UP007,UP045
+        *,
+        path_is_absolute: bool = False,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+        deserializer: Optional[str] = None,  # noqa: UP045
+    ) -> Iterator["Self"]:  # noqa: UP037
+        """Load each document of multi-document YAML file into new instance lazily.
+
+        Documents are parsed one by one from the file as the iterator advances, so memory stays flat however many
+        documents the file has. Empty documents are skipped. The file is closed when the iterator is exhausted or
+        closed.
+
+        Args:
+            path: Path to YAML file, FILE_PATH is used when omitted
+            path_is_absolute: If True, use path as absolute
+            yaml_backend: Name of YAML parser backend, YAML_BACKEND is used when omitted
+            deserializer: Name of deserializer, DESERIALIZER is used when omitted
+
+        Yields:
+            Loaded instance per document in order of the file
+        """
+        config_path = resolve_path(cls.FILE_PATH if path is None else path, path_is_absolute=path_is_absolute)
+        yaml_backend = cls.YAML_BACKEND if yaml_backend is None else yaml_backend
+        backend = get_yaml_backend(yaml_backend)
+        deserializer = cls.DESERIALIZER if deserializer is None else deserializer
+        cls._install_property_descriptors()
+        plan = get_validation_plan(cls)
+        with open_config_file(config_path, cls.MAX_FILE_SIZE) as file:
+            for dictionary_config in backend.load_all(file):
+                if dictionary_config is None:
+                    continue
+                plan.validate(dictionary_config)
+                config = cls.create()
+                # pylint: disable-next=protected-access
+                config._load_and_apply_config(  # noqa: SLF001
+                    dictionary_config,
+                    yaml_backend=yaml_backend,
+                    deserializer=deserializer,
+                )
+                yield config
+
+    @classmethod
+    # Reason: Ruff's bug
+    def load_many(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        cls,
+        paths: Iterable[Union[Path, str]],  # noqa: UP007
+        *,
+        path_is_absolute: bool = False,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+        deserializer: Optional[str] = None,  # noqa: UP045
+        executor: str = "thread",
+        max_workers: Optional[int] = None,  # noqa: UP045
+    ) -> Dict[Union[Path, str], "Self"]:  # noqa: UP006,UP007,UP037
+        """Load YAML files concurrently into new instances, one per file.
+
+        The thread executor overlaps reading files. The process executor reads, parses and validates files in worker
+        processes so that loading scales with the number of cores, which requires the config class to be picklable,
+        that is, defined at the top level of a module.
+
+        Args:
+            paths: Paths to YAML files
+            path_is_absolute: If True, use paths as absolute
+            yaml_backend: Name of YAML parser backend, YAML_BACKEND is used when omitted
+            deserializer: Name of deserializer, DESERIALIZER is used when omitted
+            executor: "thread" or "process"
+            max_workers: Number of workers, the default of concurrent.futures executors is used when omitted
+
+        Returns:
+            Loaded instances keyed by paths in the given order
+
+        Raises:
+            ExceptionGroup: ConfigLoadError of each failed path, whose __cause__ is the error, after all paths finished
+        """
+        # Reason: Only load_many() needs it.
+        # pylint: disable-next=import-outside-toplevel
+        from yamldataclassconfig import bulk  # noqa: PLC0415
+
+        return bulk.load_many(
+            cls,
+            paths,
+            path_is_absolute=path_is_absolute,
+            yaml_backend=cls.YAML_BACKEND if yaml_backend is None else yaml_backend,
+            deserializer=cls.DESERIALIZER if deserializer is None else deserializer,
+            executor=executor,
+            max_workers=max_workers,
+        )
 
     def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
         """Handle property access before descriptors are installed."""
@@ -122,12 +400,114 @@ class YamlDataClassConfig(DataClassJsonMixin, metaclass=ABCMeta):
             return super().__getattribute__(name)
 
         # Install descriptors on first property access if needed
-        if getattr(self.__class__, "_needs_property_descriptors", False):
-            create_property_descriptors(self.__class__)
-            self.__class__._needs_property_descriptors = False  # noqa: SLF001  # pylint: disable=protected-access
+        self._install_property_descriptors()
 
         return super().__getattribute__(name)
 
+    @classmethod
+    def _install_property_descriptors(cls) -> None:
+        """Install property descriptors unless they are already installed."""
+        if getattr(cls, "_needs_property_descriptors", False):
+            create_property_descriptors(cls)
+            cls._needs_property_descriptors = False
+
+    # Reason: Ruff's bug
+    def _is_unchanged(
+        self,
+        stamp: Union[FileStamp, LayerStamps],  # noqa: UP007
+        yaml_backend: str,
+        deserializer: str,
+    ) -> bool:
+        """Return True if the file or layers, options and environment overrides are unchanged since the last load."""
+        # Reason: Ruff's bug
+        last: Optional[Tuple[Union[FileStamp, LayerStamps], str, str, Dict[str, str]]]  # noqa: UP006,UP007,UP045
+        last = getattr(self, "_load_stamp", None)
+        if last is None or not self._loaded:
+            return False
+        last_stamp, last_yaml_backend, last_deserializer, last_env_overrides = last
+        if (
+            last_yaml_backend != yaml_backend
+            or last_deserializer != deserializer
+            or type(last_stamp) is not type(stamp)
+        ):
+            return False
+        return last_stamp.matches(stamp) and last_env_overrides == self._read_env_overrides()  # type: ignore[arg-type]
+
+    # Reason: Ruff's bug
+    def _remember_stamp(
+        self,
+        stamp: Union[FileStamp, LayerStamps],  # noqa: UP007
+        yaml_backend: str,
+        deserializer: str,
+        dictionary_config: Optional[Dict[str, Any]] = None,  # noqa: UP006,UP045
+    ) -> None:
+        """Remember what the last successful load depends on for change detection.
+
+        Parsed content is kept for INCREMENTAL_RELOAD, None makes the next load deserialize all fields.
+        """
+        self._load_stamp = (stamp, yaml_backend, deserializer, self._read_env_overrides())
+        if self.INCREMENTAL_RELOAD:
+            self._last_parsed = dictionary_config
+
+    # Reason: Ruff's bug
+    def _read_env_overrides(self) -> Dict[str, str]:  # noqa: UP006
+        """Return values of environment variables which override fields, empty when ENV_PREFIX is None."""
+        if self.ENV_PREFIX is None:
+            return {}
+        # Reason: Only ENV_PREFIX needs it.
+        # pylint: disable-next=import-outside-toplevel
+        from yamldataclassconfig import env_override  # noqa: PLC0415
+
+        return env_override.read_env_overrides(config_class_of(self), self.ENV_PREFIX)
+
+    # Reason: Ruff's bug
+    def subscribe(
+        self,
+        paths: Union[str, Iterable[str]],  # noqa: UP007
+        callback: Callable[[List[FieldChange]], Any],  # noqa: UP006
+    ) -> Subscription:
+        """Call the callback after each reload which changed values at any of the field paths.
+
+        The callback is called once per reload with FieldChange of only the changed paths, in order of the paths,
+        see yamldataclassconfig.subscription.
+
+        Args:
+            paths: Dotted path to a field or a field of nested section such as "database.host", or iterable of them
+            callback: Called with list of FieldChange which has the path, the old value and the new value
+
+        Returns:
+            Subscription to pass to unsubscribe()
+
+        Raises:
+            ValueError: When a path doesn't match fields of the config class and its sections
+        """
+        subscription = Subscription(config_class_of(self), (paths,) if isinstance(paths, str) else paths, callback)
+        # Replaced instead of modified, so that reload in another thread iterates a consistent tuple without lock
+        self._subscriptions = (*getattr(self, "_subscriptions", ()), subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop notifying the subscription, ValueError is raised when it is not subscribed."""
+        subscriptions = list(getattr(self, "_subscriptions", ()))
+        subscriptions.remove(subscription)
+        self._subscriptions = tuple(subscriptions)
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Return immutable values of fields which a reload doesn't change.
+
+        Read several fields from the snapshot to get a consistent view while another thread reloads the config.
+        When SNAPSHOT is True, this method returns the snapshot published by the last load without copying.
+        Otherwise, it copies current values of fields.
+        """
+        snapshot: Optional[ConfigSnapshot] = self.__dict__.get("_snapshot")  # noqa: UP045  # Reason: Ruff's bug
+        if snapshot is not None:
+            return snapshot
+        if not self._loaded:
+            msg = "Configuration must be loaded before taking snapshot. Call load() first."
+            raise ConfigNotLoadedError(msg)
+        cls = config_class_of(self)
+        return create_snapshot(cls, (getattr(self, name) for name in snapshot_fields(cls)))
+
     # Reason: Ruff's bug
     def _resolve_config_path(self, path: Optional[Union[Path, str]], *, path_is_absolute: bool) -> Path:  # noqa: UP007,UP045
         """Resolve the configuration file path."""
@@ -136,23 +516,312 @@ class YamlDataClassConfig(DataClassJsonMixin, metaclass=ABCMeta):
         return resolve_path(path, path_is_absolute=path_is_absolute)
 
     # Reason: Ruff's bug
-    def _load_yaml_content(self, config_path: Path) -> Dict[str, Any]:  # noqa: UP006
+    def _load_yaml_content(
+        self,
+        config_path: Path,
+        *,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+    ) -> Dict[str, Any]:  # noqa: UP006
         """Load YAML content from file."""
-        return cast("Dict[str, Any]", yaml.full_load(config_path.read_text(encoding="UTF-8")))
+        backend = get_yaml_backend(self.YAML_BACKEND if yaml_backend is None else yaml_backend)
+        with open_config_file(config_path, self.MAX_FILE_SIZE) as file:
+            return cast("Dict[str, Any]", backend.load(file))
+
+    # Reason: Ruff's bug
+    def _read_and_validate(
+        self,
+        config_path: Path,
+        yaml_backend: str,
+        deserializer: str,
+        size: Optional[int] = None,  # noqa: UP045
+    ) -> Tuple[Dict[str, Any], Optional[FrozenSet[str]]]:  # noqa: UP006,UP045
+        """Read, parse and validate YAML file without changing self, size is reported to load listeners.
+
+        Returns:
+            Parsed content and names of fields which changed since the last load, see _validate_changes()
+        """
+        with phase("parse", config_class_of(self), config_path, size):
+            dictionary_config = self._load_yaml_content(config_path, yaml_backend=yaml_backend)
+        return dictionary_config, self._validate_changes(dictionary_config, deserializer, config_path, size)
 
     # Reason: Ruff's bug
-    def _load_and_apply_config(self, dictionary_config: Dict[str, Any]) -> None:  # noqa: UP006
-        """Load configuration using marshmallow and apply to instance."""
+    def _validate_changes(
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        deserializer: str,
+        path: Union[Path, str],  # noqa: UP007
+        size: Optional[int],  # noqa: UP045
+    ) -> Optional[FrozenSet[str]]:  # noqa: UP006,UP045
+        """Validate fields which changed since the last load and return their names.
+
+        None is returned when all fields are loaded.
+        """
+        cls = config_class_of(self)
+        changed = None
+        if self.INCREMENTAL_RELOAD:
+            with phase("diff", cls, path, size):
+                changed = self._changed_fields(dictionary_config, deserializer)
+        with phase("validate", cls, path, size):
+            changes = dictionary_config if changed is None else {name: dictionary_config[name] for name in changed}
+            get_validation_plan(cls).validate(changes)
+        return changed
+
+    # Reason: Ruff's bug
+    def _changed_fields(
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        deserializer: str,
+    ) -> Optional[FrozenSet[str]]:  # noqa: UP006,UP045
+        """Return names of fields whose parsed values changed since the last load, None when all fields are loaded."""
+        # Reason: Only INCREMENTAL_RELOAD needs it.
+        # pylint: disable-next=import-outside-toplevel
+        from yamldataclassconfig import incremental  # noqa: PLC0415
+
+        # Reason: Ruff's bug
+        last_parsed: Optional[Dict[str, Any]]  # noqa: UP006,UP045
+        last_parsed = getattr(self, "_last_parsed", None)
+        if last_parsed is None or not self._loaded:
+            return None
+        _, _, last_deserializer, last_env_overrides = self._load_stamp
+        # Environment overrides are applied after parsing, so parsed values don't tell their changes
+        if last_deserializer != deserializer or last_env_overrides != self._read_env_overrides():
+            return None
+        return incremental.changed_fields(config_class_of(self), last_parsed, dictionary_config)
+
+    # Reason: Ruff's bug
+    def _apply_parsed(  # pylint: disable=too-many-arguments
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        stamp: Union[FileStamp, LayerStamps],  # noqa: UP007
+        yaml_backend: str,
+        deserializer: str,
+        changed: Optional[FrozenSet[str]] = None,  # noqa: UP006,UP045
+    ) -> None:
+        """Apply validated content of the file and remember the stamp for change detection."""
+        values = self._deserialize_parsed(dictionary_config, stamp, yaml_backend, deserializer, changed)
+        self._publish(values, stamp, yaml_backend, deserializer, dictionary_config)
+
+    # Reason: Ruff's bug
+    def _publish(  # pylint: disable=too-many-arguments
+        self,
+        values: Dict[str, Any],  # noqa: UP006
+        stamp: Union[FileStamp, LayerStamps],  # noqa: UP007
+        yaml_backend: str,
+        deserializer: str,
+        dictionary_config: Optional[Dict[str, Any]] = None,  # noqa: UP006,UP045
+    ) -> None:
+        """Apply deserialized values, remember the stamp for change detection and notify subscribers of changes."""
+        # Reason: Ruff's bug
+        subscriptions: Tuple[Subscription, ...] = getattr(self, "_subscriptions", ())  # noqa: UP006
+        previous = self.snapshot() if subscriptions and self._loaded else None
+        with phase("apply", config_class_of(self), stamp.path, stamp.size):
+            self._apply_values(values)
+            self._remember_stamp(stamp, yaml_backend, deserializer, dictionary_config)
+        if previous is not None:
+            notify(subscriptions, previous, self.snapshot())
+
+    # Reason: Ruff's bug
+    def _deserialize_parsed(
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        stamp: Union[FileStamp, LayerStamps],  # noqa: UP007
+        yaml_backend: str,
+        deserializer: str,
+        changed: Optional[FrozenSet[str]] = None,  # noqa: UP006,UP045
+    ) -> Dict[str, Any]:  # noqa: UP006
+        """Deserialize validated content of the file into values to apply without changing self.
+
+        When names of changed fields are given, only they are deserialized and current values of the other fields are
+        reused.
+        """
+        with phase("deserialize", config_class_of(self), stamp.path, stamp.size):
+            if changed is not None:
+                return self._deserialize_changes(dictionary_config, changed, yaml_backend, deserializer)
+            options = {"yaml_backend": yaml_backend, "deserializer": deserializer}
+            values: Dict[str, Any] = vars(self._deserialize_config(dictionary_config, **options))  # noqa: UP006
+            return values
+
+    # Reason: Ruff's bug
+    def _load_layers(
+        self,
+        paths: List[Path],  # noqa: UP006
+        yaml_backend: str,
+        deserializer: str,
+        *,
+        force: bool,
+    ) -> None:
+        """Deep-merge the files as layers and apply the result, parsing only layers which changed."""
+        # Reason: Only overlays need it.
+        # pylint: disable-next=import-outside-toplevel
+        from yamldataclassconfig import layers  # noqa: PLC0415
+
+        cls = config_class_of(self)
+        # Take stamps before reading so that a change during loading is detected on the next load
+        with phase("stamp", cls, paths[0]) as observed:
+            stamps = LayerStamps(FileStamp.of(path, content_hash=self.CONTENT_HASH) for path in paths)
+            unchanged = observed.hit = not force and self._is_unchanged(stamps, yaml_backend, deserializer)
+        if unchanged:
+            return
+        cache: Optional[layers.LayerCache] = getattr(self, "_layer_cache", None)  # noqa: UP045  # Reason: Ruff's bug
+        if cache is None:
+            cache = self._layer_cache = layers.LayerCache()
+        parsed = cache.parse_all(cls, stamps, yaml_backend, self.MAX_FILE_SIZE)
+        with phase("merge", cls, stamps.path, stamps.size):
+            dictionary_config = layers.merge_layers(parsed)
+        changed = self._validate_changes(dictionary_config, deserializer, stamps.path, stamps.size)
+        self._apply_parsed(dictionary_config, stamps, yaml_backend, deserializer, changed)
+
+    # Reason: Ruff's bug
+    def _deserialize_through_disk_cache(
+        self,
+        config_path: Path,
+        stamp: FileStamp,
+        yaml_backend: str,
+        deserializer: str,
+    ) -> Dict[str, Any]:  # noqa: UP006
+        """Return values cached for the content of the file, parsing and deserializing it only on cache miss."""
+        # Reason: Only CACHE_DIR needs it.
+        # pylint: disable-next=import-outside-toplevel
+        from yamldataclassconfig import disk_cache  # noqa: PLC0415
+
+        cls = config_class_of(self)
+        # Parse the same bytes as the key is computed from, so that a change during loading can't be cached wrongly
+        with phase("read", cls, config_path, stamp.size), open_config_file(config_path, self.MAX_FILE_SIZE) as file:
+            content = file.read()
+        cache = disk_cache.DiskCache(cast("str", self.CACHE_DIR))
+        key = disk_cache.cache_key(content, cls, yaml_backend, deserializer, self._read_env_overrides())
+        with phase("cache", cls, config_path, stamp.size) as observed:
+            values = cache.get(key)
+            observed.hit = values is not None
+        if values is None:
+            # Bytes are counted by read phase
+            with phase("parse", cls, config_path):
+                dictionary_config = cast("Dict[str, Any]", get_yaml_backend(yaml_backend).load(content))
+            with phase("validate", cls, config_path, stamp.size):
+                get_validation_plan(cls).validate(dictionary_config)
+            values = self._deserialize_parsed(dictionary_config, stamp, yaml_backend, deserializer)
+            cache.put(key, values)
+        return values
+
+    # Reason: Ruff's bug
+    def _load_and_apply_config(
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        *,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+        deserializer: Optional[str] = None,  # noqa: UP045
+    ) -> None:
+        """Deserialize configuration and apply to instance."""
+        instance = self._deserialize_config(dictionary_config, yaml_backend=yaml_backend, deserializer=deserializer)
+        self._apply_values(vars(instance))
+
+    # Reason: Ruff's bug
+    def _deserialize_config(
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        *,
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+        deserializer: Optional[str] = None,  # noqa: UP045
+    ) -> Any:  # noqa: ANN401
+        """Deserialize configuration into new instance without changing self."""
+        dictionary_config = self._override_by_env(dictionary_config, yaml_backend)
         # Set deserialization context to allow property descriptors to return defaults
         set_deserialization_context(value=True)
         try:
-            loaded_config = self.__class__.schema().load(dictionary_config)
+            name = self.DESERIALIZER if deserializer is None else deserializer
+            if self.LAZY_SECTIONS:
+                return deserialize_lazily(config_class_of(self), dictionary_config, name)
+            return deserialize(config_class_of(self), dictionary_config, name)
         finally:
             # Always reset the context, even if an exception occurs
             set_deserialization_context(value=False)
 
+    # Reason: Ruff's bug
+    def _deserialize_changes(
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        changed: FrozenSet[str],  # noqa: UP006
+        yaml_backend: str,
+        deserializer: str,
+    ) -> Dict[str, Any]:  # noqa: UP006
+        """Deserialize the changed fields and return values to apply, reusing current values of the other fields."""
+        # Reason: Only INCREMENTAL_RELOAD needs it.
+        # pylint: disable-next=import-outside-toplevel
+        from yamldataclassconfig import incremental  # noqa: PLC0415
+
+        cls = config_class_of(self)
+        dictionary_config = self._override_by_env(dictionary_config, yaml_backend)
+        set_deserialization_context(value=True)
+        try:
+            lazy = self.LAZY_SECTIONS
+            changes = incremental.deserialize_fields(cls, dictionary_config, changed, deserializer, lazy=lazy)
+        finally:
+            set_deserialization_context(value=False)
+        return incremental.merge_values(cls, self.snapshot(), changes)
+
+    # Reason: Ruff's bug
+    def _override_by_env(
+        self,
+        dictionary_config: Dict[str, Any],  # noqa: UP006
+        yaml_backend: Optional[str] = None,  # noqa: UP045
+    ) -> Dict[str, Any]:  # noqa: UP006
+        """Return parsed content overridden by environment variables, the content itself when ENV_PREFIX is None.
+
+        Values of the variables are parsed by the YAML backend, YAML_BACKEND is used when omitted.
+        """
+        if self.ENV_PREFIX is None:
+            return dictionary_config
+        # Reason: Only ENV_PREFIX needs it.
+        # pylint: disable-next=import-outside-toplevel
+        from yamldataclassconfig import env_override  # noqa: PLC0415
+
+        cls = config_class_of(self)
+        yaml_backend = self.YAML_BACKEND if yaml_backend is None else yaml_backend
+        return env_override.apply_env_overrides(cls, self.ENV_PREFIX, dictionary_config, yaml_backend)
+
+    # Reason: Ruff's bug
+    def _apply_values(self, values: Dict[str, Any]) -> None:  # noqa: UP006
+        """Apply values of deserialized instance to self."""
+        cls = config_class_of(self)
+        # Values of deserialized instance are stored by property descriptors since it is neither published nor switched
+        if self.SNAPSHOT:
+            names = snapshot_fields(cls)
+            self._snapshot = create_snapshot(cls, (values.get(f"__{name}", values.get(name)) for name in names))
+            self._loaded = True
+            # Values stored before load are no longer read, so each value is stored only in snapshot
+            for name in names:
+                self.__dict__.pop(f"__{name}", None)
+                self.__dict__.pop(name, None)
+            return
+        if self.FAST_ACCESS:
+            self._apply_for_fast_access(cls, values)
+            return
+
         # Set loaded flag first to prevent ConfigNotLoadedError during property access
         self._loaded = True
 
         # Update instance with loaded values
-        self.__dict__.update(loaded_config.__dict__)
+        self.__dict__.update(values)
+        # Values set by __init__() before property descriptors were installed are shadowed by the descriptors
+        for name in snapshot_fields(cls):
+            if f"__{name}" in self.__dict__:
+                self.__dict__.pop(name, None)
+
+    # Reason: Ruff's bug
+    def _apply_for_fast_access(self, cls: type, values: Dict[str, Any]) -> None:  # noqa: UP006
+        """Switch to the class which reads fields without descriptors and store values under field names.
+
+        Values are set by setattr() instead of through __dict__ since materializing instance dictionary makes attribute
+        access slower on CPython.
+        """
+        names = snapshot_fields(cls)
+        switched = self.__class__ is cls
+        if switched:
+            self.__class__ = fast_access_class(cls)
+        for name in names:
+            setattr(self, name, values.get(f"__{name}", values.get(name)))
+        self._loaded = True
+        if switched:
+            # Values stored by descriptors before load are no longer read
+            for name in (name for name in names if hasattr(self, f"__{name}")):
+                delattr(self, f"__{name}")
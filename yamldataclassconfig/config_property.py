@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
-import threading
+from contextvars import ContextVar
 from dataclasses import MISSING
-from dataclasses import Field
-from dataclasses import fields
+from dataclasses import is_dataclass
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Optional
 from typing import Type
 
 from yamldataclassconfig.exceptions import ConfigNotLoadedError
+from yamldataclassconfig.introspection import field_table
+from yamldataclassconfig.snapshot import snapshot_fields
 
-# Thread-local storage for deserialization context
-_local = threading.local()
+if TYPE_CHECKING:
+    from yamldataclassconfig.introspection import FieldEntry
+
+# Deserialization context, which is local to each thread and each asyncio task
+_in_deserialization: ContextVar[bool] = ContextVar("in_deserialization", default=False)
 
 
 class DataclassType:
@@ -25,20 +30,20 @@ class DataclassType:
 
     def get_field_default(self, field_name: str) -> Any:  # noqa: ANN401
         """Get the default value for this field from the dataclass definition."""
-        for field in (field for field in fields(self.cls) if field.name == field_name):
-            return self._get_field_default(field, field_name)
-        # Field not found (shouldn't happen), raise the original error
-        msg = f"Configuration must be loaded before accessing '{field_name}'. Call load() first."
-        raise ConfigNotLoadedError(msg)
-
-    def _get_field_default(self, field: Field[Any], field_name: str) -> Any:  # noqa: ANN401
-        if field.default is not MISSING:
-            return field.default
-        if field.default_factory is not MISSING:
-            return field.default_factory()
-        # Field has no default, raise the original error
-        msg = f"Configuration must be loaded before accessing '{field_name}'. Call load() first."
-        raise ConfigNotLoadedError(msg)
+        return get_field_default(field_table(self.cls).get(field_name), field_name)
+
+
+# Reason: Ruff's bug
+def get_field_default(entry: Optional[FieldEntry], field_name: str) -> Any:  # noqa: ANN401,UP045
+    """Get the default value of the field, calling default_factory so that mutable defaults are not shared."""
+    if entry is not None:
+        if entry.default is not MISSING:
+            return entry.default
+        if entry.default_factory is not MISSING:
+            return entry.default_factory()
+    # Field not found (shouldn't happen) or has no default, raise the original error
+    msg = f"Configuration must be loaded before accessing '{field_name}'. Call load() first."
+    raise ConfigNotLoadedError(msg)
 
 
 class ConfigProperty:
@@ -58,9 +63,9 @@ class ConfigProperty:
 
         if not getattr(obj, "_loaded", False):
             # Check if we're in deserialization context
-            if getattr(_local, "in_deserialization", False):
+            if _in_deserialization.get():
                 # During deserialization, return field defaults to allow dataclasses-json to work
-                return DataclassType(obj.__class__).get_field_default(self.name)
+                return get_field_default(field_table(obj.__class__).get(self.name), self.name)
             # Normal access before load should raise error
             msg = f"Configuration must be loaded before accessing '{self.name}'. Call load() first."
             raise ConfigNotLoadedError(msg)
@@ -69,17 +74,69 @@ class ConfigProperty:
 
     def __set__(self, obj: Any, value: Any) -> None:  # noqa: ANN401
         setattr(obj, self.private_name, value)
+        forget_load_stamp(obj)
+
+
+class SnapshotProperty(ConfigProperty):
+    """A property descriptor that reads value from the snapshot published by the last load.
+
+    Before the first load, values are stored and checked in the same way as ConfigProperty.
+    """
+
+    def __init__(self, name: str, index: int, original_default: Any = MISSING) -> None:  # noqa: ANN401
+        super().__init__(name, original_default)
+        self.index = index
+
+    # UP045: Ruff's bug
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:  # noqa: ANN401,UP045
+        snapshot = None if obj is None else obj.__dict__.get("_snapshot")
+        if snapshot is None:
+            return super().__get__(obj, objtype)
+        return snapshot[self.index]
+
+    def __set__(self, obj: Any, value: Any) -> None:  # noqa: ANN401
+        snapshot = obj.__dict__.get("_snapshot")
+        if snapshot is None:
+            super().__set__(obj, value)
+        else:
+            # Copy on write so that readers of the current snapshot are not affected
+            obj._snapshot = snapshot._replace_at(self.index, value)  # noqa: SLF001
+            forget_load_stamp(obj)
+
+
+def forget_load_stamp(obj: Any) -> None:  # noqa: ANN401
+    """Make the next load() apply the file even if it is unchanged, since a field was assigned after the last load."""
+    object.__setattr__(obj, "_load_stamp", None)
+    object.__setattr__(obj, "_last_parsed", None)
 
 
 def set_deserialization_context(*, value: bool) -> None:
     """Set the deserialization context flag."""
-    _local.in_deserialization = value
+    _in_deserialization.set(value)
 
 
 def create_property_descriptors(cls: type) -> None:
     """Create property descriptors for class annotations."""
+    if getattr(cls, "SNAPSHOT", False):
+        create_snapshot_property_descriptors(cls)
+        return
     annotations = getattr(cls, "__annotations__", {})
+    if not is_dataclass(cls):
+        for field_name in (field_name for field_name in annotations if field_name != "FILE_PATH"):
+            setattr(cls, field_name, ConfigProperty(field_name, getattr(cls, field_name, MISSING)))
+        return
 
+    # ClassVar annotations are settings of the class, not fields to load
+    table = field_table(cls)
     # Create property descriptors with original defaults preserved
     for field_name in (field_name for field_name in annotations if field_name != "FILE_PATH"):
-        setattr(cls, field_name, ConfigProperty(field_name, getattr(cls, field_name, MISSING)))
+        entry = table.get(field_name)
+        if entry is not None:
+            setattr(cls, field_name, ConfigProperty(field_name, entry.default))
+
+
+def create_snapshot_property_descriptors(cls: type) -> None:
+    """Create property descriptors for all fields in snapshot including inherited ones."""
+    table = field_table(cls)
+    for index, field_name in enumerate(snapshot_fields(cls)):
+        setattr(cls, field_name, SnapshotProperty(field_name, index, table.entries[field_name].default))
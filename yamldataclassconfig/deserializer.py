@@ -0,0 +1,429 @@
+"""This module implements deserializer generated per config class without marshmallow schema.
+
+The generated from_dict function follows what schema().load() of dataclasses-json does for YAML data:
+
+- Top level: unknown fields, missing required fields and null values are reported by marshmallow.ValidationError.
+- Every level: marshmallow field instance specified by `mm_field` metadata deserializes its value, and fields are
+  decoded like dataclasses_json.core._decode_dataclass(), honoring `decoder` metadata.
+
+Marshmallow fields inferred from type annotations are not executed. Instead, the generated code checks that each value
+already has the type which the inferred field would return, converting only int into float. When a value needs other
+conversion such as "8080" into int, or is invalid like a string in List[int], or a nested section has errors, the
+generated code raises Mismatch and the whole data is deserialized by marshmallow schema again, so that the result and
+the errors are the same as marshmallow. Classes which use features the generator doesn't cover fall back to marshmallow
+schema as well.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import warnings
+from datetime import datetime
+from datetime import timezone
+from decimal import Decimal
+from decimal import InvalidOperation
+from enum import Enum
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+from dataclasses_json.cfg import global_config
+from marshmallow import ValidationError
+from marshmallow.fields import Field
+
+from yamldataclassconfig.introspection import get_args
+from yamldataclassconfig.introspection import get_origin
+from yamldataclassconfig.introspection import introspect
+from yamldataclassconfig.nullable import is_nullable_type
+from yamldataclassconfig.schema_cache import SCHEMA_CACHE
+
+__all__ = [
+    "DEFAULT_DESERIALIZER",
+    "DESERIALIZERS",
+]
+
+DEFAULT_DESERIALIZER = "marshmallow"
+DESERIALIZERS = (DEFAULT_DESERIALIZER, "generated")
+
+MESSAGE_UNKNOWN = "Unknown field."
+MESSAGE_REQUIRED = "Missing data for required field."
+MESSAGE_NULL = "Field may not be null."
+
+FromDict = Callable[[Dict[str, Any]], Any]
+
+SEQUENCE_TYPES = {list, set, frozenset}
+
+
+class UnsupportedError(Exception):
+    """Raised when the generator doesn't cover the class."""
+
+
+class Mismatch(Exception):  # noqa: N818
+    """Raised by generated code when the data needs conversion or validation which only marshmallow does."""
+
+
+def mismatch(_value: Any = None) -> Any:  # noqa: ANN401
+    """Raise Mismatch, callable in expressions of generated code in place of a decoder."""
+    raise Mismatch
+
+
+def decode_float(value: Any) -> float:  # noqa: ANN401
+    """Convert int into float like marshmallow.fields.Float, leaving other conversions to marshmallow."""
+    if type(value) is int:
+        return float(value)
+    return mismatch()  # type: ignore[no-any-return]
+
+
+def decode_enum(enum: type[Enum], value: Any) -> Enum:  # noqa: ANN401
+    """Convert value into member of the enum like marshmallow.fields.Enum by value."""
+    try:
+        return enum(value)
+    except ValueError:
+        return mismatch()  # type: ignore[no-any-return]
+
+
+def decode_decimal(value: Any) -> Decimal:  # noqa: ANN401
+    """Convert string into Decimal like marshmallow.fields.Decimal, which refuses special values."""
+    if type(value) is not str:
+        return mismatch()  # type: ignore[no-any-return]
+    try:
+        decimal = Decimal(value)
+    except InvalidOperation:
+        return mismatch()  # type: ignore[no-any-return]
+    return decimal if decimal.is_finite() else mismatch()
+
+
+def decode_uuid(value: Any) -> UUID:  # noqa: ANN401
+    """Convert string into UUID like marshmallow.fields.UUID."""
+    if type(value) is not str:
+        return mismatch()  # type: ignore[no-any-return]
+    try:
+        return UUID(value)
+    except ValueError:
+        return mismatch()  # type: ignore[no-any-return]
+
+
+def decode_datetime(value: Any) -> datetime:  # noqa: ANN401
+    """Decode datetime like dataclasses-json, from timestamp in local timezone."""
+    if not isinstance(value, (int, float)):
+        return mismatch()  # type: ignore[no-any-return]
+    return datetime.fromtimestamp(value, tz=datetime.now(timezone.utc).astimezone().tzinfo)
+
+
+# Reason: Ruff's bug
+def add_error(
+    errors: Optional[Dict[str, Any]],  # noqa: UP006,UP045
+    field_name: str,
+    messages: Any,  # noqa: ANN401
+) -> Dict[str, Any]:  # noqa: UP006
+    """Add error messages of the field into errors for marshmallow.ValidationError."""
+    if errors is None:
+        errors = {}
+    errors[field_name] = messages
+    return errors
+
+
+# Reason: Ruff's bug
+def unknown_errors(data: Dict[str, Any], known: Any) -> Dict[str, Any]:  # noqa: ANN401,UP006
+    return {key: [MESSAGE_UNKNOWN] for key in data if key not in known}
+
+
+def is_optional(type_: Any) -> bool:  # noqa: ANN401
+    """Same as dataclasses_json.utils._is_optional() for resolved type hints."""
+    return type_ is Any or is_nullable_type(type_)
+
+
+class Deserializer:
+    """Holder of generated function which allows nested classes to refer each other before compiled."""
+
+    def __init__(self) -> None:
+        # Reason: Ruff's bug
+        self.function: Optional[FromDict] = None  # noqa: UP045
+
+
+class FunctionGenerator:
+    """Generates source code of from_dict function for a dataclass."""
+
+    def __init__(self, cls: type, *, top_level: bool) -> None:
+        if getattr(cls, "dataclass_json_config", None) is not None:
+            msg = f"{cls.__name__} has dataclass_json_config"
+            raise UnsupportedError(msg)
+        self.cls = cls
+        self.top_level = top_level
+        # Reason: Ruff's bug
+        self.namespace: Dict[str, Any] = {  # noqa: UP006
+            "CLS": cls,
+            "MISSING": dataclasses.MISSING,
+            "IS_DATACLASS": dataclasses.is_dataclass,
+            "ValidationError": ValidationError,
+            "add_error": add_error,
+            "unknown_errors": unknown_errors,
+            "warn": warnings.warn,
+            "MISMATCH": mismatch,
+        }
+        self.lines: List[str] = []  # noqa: UP006
+        self.type_hints = introspect(cls).type_hints
+
+    def reference(self, value: Any) -> str:  # noqa: ANN401
+        """Expose the value to generated code and return its name."""
+        name = f"_r{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def generate(self) -> FromDict:
+        fields = dataclasses.fields(self.cls)
+        self.lines.append("def from_dict(data):")
+        self.lines.append("    if type(data) is not dict:")
+        self.lines.append("        MISMATCH()")
+        self.lines.append("    errors = None")
+        self.lines.append("    missing_key = None")
+        self.lines.append("    kwargs = {}")
+        known = self.reference(frozenset(field.name for field in fields))
+        self.lines.append(f"    if not {known}.issuperset(data):")
+        self.lines.append(f"        {self.report(f'unknown_errors(data, {known})')}")
+        for field in fields:
+            self.generate_field(field)
+        self.lines.append("    if errors:")
+        self.lines.append("        raise ValidationError(errors)")
+        self.lines.append("    if missing_key is not None:")
+        self.lines.append("        raise KeyError(missing_key)")
+        self.lines.append("    return CLS(**kwargs)")
+        # Reason: Source code consists of field names and references to objects in namespace.
+        exec("\n".join(self.lines), self.namespace)  # nosec  # noqa: S102  # pylint: disable=exec-used
+        return self.namespace["from_dict"]  # type: ignore[no-any-return]
+
+    # Reason: Ruff's bug
+    def generate_field(self, field: dataclasses.Field[Any]) -> None:
+        metadata = field.metadata.get("dataclasses_json", {})
+        if "letter_case" in metadata:
+            msg = f"{self.cls.__name__}.{field.name} has letter_case"
+            raise UnsupportedError(msg)
+        key = repr(field.name)
+        mm_field = metadata.get("mm_field", global_config.mm_fields.get(self.raw_type(field)))
+        self.lines.append(f"    value = data.get({key}, MISSING)")
+        self.lines.append("    if value is MISSING:")
+        self.generate_missing(field, key, mm_field)
+        self.lines.append("    else:")
+        if isinstance(mm_field, Field):
+            self.lines.append("        try:")
+            self.lines.append(f"            value = {self.reference(mm_field)}.deserialize(value)")
+            self.lines.append("        except ValidationError as error:")
+            self.lines.append(f"            {self.report(f'add_error(errors, {key}, error.messages)')}")
+        elif not self.allow_none(field, mm_field):
+            self.lines.append("        if value is None:")
+            self.lines.append(f"            {self.report(f'add_error(errors, {key}, [{MESSAGE_NULL!r}])')}")
+        if field.init:
+            self.generate_assignment(field, key, metadata)
+        else:
+            self.lines.append("        pass")
+
+    # Reason: Ruff's bug
+    def generate_missing(self, field: dataclasses.Field[Any], key: str, mm_field: Any) -> None:  # noqa: ANN401
+        if not field.init:
+            self.lines.append("        pass")
+        elif field.default is not dataclasses.MISSING:
+            self.lines.append(f"        kwargs[{key}] = {self.reference(field.default)}")
+        elif field.default_factory is not dataclasses.MISSING:
+            self.lines.append(f"        kwargs[{key}] = {self.reference(field.default_factory)}()")
+        elif mm_field.required if isinstance(mm_field, Field) else mm_field is None:
+            messages = [mm_field.error_messages["required"] if isinstance(mm_field, Field) else MESSAGE_REQUIRED]
+            self.lines.append(f"        {self.report(f'add_error(errors, {key}, {messages!r})')}")
+        elif not self.top_level:
+            self.lines.append("        MISMATCH()")
+        else:
+            self.lines.append("        if missing_key is None:")
+            self.lines.append(f"            missing_key = {key}")
+
+    # Reason: Ruff's bug
+    def generate_assignment(
+        self,
+        field: dataclasses.Field[Any],
+        key: str,
+        metadata: Dict[str, Any],  # noqa: UP006
+    ) -> None:
+        field_type = self.unwrap_new_type(self.type_hints[field.name])
+        decoder = metadata.get("decoder", global_config.decoders.get(self.raw_type(field)))
+        self.lines.append("        if value is None:")
+        if not is_optional(field_type):
+            message = (
+                f"'NoneType' object value of non-optional type {field.name} "
+                f"detected when decoding {self.cls.__name__}."
+            )
+            self.lines.append(f"            warn({message!r}, RuntimeWarning)")
+        self.lines.append(f"            kwargs[{key}] = None")
+        self.lines.append("        else:")
+        if decoder is not None:
+            expression = f"value if type(value) is {self.reference(field_type)} else {self.reference(decoder)}(value)"
+        elif isinstance(field_type, type) and dataclasses.is_dataclass(field_type):
+            expression = f"value if IS_DATACLASS(value) else {self.nested(field_type)}.function(value)"
+        else:
+            expression = self.expression(field_type, "value", 0)
+        self.lines.append(f"            kwargs[{key}] = {expression}")
+
+    def report(self, errors: str) -> str:
+        """Build statement which reports errors, or which falls back to marshmallow in nested classes.
+
+        Marshmallow reports errors of nested classes under the path to them, so they are left to it.
+        """
+        return f"errors = {errors}" if self.top_level else "MISMATCH()"
+
+    def expression(self, type_: Any, value: str, depth: int) -> str:  # noqa: ANN401
+        """Build expression which decodes the value like dataclasses_json.core._decode_type()."""
+        type_ = self.unwrap_new_type(type_)
+        if type_ in global_config.decoders:
+            return f"{self.reference(global_config.decoders[type_])}({value})"
+        if type_ is Any or type_ in {str, int, float, bool}:
+            return self.expression_scalar(type_, value)
+        if isinstance(type_, type):
+            return self.expression_class(type_, value)
+        origin = get_origin(type_)
+        if origin is Union:
+            return self.expression_optional(type_, value, depth)
+        if origin in SEQUENCE_TYPES or origin is tuple:
+            return self.expression_sequence(type_, origin, value, depth)
+        if origin is dict:
+            return self.expression_dict(type_, value, depth)
+        msg = f"Type {type_!r} is not supported"
+        raise UnsupportedError(msg)
+
+    def expression_scalar(self, type_: Any, value: str) -> str:  # noqa: ANN401
+        """Build expression which checks the type of the value, converting only int into float."""
+        if type_ is Any:
+            return value
+        fallback = self.reference(decode_float) if type_ is float else "MISMATCH"
+        return f"({value} if type({value}) is {type_.__name__} else {fallback}({value}))"
+
+    def expression_class(self, type_: type, value: str) -> str:
+        if dataclasses.is_dataclass(type_):
+            reference = self.reference(type_)
+            return f"({value} if isinstance({value}, {reference}) else {self.nested(type_)}.function({value}))"
+        if issubclass(type_, Enum):
+            return f"{self.reference(decode_enum)}({self.reference(type_)}, {value})"
+        if issubclass(type_, datetime):
+            return f"{self.reference(decode_datetime)}({value})"
+        if issubclass(type_, (Decimal, UUID)):
+            base, decoder = (Decimal, decode_decimal) if issubclass(type_, Decimal) else (UUID, decode_uuid)
+            reference = self.reference(base)
+            return f"({value} if isinstance({value}, {reference}) else {self.reference(decoder)}({value}))"
+        if issubclass(type_, (list, set, frozenset, tuple, dict)):
+            return f"{self.reference(type_)}({self.checked(value, dict if issubclass(type_, dict) else list)})"
+        return value
+
+    @staticmethod
+    def checked(value: str, type_: type) -> str:
+        """Build expression which is the value when it is exactly the type of YAML collection."""
+        return f"({value} if type({value}) is {type_.__name__} else MISMATCH())"
+
+    def expression_optional(self, type_: Any, value: str, depth: int) -> str:  # noqa: ANN401
+        args = [arg for arg in get_args(type_) if arg is not type(None)]
+        if len(args) != 1:
+            msg = f"Union {type_!r} is not supported"
+            raise UnsupportedError(msg)
+        return f"(None if {value} is None else {self.expression(args[0], value, depth)})"
+
+    def expression_sequence(self, type_: Any, origin: Any, value: str, depth: int) -> str:  # noqa: ANN401
+        args = get_args(type_)
+        if origin is tuple:
+            if len(args) != 2 or args[1] is not Ellipsis:  # noqa: PLR2004
+                msg = f"Tuple {type_!r} is not supported"
+                raise UnsupportedError(msg)
+            args = args[:1]
+        item = f"item{depth}"
+        item_expression = self.expression(args[0], item, depth + 1) if args else item
+        return f"{self.reference(origin)}({item_expression} for {item} in {self.checked(value, list)})"
+
+    def expression_dict(self, type_: Any, value: str, depth: int) -> str:  # noqa: ANN401
+        args = get_args(type_)
+        if args and args[0] not in {str, Any}:
+            msg = f"Key type of {type_!r} is not supported"
+            raise UnsupportedError(msg)
+        key = f"key{depth}"
+        key_expression = self.expression(str, key, depth + 1) if args and args[0] is str else key
+        item = f"item{depth}"
+        item_expression = self.expression(args[1], item, depth + 1) if args else item
+        return f"{{{key_expression}: {item_expression} for {key}, {item} in {self.checked(value, dict)}.items()}}"
+
+    def nested(self, cls: type) -> str:
+        return self.reference(get_nested_deserializer(cls))
+
+    @staticmethod
+    # Reason: Ruff's bug
+    def raw_type(field: dataclasses.Field[Any]) -> Any:  # noqa: ANN401
+        """Type annotation as written, which is string when annotations are postponed."""
+        return field.type
+
+    @staticmethod
+    def unwrap_new_type(type_: Any) -> Any:  # noqa: ANN401
+        while hasattr(type_, "__supertype__"):
+            type_ = type_.__supertype__
+        return type_
+
+    @staticmethod
+    # Reason: Ruff's bug
+    def allow_none(field: dataclasses.Field[Any], mm_field: Any) -> bool:  # noqa: ANN401
+        """Same as allow_none of marshmallow field which dataclasses-json builds."""
+        if mm_field is not None:
+            # Inferred field doesn't allow None
+            return False
+        if field.default is None:
+            return True
+        return not isinstance(field.type, str) and is_optional(field.type)
+
+
+_nested: WeakKeyDictionary[type, Deserializer] = WeakKeyDictionary()
+# Reason: Ruff's bug
+_top_level: WeakKeyDictionary[type, Optional[FromDict]] = WeakKeyDictionary()  # noqa: UP045
+
+
+def get_nested_deserializer(cls: type) -> Deserializer:
+    deserializer = _nested.get(cls)
+    if deserializer is None:
+        deserializer = Deserializer()
+        _nested[cls] = deserializer
+        try:
+            deserializer.function = FunctionGenerator(cls, top_level=False).generate()
+        except UnsupportedError:
+            del _nested[cls]
+            raise
+    return deserializer
+
+
+# Reason: Ruff's bug
+def get_from_dict(cls: type) -> Optional[FromDict]:  # noqa: UP045
+    """Get generated from_dict function of config class, or None when the class falls back to marshmallow."""
+    try:
+        return _top_level[cls]
+    except KeyError:
+        pass
+    # Reason: Ruff's bug
+    from_dict: Optional[FromDict]  # noqa: UP045
+    try:
+        from_dict = FunctionGenerator(cls, top_level=True).generate()
+    except UnsupportedError:
+        from_dict = None
+    _top_level[cls] = from_dict
+    return from_dict
+
+
+def check_deserializer(name: str) -> None:
+    if name not in DESERIALIZERS:
+        msg = f"Unknown deserializer '{name}'. Available deserializers: {', '.join(DESERIALIZERS)}"
+        raise ValueError(msg)
+
+
+# Reason: Ruff's bug
+def deserialize(cls: type, dictionary_config: Dict[str, Any], name: str) -> Any:  # noqa: ANN401,UP006
+    """Deserialize dictionary into instance of config class by the deserializer specified by name."""
+    check_deserializer(name)
+    from_dict = get_from_dict(cls) if name == "generated" else None
+    if from_dict is not None:
+        try:
+            return from_dict(dictionary_config)
+        except Mismatch:
+            pass
+    return SCHEMA_CACHE.get(cls).load(dictionary_config)
@@ -0,0 +1,209 @@
+"""On-disk cache of deserialized config values keyed by content of config file and schema of config class.
+
+Each entry is a pickle of the values which load() applies to the instance, so loading on a hit skips both YAML parsing
+and deserializing. The key is a hash of the content of the file, the YAML backend, the deserializer, environment
+overrides and the fingerprint of the schema, which covers fields, their types, defaults and dataclasses-json metadata
+such as decoder and mm_field of the config class and nested dataclasses, so an entry is never reused for a changed
+file, environment or class. Each entry has a checksum and is written to a temporary file before being renamed, so
+truncated or corrupt entries are detected and rebuilt, and readers never see partially written ones. The cache is only
+an optimization, so errors of reading and writing entries are logged and loading continues without the cache.
+
+Entries are never evicted, so the directory grows by an entry per distinct content, options and schema until
+clear_disk_cache() removes them. Entries are unpickled, so the cache directory must be writable only by trusted users.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import logging
+import os
+import pickle  # nosec
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Union
+from weakref import WeakKeyDictionary
+
+from yamldataclassconfig.introspection import get_args
+from yamldataclassconfig.introspection import introspect
+from yamldataclassconfig.snapshot import INTERNAL_FIELDS
+
+__all__ = ["clear_disk_cache"]
+
+logger = logging.getLogger(__name__)
+
+# Identifies the format of entries, change it when the format changes
+MAGIC = b"YDCC\x01"
+CHECKSUM_SIZE = 32
+SUFFIX = ".pickle"
+
+_fingerprints: WeakKeyDictionary[type, str] = WeakKeyDictionary()
+
+
+def schema_fingerprint(cls: type) -> str:
+    """Hash fields, their types, defaults and metadata of the class and nested dataclasses, cached per class."""
+    fingerprint = _fingerprints.get(cls)
+    if fingerprint is None:
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from yamldataclassconfig import __version__  # noqa: PLC0415
+
+        lines = [f"yamldataclassconfig {__version__}", f"python {sys.version_info[0]}.{sys.version_info[1]}"]
+        describe(cls, lines, set())
+        fingerprint = hashlib.blake2b("\n".join(lines).encode()).hexdigest()
+        _fingerprints[cls] = fingerprint
+    return fingerprint
+
+
+# Reason: Ruff's bug
+def describe(type_: Any, lines: List[str], seen: Set[Any]) -> None:  # noqa: ANN401,UP006
+    """Append description of the dataclass and dataclasses in its type hints to lines."""
+    if not dataclasses.is_dataclass(type_) or not isinstance(type_, type) or type_ in seen:
+        for arg in get_args(type_):
+            describe(arg, lines, seen)
+        return
+    seen.add(type_)
+    lines.append(f"class {type_.__module__}.{type_.__qualname__}")
+    class_config = getattr(type_, "dataclass_json_config", None)
+    if class_config:
+        lines.append(f"config {describe_value(class_config, set())}")
+    type_hints = introspect(type_).type_hints
+    for field in dataclasses.fields(type_):
+        if field.name in INTERNAL_FIELDS:
+            continue
+        type_hint = type_hints.get(field.name, field.type)
+        lines.append(f"{field.name}: {type_hint!r} = {describe_default(field)}")
+        # Decoder, mm_field, letter_case and so on change how values are deserialized
+        metadata = field.metadata.get("dataclasses_json")
+        if metadata:
+            lines.append(f"{field.name} metadata {describe_value(metadata, set())}")
+        describe(type_hint, lines, seen)
+
+
+# Reason: Ruff's bug
+def describe_value(value: Any, seen: Set[int]) -> str:  # noqa: ANN401,UP006
+    """Describe metadata value in the same way across processes, naming functions and classes instead of repr()."""
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(describe_value(item, seen) for item in value)}]"
+    if isinstance(value, dict):
+        items = sorted((repr(key), describe_value(item, seen)) for key, item in value.items())
+        return f"{{{', '.join(f'{key}: {item}' for key, item in items)}}}"
+    qualname = getattr(value, "__qualname__", None)
+    if qualname is not None:
+        # Methods of built-in types have module only in their class
+        module = getattr(value, "__module__", None) or getattr(getattr(value, "__objclass__", None), "__module__", "")
+        return f"{module}.{qualname}"
+    name = f"{type(value).__module__}.{type(value).__qualname__}"
+    # Objects such as fields of marshmallow are described by their attributes
+    if id(value) in seen or not hasattr(value, "__dict__"):
+        return name
+    seen.add(id(value))
+    return f"{name}({describe_value(vars(value), seen)})"
+
+
+def describe_default(field: dataclasses.Field[Any]) -> str:
+    if field.default_factory is not dataclasses.MISSING:
+        factory = field.default_factory
+        return f"{getattr(factory, '__module__', '')}.{getattr(factory, '__qualname__', repr(factory))}()"
+    return "" if field.default is dataclasses.MISSING else repr(field.default)
+
+
+# Reason: Ruff's bug
+def cache_key(
+    content: bytes,
+    cls: type,
+    yaml_backend: str,
+    deserializer: str,
+    env_overrides: Optional[Dict[str, str]] = None,  # noqa: UP006,UP045
+) -> str:
+    """Key of the entry for the content loaded into the class with the options and environment overrides."""
+    digest = hashlib.blake2b(content)
+    digest.update(f"\0{yaml_backend}\0{deserializer}\0{schema_fingerprint(cls)}".encode())
+    if env_overrides:
+        digest.update(f"\0{sorted(env_overrides.items())!r}".encode())
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Entries in a directory, one file per key."""
+
+    # Reason: Ruff's bug
+    def __init__(self, directory: Union[Path, str]) -> None:  # noqa: UP007
+        self.directory = Path(directory)
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    # Reason: Ruff's bug
+    def get(self, key: str) -> Optional[Dict[str, Any]]:  # noqa: UP006,UP045
+        """Return values of the entry, or None when it doesn't exist or is stale or corrupt."""
+        try:
+            data = self.path(key).read_bytes()
+        except OSError:
+            return None
+        header_size = len(MAGIC) + CHECKSUM_SIZE
+        payload = data[header_size:]
+        if data[: len(MAGIC)] != MAGIC or data[len(MAGIC) : header_size] != checksum(payload):
+            logger.warning("Ignored corrupt config cache entry %s", self.path(key))
+            return None
+        try:
+            # Reason: Entries are written by this module into the directory which only trusted users can write.
+            stored_key, values = pickle.loads(payload)  # nosec  # noqa: S301
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning("Ignored unreadable config cache entry %s", self.path(key), exc_info=True)
+            return None
+        if stored_key != key:
+            logger.warning("Ignored config cache entry %s which belongs to another key", self.path(key))
+            return None
+        return values  # type: ignore[no-any-return]
+
+    # Reason: Ruff's bug
+    def put(self, key: str, values: Dict[str, Any]) -> None:  # noqa: UP006
+        """Store values atomically, skipping values which can't be pickled and directory which can't be written."""
+        try:
+            payload = pickle.dumps((key, values), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.debug("Skipped caching values which can't be pickled", exc_info=True)
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(prefix=f".{key}.", dir=self.directory)
+        # Reason: Loading must not fail because of the cache.
+        except OSError:
+            logger.warning("Skipped caching config since %s can't be written", self.directory, exc_info=True)
+            return
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(MAGIC + checksum(payload) + payload)
+            Path(temporary).replace(self.path(key))
+        except OSError:
+            Path(temporary).unlink(missing_ok=True)
+            logger.warning("Skipped caching config since %s can't be written", self.path(key), exc_info=True)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> int:
+        """Remove all entries and return the number of removed entries."""
+        removed = 0
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            path.unlink()
+            removed += 1
+        return removed
+
+
+def checksum(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=CHECKSUM_SIZE).digest()
+
+
+# Reason: Ruff's bug
+def clear_disk_cache(directory: Union[Path, str]) -> int:  # noqa: UP007
+    """Remove all entries of the on-disk cache in the directory and return the number of removed entries."""
+    return DiskCache(directory).clear()
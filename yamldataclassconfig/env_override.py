@@ -0,0 +1,167 @@
+"""Overrides of config values by environment variables.
+
+When ENV_PREFIX of the config class is set, each field, including fields of nested dataclasses, can be overridden by
+the environment variable named by joining the prefix and the path of field names in upper case with "__", for example,
+APP__PART_CONFIG__PROPERTY_C overrides field property_c of nested section part_config when ENV_PREFIX is "APP".
+
+The map from variable names to field paths and coercions is built from type hints once per class, so applying
+overrides looks up only the variables in the map instead of scanning os.environ against every field.
+
+Values are coerced to the type of the field:
+- str is used as is.
+- int and float are converted by the constructor.
+- bool accepts true, false, yes, no, on, off, 1 and 0 in any case.
+- Optional of other types accepts empty string and null as None.
+- Other types like lists, dicts and nested dataclasses are parsed as YAML.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from weakref import WeakKeyDictionary
+
+from yamldataclassconfig.exceptions import ConfigValidationError
+from yamldataclassconfig.introspection import get_args
+from yamldataclassconfig.introspection import introspect
+from yamldataclassconfig.snapshot import INTERNAL_FIELDS
+from yamldataclassconfig.yaml_backend import get_yaml_backend
+
+SEPARATOR = "__"
+BOOLEANS = {"true": True, "yes": True, "on": True, "1": True, "false": False, "no": False, "off": False, "0": False}
+NULLS = frozenset({"", "null", "~"})
+
+
+class EnvOverride(NamedTuple):
+    """Field which an environment variable overrides."""
+
+    # Reason: Ruff's bug
+    path: Tuple[str, ...]  # noqa: UP006
+    type: Any
+    # Called with value of the variable and name of YAML backend
+    coerce: Callable[[str, str], Any]
+
+
+# Reason: Ruff's bug
+_maps: WeakKeyDictionary[type, Tuple[str, Dict[str, EnvOverride]]] = WeakKeyDictionary()  # noqa: UP006
+
+
+# Reason: Ruff's bug
+def env_override_map(cls: type, prefix: str) -> Dict[str, EnvOverride]:  # noqa: UP006
+    """Map names of environment variables to fields of the class, building it on the first call per prefix.
+
+    Variables of sections precede variables of their fields, so that fields override the section.
+    """
+    cached = _maps.get(cls)
+    if cached is not None and cached[0] == prefix:
+        return cached[1]
+    overrides: List[EnvOverride] = []  # noqa: UP006  # Reason: Ruff's bug
+    collect(cls, (), overrides, frozenset({cls}))
+    overrides.sort(key=lambda override: len(override.path))
+    mapping = {variable_name(prefix, override.path): override for override in overrides}
+    _maps[cls] = (prefix, mapping)
+    return mapping
+
+
+# Reason: Ruff's bug
+def variable_name(prefix: str, path: Tuple[str, ...]) -> str:  # noqa: UP006
+    return SEPARATOR.join(part.upper() for part in (prefix, *path) if part)
+
+
+# Reason: Ruff's bug
+def collect(
+    cls: type,
+    path: Tuple[str, ...],  # noqa: UP006
+    overrides: List[EnvOverride],  # noqa: UP006
+    seen: FrozenSet[type],  # noqa: UP006
+) -> None:
+    """Append overrides of fields of the dataclass and its nested dataclasses."""
+    type_hints = introspect(cls).type_hints
+    for field in dataclasses.fields(cls):
+        if field.name in INTERNAL_FIELDS:
+            continue
+        type_hint = type_hints.get(field.name, Any)
+        field_path = (*path, field.name)
+        overrides.append(EnvOverride(field_path, type_hint, create_coercion(type_hint)))
+        nested = dataclass_of(type_hint)
+        if nested is not None and nested not in seen:
+            collect(nested, field_path, overrides, seen | {nested})
+
+
+def dataclass_of(type_hint: Any) -> Any:  # noqa: ANN401
+    """Return dataclass of the type hint which is the dataclass itself or Optional of it, or None."""
+    candidates = [arg for arg in get_args(type_hint) if arg is not type(None)] or [type_hint]
+    if len(candidates) != 1:
+        return None
+    candidate = candidates[0]
+    return candidate if isinstance(candidate, type) and dataclasses.is_dataclass(candidate) else None
+
+
+def create_coercion(type_hint: Any) -> Callable[[str, str], Any]:  # noqa: ANN401
+    """Create function which converts value of environment variable into the type."""
+    args = get_args(type_hint)
+    if type(None) in args:
+        non_none = [arg for arg in args if arg is not type(None)]
+        inner = create_coercion(non_none[0] if len(non_none) == 1 else Any)
+        if non_none == [str]:
+            return inner
+        return lambda value, yaml_backend: None if value.strip().lower() in NULLS else inner(value, yaml_backend)
+    if type_hint is str:
+        return lambda value, _: value
+    if type_hint is bool:
+        return lambda value, _: BOOLEANS[value.strip().lower()]
+    if type_hint in (int, float):
+        return lambda value, _: type_hint(value)
+    return lambda value, yaml_backend: get_yaml_backend(yaml_backend).load(value)
+
+
+# Reason: Ruff's bug
+def read_env_overrides(cls: type, prefix: str) -> Dict[str, str]:  # noqa: UP006
+    """Return values of environment variables in the map of the class which are set."""
+    environ = os.environ
+    return {name: environ[name] for name in env_override_map(cls, prefix) if name in environ}
+
+
+# Reason: Ruff's bug
+def apply_env_overrides(
+    cls: type,
+    prefix: str,
+    dictionary_config: Dict[str, Any],  # noqa: UP006
+    yaml_backend: str,
+) -> Dict[str, Any]:  # noqa: UP006
+    """Return copy of the dictionary whose values are overridden by environment variables.
+
+    Only dictionaries on the paths to overridden values are copied, and the given dictionary is never changed.
+    """
+    values = read_env_overrides(cls, prefix)
+    if not values:
+        return dictionary_config
+    mapping = env_override_map(cls, prefix)
+    result = dict(dictionary_config)
+    for name, value in values.items():
+        override = mapping[name]
+        target = result
+        for key in override.path[:-1]:
+            child = target.get(key)
+            child = dict(child) if isinstance(child, dict) else {}
+            target[key] = child
+            target = child
+        target[override.path[-1]] = coerce(name, value, override, yaml_backend)
+    return result
+
+
+def coerce(name: str, value: str, override: EnvOverride, yaml_backend: str) -> Any:  # noqa: ANN401
+    # Reason: YAML backends raise their own errors
+    try:
+        return override.coerce(value, yaml_backend)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        type_name = getattr(override.type, "__name__", repr(override.type))
+        msg = f"Environment variable {name} expected {type_name}, got '{value}'"
+        raise ConfigValidationError(msg) from error
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from typing import Union
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
 __all__ = [
+    "ConfigFileTooLargeError",
+    "ConfigLoadError",
     "ConfigNotLoadedError",
     "ConfigValidationError",
 ]
@@ -14,3 +22,16 @@ class ConfigNotLoadedError(Exception):
 
 class ConfigValidationError(Exception):
     """Raised when there are type validation errors during config loading."""
+
+
+class ConfigFileTooLargeError(Exception):
+    """Raised when the config file is larger than MAX_FILE_SIZE of the config class."""
+
+
+class ConfigLoadError(Exception):
+    """Raised for each config file which failed to load by load_many(), the cause is chained as __cause__."""
+
+    # Reason: Ruff's bug
+    def __init__(self, path: Union[Path, str]) -> None:  # noqa: UP007
+        super().__init__(f"Failed to load {path}")
+        self.path = path
@@ -10,7 +10,9 @@ from typing import List
 from typing import Set
 from typing import Type
 from typing import TypeVar
-from typing import get_type_hints
+
+from yamldataclassconfig.introspection import field_table
+from yamldataclassconfig.introspection import introspect
 
 T = TypeVar("T")
 
@@ -53,7 +55,7 @@ class KeyArguments(Generic[T]):
     def __init__(self, cls: Type[T], **kwargs: Any) -> None:  # noqa: ANN401,UP006
         self.init_kwargs: Dict[str, Any] = {}  # noqa: UP006
         self.cls = cls
-        self.type_hints = get_type_hints(self.cls)
+        self.type_hints = introspect(self.cls).type_hints
         self.kwargs = kwargs
 
     def build_init_kwargs(self) -> None:
@@ -61,12 +63,9 @@ class KeyArguments(Generic[T]):
         # Check if this is a dataclass
         if not dataclasses.is_dataclass(self.cls):
             return
-        # Get type hints to identify all expected fields
-        for field_name, field_obj in self.cls.__dataclass_fields__.items():
-            if not field_obj.init:
-                # Skip init=False fields
-                continue
-            self.init_kwargs[field_name] = self.get_kwarg(field_name, field_obj)
+        # Field table excludes ClassVar pseudo-fields and init=False fields which can't be passed to __init__
+        for entry in field_table(self.cls).init_entries:
+            self.init_kwargs[entry.name] = self.get_kwarg(entry.name, entry.field)
 
     def get_kwarg(self, field_name: str, field_obj: dataclasses.Field[Any]) -> Any:  # noqa: ANN401
         """Gets the keyword argument value for a field."""
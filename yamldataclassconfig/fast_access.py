@@ -0,0 +1,83 @@
+"""Plain attribute access for loaded config instances.
+
+Before load, fields of config instances are guarded by property descriptors and YamlDataClassConfig.__getattribute__()
+to raise ConfigNotLoadedError. Once loaded, an instance of the class with FAST_ACCESS enabled is switched to a subclass
+generated per config class, which shadows the descriptors by plain class attributes and restores
+object.__getattribute__(), so that reading a field costs the same as reading an attribute of a plain dataclass.
+
+Since type() of loaded instances is the subclass, compare the class by isinstance() or config_class_of(). Instances are
+pickled as instances of the config class and switched to the subclass again on unpickling.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from weakref import WeakKeyDictionary
+
+from yamldataclassconfig.config_property import ConfigProperty
+from yamldataclassconfig.config_property import forget_load_stamp
+from yamldataclassconfig.snapshot import snapshot_fields
+
+# Name of class attribute which refers config class from the generated subclass
+FAST_ACCESS_BASE = "_fast_access_base"
+
+_classes: WeakKeyDictionary[type, type] = WeakKeyDictionary()
+
+
+def fast_access_class(cls: type) -> type:
+    """Get subclass of the config class for loaded instances, creating it on the first call.
+
+    The subclass has the same name, so that repr() of instances doesn't change.
+    """
+    fast = _classes.get(cls)
+    if fast is None:
+        names = frozenset(snapshot_fields(cls))
+
+        def __setattr__(self: Any, name: str, value: Any) -> None:  # noqa: ANN401,N807
+            object.__setattr__(self, name, value)
+            if name in names:
+                forget_load_stamp(self)
+
+        # Reason: Ruff's bug
+        def __reduce__(self: Any) -> Tuple[Callable[..., Any], Tuple[type, Dict[str, Any]]]:  # noqa: ANN401,N807,UP006
+            # The subclass can't be looked up by its name, which is the name of the config class
+            return restore, (cls, vars(self))
+
+        # Reason: Ruff's bug
+        namespace: Dict[str, Any] = {  # noqa: UP006
+            "__getattribute__": object.__getattribute__,
+            "__setattr__": __setattr__,
+            "__reduce__": __reduce__,
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+            "_needs_property_descriptors": False,
+            FAST_ACCESS_BASE: cls,
+        }
+        # Non-data class attributes let values in instance dictionary take precedence
+        for name in snapshot_fields(cls):
+            default = getattr(cls, name, None)
+            namespace[name] = None if isinstance(default, ConfigProperty) else default
+        fast = type(cls.__name__, (cls,), namespace)
+        _classes[cls] = fast
+    return fast
+
+
+# Reason: Ruff's bug
+def restore(cls: type, state: Dict[str, Any]) -> Any:  # noqa: ANN401,UP006
+    """Create the loaded instance of the config class from pickled state."""
+    instance: Any = object.__new__(fast_access_class(cls))
+    for name, value in state.items():
+        # Since the values were already loaded, they don't affect change detection
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def config_class_of(instance: Any) -> type:  # noqa: ANN401
+    """Return the config class of the instance even after it is switched to the generated subclass."""
+    cls = type(instance)
+    base: type = cls.__dict__.get(FAST_ACCESS_BASE, cls)
+    return base
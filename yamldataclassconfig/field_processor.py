@@ -9,8 +9,10 @@ from typing import Dict
 from typing import List
 from typing import Tuple
 from typing import cast
-from typing import get_type_hints
 
+from yamldataclassconfig.introspection import field_table
+from yamldataclassconfig.introspection import forget_field_tables
+from yamldataclassconfig.introspection import introspect
 from yamldataclassconfig.type_defaults import get_default_for_type
 
 if TYPE_CHECKING:
@@ -50,7 +52,7 @@ class DataClass:
             raise ValueError(msg)
         self.cls = cls
         # Get type hints for this class
-        self.type_hints = get_type_hints(cls)
+        self.type_hints = introspect(cls).type_hints
 
     def apply_automatic_defaults(self) -> None:
         """Apply automatic defaults to all fields without defaults to prevent mypy warnings."""
@@ -62,9 +64,9 @@ class DataClass:
     def _get_processable_fields(self) -> List[Tuple[str, Field[Any]]]:  # noqa: UP006
         """Get fields that can be processed for automatic defaults."""
         return [
-            (field_name, field_obj)
-            for field_name, field_obj in self.cls.__dataclass_fields__.items()
-            if not self.is_already_processed(field_obj)
+            (entry.name, entry.field)
+            for entry in field_table(self.cls).entries.values()
+            if not self.is_already_processed(entry.field)
         ]
 
     # Reason: Ruff's bug
@@ -78,6 +80,8 @@ class DataClass:
         """Apply automatic defaults to the specified type hints."""
         for type_hint in type_hints:
             self.cls.__dataclass_fields__[type_hint.field_name] = type_hint.get_automatic_default()
+        if type_hints:
+            forget_field_tables(self.cls)
 
     def is_already_processed(self, field_obj: Field[Any]) -> bool:
         """To skip fields that already have defaults or are not included in init."""
@@ -90,5 +94,9 @@ class DataClass:
 
 def apply_automatic_defaults(cls: type) -> None:
     """Apply automatic defaults to all fields without defaults to prevent mypy warnings."""
+    if "__dataclass_fields__" not in cls.__dict__:
+        # Fields are inherited from the parent class before @dataclass decorator processes the class,
+        # replacing them breaks the parent class
+        return
     dataclass = DataClass(cls)
     dataclass.apply_automatic_defaults()
@@ -0,0 +1,155 @@
+"""Reload which deserializes only top-level fields whose parsed values changed since the last load.
+
+When INCREMENTAL_RELOAD of the config class is True, load() keeps the parsed content of the last successful load and
+compares it with the newly parsed content key by key. Only fields whose values differ are validated and deserialized,
+each through a dataclass generated per field with the same type and metadata, and the other fields keep their current
+values. So unchanged nested sections are reused by identity and reload cost scales with the size of the change rather
+than the size of the file.
+
+Parsed values are compared by type as well as by equality, since YAML 1 and true are equal in Python but deserialized
+differently. The content is loaded fully on the first load, when a key is removed or an unknown key appears, when the
+deserializer or environment overrides changed, and for classes whose YAML keys are not field names.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from inspect import getattr_static
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+from dataclasses_json import DataClassJsonMixin
+from marshmallow import ValidationError
+
+from yamldataclassconfig.config_property import ConfigProperty
+from yamldataclassconfig.deserializer import deserialize
+from yamldataclassconfig.introspection import introspect
+from yamldataclassconfig.lazy_section import deserialize_lazily
+from yamldataclassconfig.snapshot import snapshot_fields
+
+if TYPE_CHECKING:
+    from yamldataclassconfig.snapshot import ConfigSnapshot
+
+# Reason: Ruff's bug
+_fields: WeakKeyDictionary[type, Optional[FrozenSet[str]]] = WeakKeyDictionary()  # noqa: UP006,UP045
+_field_classes: WeakKeyDictionary[type, Dict[str, type]] = WeakKeyDictionary()  # noqa: UP006
+
+
+def equal_tree(left: Any, right: Any) -> bool:  # noqa: ANN401
+    """Compare parsed values structurally, requiring the same type at every level."""
+    if type(left) is not type(right):
+        return False
+    if isinstance(left, dict):
+        return left.keys() == right.keys() and all(equal_tree(value, right[key]) for key, value in left.items())
+    if isinstance(left, list):
+        return len(left) == len(right) and all(map(equal_tree, left, right))
+    return bool(left == right)
+
+
+# Reason: Ruff's bug
+def incremental_fields(cls: type) -> Optional[FrozenSet[str]]:  # noqa: UP006,UP045
+    """Names of fields which can be deserialized one by one.
+
+    None when YAML keys of the class are not field names.
+    """
+    try:
+        return _fields[cls]
+    except KeyError:
+        pass
+    # Reason: Ruff's bug
+    names: Optional[FrozenSet[str]] = frozenset(snapshot_fields(cls))  # noqa: UP006,UP045
+    if getattr(cls, "dataclass_json_config", None) is not None or any(
+        "letter_case" in field.metadata.get("dataclasses_json", {}) for field in dataclasses.fields(cls)
+    ):
+        names = None
+    _fields[cls] = names
+    return names
+
+
+# Reason: Ruff's bug
+def changed_fields(
+    cls: type,
+    previous: Dict[str, Any],  # noqa: UP006
+    current: Any,  # noqa: ANN401
+) -> Optional[FrozenSet[str]]:  # noqa: UP006,UP045
+    """Return names of fields whose parsed values differ, or None when the content has to be loaded fully."""
+    names = incremental_fields(cls)
+    if names is None or not isinstance(current, dict) or not previous.keys() <= current.keys():
+        return None
+    changed = frozenset(
+        key for key, value in current.items() if key not in previous or not equal_tree(previous[key], value)
+    )
+    # Unknown key is reported by deserializing all fields
+    return changed if changed <= names else None
+
+
+def field_class(cls: type, name: str) -> type:
+    """Get dataclass which has only the field of the config class, creating it on the first call."""
+    classes = _field_classes.get(cls)
+    if classes is None:
+        classes = _field_classes[cls] = {}
+    single = classes.get(name)
+    if single is None:
+        field = next(field for field in dataclasses.fields(cls) if field.name == name)
+        # Reason: Ruff's bug
+        options: Dict[str, Any] = {"init": field.init, "metadata": field.metadata}  # noqa: UP006
+        if field.default is not dataclasses.MISSING:
+            options["default"] = field.default
+        elif field.default_factory is not dataclasses.MISSING:
+            options["default_factory"] = field.default_factory
+        # Same name as the config class so that error messages don't differ from loading fully
+        # pylint: disable-next=invalid-field-call
+        definition = (name, introspect(cls).type_hints[name], dataclasses.field(**options))
+        single = dataclasses.make_dataclass(
+            cls.__name__,
+            [definition],
+            bases=(DataClassJsonMixin,),
+        )
+        single.__module__ = cls.__module__
+        classes[name] = single
+    return single
+
+
+# Reason: Ruff's bug
+def deserialize_fields(
+    cls: type,
+    dictionary_config: Dict[str, Any],  # noqa: UP006
+    names: FrozenSet[str],  # noqa: UP006
+    deserializer: str,
+    *,
+    lazy: bool,
+) -> Dict[str, Any]:  # noqa: UP006
+    """Deserialize values of the fields one by one, raising errors of all fields at once like loading fully."""
+    values = {}
+    errors: Dict[str, Any] = {}  # noqa: UP006  # Reason: Ruff's bug
+    for name in names:
+        single = field_class(cls, name)
+        data = {name: dictionary_config[name]}
+        try:
+            load = deserialize_lazily if lazy else deserialize
+            instance = load(single, data, deserializer)
+        # Reason: Errors of the other fields are reported together.
+        except ValidationError as error:
+            errors.update(error.messages_dict)
+        else:
+            values[name] = getattr(instance, name)
+    if errors:
+        raise ValidationError(errors)
+    return values
+
+
+# Reason: Ruff's bug
+def merge_values(cls: type, current: ConfigSnapshot, changes: Dict[str, Any]) -> Dict[str, Any]:  # noqa: UP006
+    """Return values to apply which are the changed values and the current values of the other fields.
+
+    Keys are the same as instance dictionary of deserialized instance, where property descriptors store values under
+    private names.
+    """
+    return {
+        f"__{name}" if isinstance(getattr_static(cls, name, None), ConfigProperty) else name: changes.get(name, value)
+        for name, value in zip(current._fields, current)
+    }
@@ -0,0 +1,222 @@
+"""Hooks which observe each phase of loading config.
+
+Listeners registered by add_load_listener() are called with LoadPhaseEvent at the start and at the end of each phase
+of load(), aload(), load_many() and layered loading. Phases are:
+- resolve: resolving the path to the config file
+- stamp: taking stamp of the file and comparing it with the last load for change detection
+- read: reading whole file, only when CACHE_DIR is set
+- cache: looking up the on-disk cache, only when CACHE_DIR is set
+- parse: reading and parsing YAML, once per parsed layer for layered loading
+- merge: deep-merging layers, only for layered loading
+- diff: comparing parsed values with the last load, only when INCREMENTAL_RELOAD is True
+- validate: validating types of parsed values
+- deserialize: deserializing parsed values into instance of the config class
+- apply: applying deserialized values to the loaded instance
+
+When no listener is registered, phase() returns a shared context manager which does nothing, so instrumentation costs a
+function call per phase. Exceptions raised by listeners are logged and don't affect loading.
+
+Phases which run in worker processes of load_many() are recorded by record() and replayed by replay() in the calling
+process, so listeners receive their events after the worker finished, with start_ns measured by the worker.
+"""
+
+from __future__ import annotations
+
+import logging
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+    from typing import Self
+    from typing import Type
+
+__all__ = ["LOAD_PHASES", "LoadPhaseEvent", "add_load_listener", "remove_load_listener"]
+
+logger = logging.getLogger(__name__)
+
+LOAD_PHASES = ("resolve", "stamp", "read", "cache", "parse", "merge", "diff", "validate", "deserialize", "apply")
+
+
+class LoadPhaseEvent(NamedTuple):
+    """Start or end of a phase of loading config."""
+
+    phase: str
+    # Config class which is loaded
+    cls: type
+    # Path to the config file, as given for resolve phase and resolved for other phases
+    # Reason: Ruff's bug
+    path: Union[Path, str]  # noqa: UP007
+    # Size of the file in bytes, or total size of layers, None before the file is stamped
+    # and for parsing the content which read phase has read
+    size: Optional[int]  # noqa: UP045
+    # Value of time.perf_counter_ns() at the start of the phase
+    start_ns: int
+    # Duration of the phase in nanoseconds, None at the start
+    duration_ns: Optional[int] = None  # noqa: UP045
+    # Exception which ended the phase, None at the start and on success
+    error: Optional[BaseException] = None  # noqa: UP045
+    # At the end of stamp phase, True when the file is unchanged and loading is skipped,
+    # at the end of cache phase, True when the entry is found, None otherwise
+    hit: Optional[bool] = None  # noqa: UP045
+
+    @property
+    def is_end(self) -> bool:
+        return self.duration_ns is not None
+
+
+LoadListener = Callable[[LoadPhaseEvent], Any]
+
+# Replaced instead of modified, so that phases in other threads iterate a consistent tuple without lock
+_listeners: Tuple[LoadListener, ...] = ()  # noqa: UP006  # Reason: Ruff's bug
+
+
+def add_load_listener(listener: LoadListener) -> None:
+    """Register listener which is called with LoadPhaseEvent at the start and at the end of each phase."""
+    global _listeners  # noqa: PLW0603  # pylint: disable=global-statement
+    _listeners = (*_listeners, listener)
+
+
+def remove_load_listener(listener: LoadListener) -> None:
+    """Unregister listener, ValueError is raised when it is not registered."""
+    global _listeners  # noqa: PLW0603  # pylint: disable=global-statement
+    listeners = list(_listeners)
+    listeners.remove(listener)
+    _listeners = tuple(listeners)
+
+
+def emit(event: LoadPhaseEvent) -> None:
+    for listener in _listeners:
+        try:
+            listener(event)
+        # Reason: Observing must not break loading.
+        except Exception:  # noqa: PERF203  # pylint: disable=broad-exception-caught
+            logger.exception("Load listener %r failed on %s", listener, event.phase)
+
+
+class Phase:
+    """Context manager which emits events at the start and at the end of the phase.
+
+    The phase sets hit of the object returned by __enter__() to report whether it found cached result.
+    """
+
+    __slots__ = ("cls", "hit", "name", "path", "size", "start_ns")
+
+    # Reason: Ruff's bug
+    def __init__(self, name: str, cls: type, path: Union[Path, str], size: Optional[int]) -> None:  # noqa: UP007,UP045
+        self.name = name
+        self.cls = cls
+        self.path = path
+        self.size = size
+        self.start_ns = 0
+        self.hit: Optional[bool] = None  # noqa: UP045  # Reason: Ruff's bug
+
+    # UP037: To support Python 3.10 or lower
+    def __enter__(self) -> "Self":  # noqa: UP037
+        self.start_ns = perf_counter_ns()
+        emit(LoadPhaseEvent(self.name, self.cls, self.path, self.size, self.start_ns))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],  # noqa: UP006,UP045
+        exc_value: Optional[BaseException],  # noqa: UP045
+        traceback: Optional[TracebackType],  # noqa: UP045
+    ) -> None:
+        duration_ns = perf_counter_ns() - self.start_ns
+        emit(
+            LoadPhaseEvent(
+                self.name,
+                self.cls,
+                self.path,
+                self.size,
+                self.start_ns,
+                duration_ns,
+                exc_value,
+                self.hit,
+            ),
+        )
+
+
+class NullPhase(Phase):
+    """Context manager which does nothing, shared by all phases while no listener is registered."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        pass
+
+    # UP037: To support Python 3.10 or lower
+    def __enter__(self) -> "Self":  # noqa: UP037
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    @property
+    def hit(self) -> Optional[bool]:  # noqa: UP045  # Reason: Ruff's bug
+        return None
+
+    @hit.setter
+    def hit(self, value: Optional[bool]) -> None:  # noqa: UP045  # Reason: Ruff's bug
+        pass
+
+
+NULL_PHASE = NullPhase()
+
+
+class RecordedCall(NamedTuple):
+    """Events of phases and outcome of function called by record()."""
+
+    # Reason: Ruff's bug
+    events: Tuple[LoadPhaseEvent, ...]  # noqa: UP006
+    # Return value of the function, None when it failed
+    result: Any
+    # Exception raised by the function, None on success
+    error: Optional[BaseException] = None  # noqa: UP045
+
+
+def is_observed() -> bool:
+    """Return whether any listener is registered."""
+    return bool(_listeners)
+
+
+def record(function: Callable[..., Any], *args: Any) -> RecordedCall:  # noqa: ANN401
+    """Call the function in worker process, recording events of its phases instead of calling listeners.
+
+    Listeners inherited from the calling process are replaced while the function runs, so worker processes must run
+    one function at a time. Exception raised by the function is returned so that events until the failure are kept.
+    """
+    global _listeners  # noqa: PLW0603  # pylint: disable=global-statement
+    listeners = _listeners
+    events: List[LoadPhaseEvent] = []  # noqa: UP006  # Reason: Ruff's bug
+    _listeners = (events.append,)
+    try:
+        result = function(*args)
+    # Reason: The exception is raised again in the calling process after its events are replayed.
+    except Exception as error:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        return RecordedCall(tuple(events), None, error)
+    finally:
+        _listeners = listeners
+    return RecordedCall(tuple(events), result)
+
+
+def replay(events: Iterable[LoadPhaseEvent]) -> None:
+    """Call listeners with events recorded by record() in worker process."""
+    for event in events:
+        emit(event)
+
+
+# Reason: Ruff's bug
+def phase(name: str, cls: type, path: Union[Path, str], size: Optional[int] = None) -> Phase:  # noqa: UP007,UP045
+    """Return context manager which observes the phase, or one which does nothing when no listener is registered."""
+    return Phase(name, cls, path, size) if _listeners else NULL_PHASE
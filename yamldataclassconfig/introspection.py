@@ -0,0 +1,137 @@
+"""Per-class cache of resolved type annotations and dataclass fields."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import get_type_hints
+from weakref import WeakKeyDictionary
+
+try:
+    from typing import get_args
+    from typing import get_origin
+except ImportError:  # pragma nocover
+
+    def get_origin(type_: Any) -> Any:  # type: ignore[no-redef]  # noqa: ANN401
+        """Backport helper for Python versions without typing.get_origin."""
+        return getattr(type_, "__origin__", None)
+
+    # Reason: Ruff's bug
+    def get_args(tp: Any) -> Tuple[Any, ...]:  # noqa: ANN401,UP006
+        """Backport helper for Python versions without typing.get_args."""
+        return getattr(tp, "__args__", ())
+
+
+__all__ = [
+    "ClassIntrospection",
+    "FieldEntry",
+    "FieldTable",
+    "field_table",
+    "get_args",
+    "get_origin",
+    "introspect",
+]
+
+
+class ClassIntrospection:
+    """Type hints of a class resolved once, with origins and arguments of each hint.
+
+    Resolving type hints evaluates string annotations created by `from __future__ import annotations`, so the result is
+    shared by every caller through introspect() instead of calling typing.get_type_hints() repeatedly.
+    """
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        # Reason: Ruff's bug
+        self.type_hints: Dict[str, Any] = get_type_hints(cls)  # noqa: UP006
+        self.origins: Dict[str, Any] = {  # noqa: UP006
+            name: get_origin(hint) for name, hint in self.type_hints.items()
+        }
+        self.args: Dict[str, Tuple[Any, ...]] = {  # noqa: UP006
+            name: get_args(hint) for name, hint in self.type_hints.items()
+        }
+
+
+_registry: WeakKeyDictionary[type, ClassIntrospection] = WeakKeyDictionary()
+
+
+def introspect(cls: type) -> ClassIntrospection:
+    """Get introspection of the class, resolving its type hints on the first call.
+
+    The returned dictionaries are shared, so callers must not modify them.
+    """
+    introspection = _registry.get(cls)
+    if introspection is None:
+        introspection = ClassIntrospection(cls)
+        _registry[cls] = introspection
+    return introspection
+
+
+class FieldEntry(NamedTuple):
+    """Attributes of a dataclass field which are looked up on creating, loading and accessing config."""
+
+    name: str
+    # Key of instance dictionary where ConfigProperty stores the value
+    private_name: str
+    # Resolved type hint, None when the field has no type hint
+    type: Any
+    # dataclasses.MISSING when the field doesn't have it
+    default: Any
+    default_factory: Any
+    init: bool
+    field: dataclasses.Field[Any]
+
+
+class FieldTable:
+    """Fields of a dataclass indexed by name.
+
+    dataclasses.fields() builds a tuple by filtering all fields including pseudo-fields every call, and finding a field
+    in it by name is a linear scan, so this table is built once per class through field_table() instead.
+    """
+
+    def __init__(self, cls: type) -> None:
+        type_hints = introspect(cls).type_hints
+        # Reason: Ruff's bug
+        self.entries: Dict[str, FieldEntry] = {  # noqa: UP006
+            field.name: FieldEntry(
+                field.name,
+                f"__{field.name}",
+                type_hints.get(field.name),
+                field.default,
+                field.default_factory,
+                field.init,
+                field,
+            )
+            for field in dataclasses.fields(cls)
+        }
+        self.init_entries = tuple(entry for entry in self.entries.values() if entry.init)
+
+    def get(self, name: str) -> Optional[FieldEntry]:  # noqa: UP045  # Reason: Ruff's bug
+        return self.entries.get(name)
+
+
+_field_tables: WeakKeyDictionary[type, FieldTable] = WeakKeyDictionary()
+
+
+def field_table(cls: type) -> FieldTable:
+    """Get field table of the dataclass.
+
+    The table is cached once the class is processed by @dataclass decorator. Before that, for example in
+    __init_subclass__(), fields are inherited from the parent class and may change, so the table is built every call.
+    """
+    table = _field_tables.get(cls)
+    if table is None:
+        table = FieldTable(cls)
+        if "__dataclass_fields__" in cls.__dict__:
+            _field_tables[cls] = table
+    return table
+
+
+def forget_field_tables(cls: type) -> None:
+    """Discard cached field tables of the class and its parents after their fields are replaced."""
+    for klass in cls.__mro__:
+        _field_tables.pop(klass, None)
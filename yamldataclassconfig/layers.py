@@ -0,0 +1,104 @@
+"""Layered config files which are deep-merged in order, for example, base config and overlay per environment.
+
+Merge semantics, from the first layer to the last one:
+- Mappings are merged key by key recursively.
+- Any other value, including lists and null, replaces the value of earlier layers as a whole.
+- Empty layer file changes nothing.
+
+Parsed content of each layer is cached with its stamp, so reloading after one overlay changed parses only that layer.
+Merging copies mappings and lists on the way, so loaded values never share mutable objects with the cache.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from yamldataclassconfig.exceptions import ConfigValidationError
+from yamldataclassconfig.instrumentation import phase
+from yamldataclassconfig.utility import open_config_file
+from yamldataclassconfig.yaml_backend import get_yaml_backend
+
+if TYPE_CHECKING:
+    from typing import Iterable
+    from typing import Optional
+
+    from yamldataclassconfig.change_detection import FileStamp
+    from yamldataclassconfig.change_detection import LayerStamps
+
+
+def copy_tree(value: Any) -> Any:  # noqa: ANN401
+    """Copy mappings and lists recursively, sharing immutable leaves."""
+    if isinstance(value, dict):
+        return {key: copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_tree(item) for item in value]
+    return value
+
+
+# Reason: Ruff's bug
+def merge_into(target: Dict[Any, Any], overlay: Dict[Any, Any]) -> None:  # noqa: UP006
+    """Merge copy of the overlay into the target which is owned by the caller."""
+    for key, value in overlay.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merge_into(current, value)
+        else:
+            target[key] = copy_tree(value)
+
+
+# Reason: Ruff's bug
+def merge_layers(layers: Iterable[Dict[Any, Any]]) -> Dict[Any, Any]:  # noqa: UP006
+    """Deep-merge layers into new dictionary, later layers take precedence."""
+    merged: Dict[Any, Any] = {}  # noqa: UP006  # Reason: Ruff's bug
+    for layer in layers:
+        merge_into(merged, layer)
+    return merged
+
+
+class LayerCache:
+    """Parsed content of layer files keyed by path, reused while the stamp of the file matches."""
+
+    def __init__(self) -> None:
+        # Reason: Ruff's bug
+        self.entries: Dict[str, Tuple[FileStamp, str, Dict[Any, Any]]] = {}  # noqa: UP006
+
+    # Reason: Ruff's bug
+    def parse_all(
+        self,
+        cls: type,
+        stamps: LayerStamps,
+        yaml_backend: str,
+        max_size: Optional[int],  # noqa: UP045
+    ) -> List[Dict[Any, Any]]:  # noqa: UP006
+        """Return parsed content of each layer, parsing only layers which changed since the last call.
+
+        Entries of files which are no longer layers are dropped.
+        """
+        entries = {stamp.path: self.parse(cls, stamp, yaml_backend, max_size) for stamp in stamps}
+        self.entries = entries
+        return [entries[stamp.path][2] for stamp in stamps]
+
+    # Reason: Ruff's bug
+    def parse(
+        self,
+        cls: type,
+        stamp: FileStamp,
+        yaml_backend: str,
+        max_size: Optional[int],  # noqa: UP045
+    ) -> Tuple[FileStamp, str, Dict[Any, Any]]:  # noqa: UP006
+        entry = self.entries.get(stamp.path)
+        if entry is not None and entry[1] == yaml_backend and entry[0].matches(stamp):
+            return entry
+        with phase("parse", cls, stamp.path, stamp.size), open_config_file(Path(stamp.path), max_size) as file:
+            content = get_yaml_backend(yaml_backend).load(file)
+        if content is None:
+            content = {}
+        elif not isinstance(content, dict):
+            msg = f"Config layer {stamp.path} must be a mapping, got {type(content).__name__}"
+            raise ConfigValidationError(msg)
+        return stamp, yaml_backend, content
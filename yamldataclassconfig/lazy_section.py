@@ -0,0 +1,275 @@
+"""Nested sections of config which are deserialized on the first access.
+
+When LAZY_SECTIONS of the config class is True, load() leaves the parsed data of each nested DataClassJsonMixin section
+in a placeholder instead of deserializing it. The placeholder is an instance of a subclass generated per section class,
+so isinstance() holds and generated deserializer passes it through as already deserialized. The subclass intercepts
+every attribute lookup except special ones, so fields which have defaults on the section class are not read from the
+class. On the first access to any attribute of the placeholder, the data is validated and deserialized, and the
+placeholder becomes a plain instance of the section class in place by replacing its attributes and switching its class,
+so later accesses cost nothing extra.
+The top level is deserialized by the selected deserializer. Marshmallow deserializes it by schema derived per config
+class whose section fields pass placeholders through.
+
+Errors in the data of a section are raised on the first access instead of on load(). Until then, the placeholder keeps
+the parsed values as its attributes under interned field names, so it takes about as much memory as the deserialized
+section, and the parsed values are replaced on the first access.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import sys
+import threading
+from inspect import getattr_static
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from typing import Type
+from weakref import WeakKeyDictionary
+
+from dataclasses_json import DataClassJsonMixin
+from dataclasses_json.cfg import global_config
+from marshmallow.fields import Field
+from marshmallow.fields import Raw
+
+from yamldataclassconfig.deserializer import Mismatch
+from yamldataclassconfig.deserializer import UnsupportedError
+from yamldataclassconfig.deserializer import check_deserializer
+from yamldataclassconfig.deserializer import deserialize
+from yamldataclassconfig.deserializer import get_from_dict
+from yamldataclassconfig.deserializer import get_nested_deserializer
+from yamldataclassconfig.env_override import dataclass_of
+from yamldataclassconfig.introspection import introspect
+from yamldataclassconfig.schema_cache import SCHEMA_CACHE
+from yamldataclassconfig.validation import get_validation_plan
+
+if TYPE_CHECKING:
+    from dataclasses_json.mm import SchemaType
+
+logger = logging.getLogger(__name__)
+
+# Names of class attributes which refer section class and name of deserializer from the generated subclass
+LAZY_SECTION_BASE = "_lazy_section_base"
+LAZY_SECTION_DESERIALIZER = "_lazy_section_deserializer"
+# Name of class attribute which lists names of fields which can be set without descriptors of the section class
+LAZY_SECTION_FIELDS = "_lazy_section_fields"
+
+# Materializing is rare and short, so a single lock for all placeholders is enough
+_lock = threading.Lock()
+# Reason: Ruff's bug
+_classes: WeakKeyDictionary[type, Dict[str, type]] = WeakKeyDictionary()  # noqa: UP006
+_section_fields: WeakKeyDictionary[type, Dict[str, type]] = WeakKeyDictionary()  # noqa: UP006
+# Schema of the config class from the schema cache and the schema derived from it for placeholders
+_schemas: WeakKeyDictionary[type, Tuple[SchemaType[Any], SchemaType[Any]]] = WeakKeyDictionary()  # noqa: UP006
+
+
+def section_class_of(type_hint: Any) -> Any:  # noqa: ANN401
+    """Return DataClassJsonMixin class of the type hint which is the class itself or Optional of it, or None."""
+    candidate = dataclass_of(type_hint)
+    if candidate is None or not issubclass(candidate, DataClassJsonMixin):
+        return None
+    # Placeholder can't switch its class to the class whose instances have no dictionary
+    return None if "__slots__" in candidate.__dict__ else candidate
+
+
+# Reason: Ruff's bug
+def lazy_section_fields(cls: type) -> Dict[str, type]:  # noqa: UP006
+    """Map names of fields which can be deserialized lazily to their section classes, computing it on the first call.
+
+    Fields whose metadata or global config of dataclasses-json customizes decoding are deserialized eagerly, and so are
+    all fields of the class which customizes it by dataclass_json_config.
+    """
+    sections = _section_fields.get(cls)
+    if sections is None:
+        type_hints = introspect(cls).type_hints
+        sections = {}
+        customized_class = getattr(cls, "dataclass_json_config", None) is not None
+        for field in () if customized_class else dataclasses.fields(cls):
+            section_class = section_class_of(type_hints.get(field.name))
+            metadata = field.metadata.get("dataclasses_json", {})
+            customized = (
+                isinstance(metadata.get("mm_field"), Field) or "decoder" in metadata or "letter_case" in metadata
+            )
+            if section_class is None or customized or section_class in global_config.decoders:
+                continue
+            sections[field.name] = section_class
+        _section_fields[cls] = sections
+    return sections
+
+
+# Reason: Ruff's bug
+def deserialize_lazily(cls: type, dictionary_config: Dict[str, Any], name: str) -> Any:  # noqa: ANN401,UP006
+    """Deserialize dictionary into instance of config class, leaving data of nested sections in placeholders.
+
+    The top level is deserialized by the deserializer specified by name, which passes placeholders through as already
+    deserialized sections. Content whose sections are neither mappings nor null is deserialized eagerly, so that the
+    errors are the same as eager loading.
+    """
+    check_deserializer(name)
+    sections = lazy_section_fields(cls)
+    if (
+        not sections
+        or not isinstance(dictionary_config, dict)
+        or not all(isinstance(dictionary_config.get(field_name), (dict, type(None))) for field_name in sections)
+    ):
+        return deserialize(cls, dictionary_config, name)
+    data = dict(dictionary_config)
+    for field_name, section_class in sections.items():
+        raw = data.get(field_name)
+        if raw is not None:
+            data[field_name] = create_placeholder(section_class, raw, name)
+    from_dict = get_from_dict(cls) if name == "generated" else None
+    if from_dict is not None:
+        try:
+            return from_dict(data)
+        except Mismatch:
+            pass
+    return lazy_schema(cls, sections).load(data)
+
+
+# Reason: Ruff's bug
+def lazy_schema(cls: type, sections: Dict[str, type]) -> SchemaType[Any]:  # noqa: UP006
+    """Get marshmallow schema of the config class whose section fields pass placeholders through.
+
+    Section fields are replaced by Raw fields which keep checking required and null values as the original fields do.
+    The schema is derived again when the schema cache has rebuilt the original one.
+    """
+    schema = SCHEMA_CACHE.get(cls)
+    entry = _schemas.get(cls)
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    namespace = {}
+    for field_name in sections:
+        original = schema.fields[field_name]
+        namespace[field_name] = Raw(
+            required=original.required,
+            allow_none=original.allow_none,
+            load_default=original.load_default,
+            data_key=original.data_key,
+        )
+    derived: SchemaType[Any] = type(type(schema).__name__, (type(schema),), namespace)()
+    _schemas[cls] = (schema, derived)
+    return derived
+
+
+# Reason: Ruff's bug
+def create_placeholder(section_class: type, raw: Dict[str, Any], deserializer: str) -> Any:  # noqa: ANN401,UP006
+    """Create placeholder of the section which holds a copy of the data as its attributes until the first access."""
+    lazy = lazy_class(section_class, deserializer)
+    placeholder: Any = object.__new__(lazy)
+    if raw.keys() <= lazy.__dict__[LAZY_SECTION_FIELDS]:
+        # Attributes set one by one share keys with the other placeholders of the class as instances do
+        for key, value in raw.items():
+            object.__setattr__(placeholder, sys.intern(key), value)
+    else:
+        object.__setattr__(placeholder, "__dict__", dict(raw))
+    return placeholder
+
+
+def is_placeholder(value: Any) -> bool:  # noqa: ANN401
+    """Return whether the value is a placeholder of section which is not deserialized yet."""
+    return LAZY_SECTION_BASE in type(value).__dict__
+
+
+def lazy_class(section_class: type, deserializer: str) -> type:
+    """Get subclass of the section class for placeholders of the deserializer, creating it on the first call.
+
+    The subclass has the same name, so that error messages and repr() don't reveal placeholders.
+    """
+    classes = _classes.get(section_class)
+    if classes is None:
+        classes = _classes[section_class] = {}
+    lazy = classes.get(deserializer)
+    if lazy is None:
+        # Reason: Ruff's bug
+        namespace: Dict[str, Any] = {  # noqa: UP006
+            "__getattribute__": get_materialized,
+            "__setattr__": set_materialized,
+            # Equality of dataclass requires the same class
+            "__eq__": equal_materialized,
+            "__reduce_ex__": reduce_placeholder,
+            "__module__": section_class.__module__,
+            "__qualname__": section_class.__qualname__,
+            "__doc__": section_class.__doc__,
+            LAZY_SECTION_BASE: section_class,
+            LAZY_SECTION_DESERIALIZER: deserializer,
+            LAZY_SECTION_FIELDS: frozenset(
+                field.name
+                for field in dataclasses.fields(section_class)
+                if not hasattr(getattr_static(section_class, field.name, None), "__set__")
+            ),
+        }
+        lazy = type(section_class.__name__, (section_class,), namespace)
+        classes[deserializer] = lazy
+    return lazy
+
+
+def materialize(placeholder: Any) -> None:  # noqa: ANN401
+    """Deserialize data of the placeholder and turn it into plain instance of the section class in place."""
+    with _lock:
+        lazy = type(placeholder)
+        section_class = lazy.__dict__.get(LAZY_SECTION_BASE)
+        if section_class is None:
+            # Another thread has materialized it
+            return
+        state = placeholder.__dict__
+        raw = dict(state)
+        get_validation_plan(section_class).validate(raw)
+        section = deserialize_section(section_class, raw, lazy.__dict__[LAZY_SECTION_DESERIALIZER])
+        state.clear()
+        state.update(vars(section))
+        object.__setattr__(placeholder, "__class__", section_class)
+
+
+# Reason: Ruff's bug
+def deserialize_section(
+    section_class: Type[DataClassJsonMixin],  # noqa: UP006
+    raw: Dict[str, Any],  # noqa: UP006
+    deserializer: str,
+) -> Any:  # noqa: ANN401
+    """Deserialize data of the section as eager loading does with the deserializer."""
+    if deserializer == "generated":
+        try:
+            function = get_nested_deserializer(section_class).function
+        except UnsupportedError:
+            logger.debug("Deserialize %s by marshmallow since generator doesn't cover it", section_class.__name__)
+        else:
+            try:
+                if function is not None:
+                    return function(raw)
+            except Mismatch:
+                pass
+    return SCHEMA_CACHE.get(section_class).load(raw)
+
+
+def get_materialized(placeholder: Any, name: str) -> Any:  # noqa: ANN401
+    """Materialize on access to any attribute, including fields which have defaults on the section class."""
+    if name.startswith("__"):
+        # Special attributes looked up by copy, pickle and so on are not fields
+        return object.__getattribute__(placeholder, name)
+    materialize(placeholder)
+    return getattr(placeholder, name)
+
+
+def set_materialized(placeholder: Any, name: str, value: Any) -> None:  # noqa: ANN401
+    """Materialize before assignment so that the assigned value isn't overwritten by the data."""
+    materialize(placeholder)
+    setattr(placeholder, name, value)
+
+
+def equal_materialized(placeholder: Any, other: object) -> bool:  # noqa: ANN401
+    materialize(placeholder)
+    return bool(placeholder == other)
+
+
+# Reason: Ruff's bug
+def reduce_placeholder(
+    placeholder: Any,  # noqa: ANN401
+    _protocol: int,
+) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:  # noqa: UP006
+    """Pickle and copy placeholder as placeholder of the same data, which keeps the section lazy in on-disk cache."""
+    lazy = type(placeholder).__dict__
+    return create_placeholder, (lazy[LAZY_SECTION_BASE], dict(placeholder.__dict__), lazy[LAZY_SECTION_DESERIALIZER])
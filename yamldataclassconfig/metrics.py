@@ -0,0 +1,219 @@
+"""Counters and histograms of loading config per config class, aggregated from load listeners.
+
+MetricsRegistry.install() registers the registry as a listener of yamldataclassconfig.instrumentation, so every load(),
+aload(), load_many() and reload by ConfigWatcher is counted. Only end events are aggregated, each under a single short
+lock. The registry exposes a snapshot as dictionary and exports it in Prometheus text exposition format.
+
+Metrics per config class are:
+- loads: loads which applied values
+- failures: loads which raised an exception
+- validation_errors: type errors found by validation
+- bytes_read: bytes of config files read
+- cache_hits and cache_misses: loads skipped as unchanged file, and lookups of the on-disk cache
+- phases: histogram of seconds per phase
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from yamldataclassconfig.instrumentation import add_load_listener
+from yamldataclassconfig.instrumentation import remove_load_listener
+
+if TYPE_CHECKING:
+    from yamldataclassconfig.instrumentation import LoadPhaseEvent
+
+__all__ = ["DEFAULT_DURATION_BUCKETS", "MetricsRegistry"]
+
+# Upper bounds in seconds of histogram buckets, +Inf is implied
+DEFAULT_DURATION_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+# Cache which stamp and cache phases report hit of
+CACHES = {"stamp": "unchanged", "cache": "disk"}
+PREFIX = "yamldataclassconfig"
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+class PhaseHistogram:
+    """Histogram of durations of a phase."""
+
+    __slots__ = ("counts", "total_ns")
+
+    def __init__(self, buckets: int) -> None:
+        # Count per bucket, the last one is +Inf, not cumulative
+        self.counts = [0] * (buckets + 1)
+        self.total_ns = 0
+
+
+class ClassMetrics:
+    """Metrics of a config class."""
+
+    def __init__(self) -> None:
+        self.loads = 0
+        self.failures = 0
+        self.validation_errors = 0
+        self.bytes_read = 0
+        # Reason: Ruff's bug
+        self.cache_hits: Dict[str, int] = dict.fromkeys(CACHES.values(), 0)  # noqa: UP006
+        self.cache_misses: Dict[str, int] = dict.fromkeys(CACHES.values(), 0)  # noqa: UP006
+        self.phases: Dict[str, PhaseHistogram] = {}  # noqa: UP006
+
+
+class MetricsRegistry:
+    """In-process registry of metrics of loading config per config class."""
+
+    # Reason: Ruff's bug
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_DURATION_BUCKETS) -> None:  # noqa: UP006
+        self.buckets = tuple(sorted(buckets))
+        self._bounds_ns = [bucket * NANOSECONDS_PER_SECOND for bucket in self.buckets]
+        self._lock = threading.Lock()
+        self._classes: Dict[str, ClassMetrics] = {}  # noqa: UP006  # Reason: Ruff's bug
+
+    def install(self) -> MetricsRegistry:
+        """Start collecting metrics of loading config and return self."""
+        add_load_listener(self.observe)
+        return self
+
+    def uninstall(self) -> None:
+        """Stop collecting metrics, collected ones are kept."""
+        remove_load_listener(self.observe)
+
+    def reset(self) -> None:
+        """Discard collected metrics."""
+        with self._lock:
+            self._classes = {}
+
+    def observe(self, event: LoadPhaseEvent) -> None:
+        """Aggregate the end event of phase, called by the load pipeline."""
+        if event.duration_ns is None:
+            return
+        key = f"{event.cls.__module__}.{event.cls.__qualname__}"
+        index = bisect_left(self._bounds_ns, event.duration_ns)
+        with self._lock:
+            metrics = self._classes.get(key)
+            if metrics is None:
+                metrics = self._classes[key] = ClassMetrics()
+            histogram = metrics.phases.get(event.phase)
+            if histogram is None:
+                histogram = metrics.phases[event.phase] = PhaseHistogram(len(self.buckets))
+            histogram.counts[index] += 1
+            histogram.total_ns += event.duration_ns
+            self._count(metrics, event)
+
+    @staticmethod
+    def _count(metrics: ClassMetrics, event: LoadPhaseEvent) -> None:
+        if event.error is not None:
+            metrics.failures += 1
+            if event.phase == "validate":
+                metrics.validation_errors += len(getattr(event.error, "exceptions", (event.error,)))
+            return
+        if event.phase in {"read", "parse"} and event.size is not None:
+            metrics.bytes_read += event.size
+        elif event.phase == "apply":
+            metrics.loads += 1
+        cache = CACHES.get(event.phase)
+        if cache is not None and event.hit is not None:
+            counts = metrics.cache_hits if event.hit else metrics.cache_misses
+            counts[cache] += 1
+
+    # Reason: Ruff's bug
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:  # noqa: UP006
+        """Return copy of metrics keyed by qualified names of config classes.
+
+        Histograms of phases have count, sum in seconds and cumulative counts keyed by upper bounds of buckets.
+        cache_hit_ratio is None when no cache was looked up.
+        """
+        with self._lock:
+            return {key: self._snapshot_class(metrics) for key, metrics in self._classes.items()}
+
+    # Reason: Ruff's bug
+    def _snapshot_class(self, metrics: ClassMetrics) -> Dict[str, Any]:  # noqa: UP006
+        hits = sum(metrics.cache_hits.values())
+        lookups = hits + sum(metrics.cache_misses.values())
+        phases = {}
+        for name, histogram in metrics.phases.items():
+            cumulative = 0
+            # Reason: Ruff's bug
+            buckets: Dict[str, int] = {}  # noqa: UP006
+            for bound, count in zip((*map(format_bound, self.buckets), "+Inf"), histogram.counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            phases[name] = {
+                "count": cumulative,
+                "sum": histogram.total_ns / NANOSECONDS_PER_SECOND,
+                "buckets": buckets,
+            }
+        return {
+            "loads": metrics.loads,
+            "failures": metrics.failures,
+            "validation_errors": metrics.validation_errors,
+            "bytes_read": metrics.bytes_read,
+            "cache_hits": dict(metrics.cache_hits),
+            "cache_misses": dict(metrics.cache_misses),
+            "cache_hit_ratio": hits / lookups if lookups else None,
+            "phases": phases,
+        }
+
+    def to_prometheus(self) -> str:
+        """Export snapshot in Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []  # noqa: UP006  # Reason: Ruff's bug
+        counters = (
+            ("loads", "Loads of config which applied values"),
+            ("failures", "Loads of config which raised an exception"),
+            ("validation_errors", "Type errors found by validating config"),
+            ("bytes_read", "Bytes of config files read"),
+        )
+        for name, help_text in counters:
+            lines.extend(header(f"{PREFIX}_{name}_total", "counter", help_text))
+            lines.extend(
+                sample(f"{PREFIX}_{name}_total", {"config_class": key}, metrics[name])
+                for key, metrics in snapshot.items()
+            )
+        for name, help_text in (
+            ("cache_hits", "Lookups which found cached result"),
+            ("cache_misses", "Lookups which found no cached result"),
+        ):
+            lines.extend(header(f"{PREFIX}_{name}_total", "counter", help_text))
+            for key, metrics in snapshot.items():
+                lines.extend(
+                    sample(f"{PREFIX}_{name}_total", {"config_class": key, "cache": cache}, count)
+                    for cache, count in metrics[name].items()
+                )
+        metric = f"{PREFIX}_phase_duration_seconds"
+        lines.extend(header(metric, "histogram", "Seconds per phase of loading config"))
+        for key, metrics in snapshot.items():
+            for phase, histogram in metrics["phases"].items():
+                labels = {"config_class": key, "phase": phase}
+                lines.extend(
+                    sample(f"{metric}_bucket", {**labels, "le": bound}, count)
+                    for bound, count in histogram["buckets"].items()
+                )
+                lines.append(sample(f"{metric}_sum", labels, histogram["sum"]))
+                lines.append(sample(f"{metric}_count", labels, histogram["count"]))
+        return "\n".join(lines) + "\n"
+
+
+def format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+# Reason: Ruff's bug
+def header(name: str, type_: str, help_text: str) -> List[str]:  # noqa: UP006
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {type_}"]
+
+
+# Reason: Ruff's bug
+def sample(name: str, labels: Dict[str, str], value: float) -> str:  # noqa: UP006
+    formatted_labels = ",".join(f'{label}="{escape(label_value)}"' for label, label_value in labels.items())
+    return f"{name}{{{formatted_labels}}} {value!r}"
+
+
+def escape(value: str) -> str:
+    """Escape label value as Prometheus text format requires."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,129 @@
+"""This module implements per-class cache of marshmallow schema."""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+from typing import Set
+from typing import Tuple
+from typing import Type
+from weakref import WeakKeyDictionary
+
+from yamldataclassconfig.introspection import get_args
+
+if TYPE_CHECKING:
+    from dataclasses_json import DataClassJsonMixin
+    from dataclasses_json.mm import SchemaType
+
+__all__ = [
+    "SchemaCacheInfo",
+    "clear_schema_cache",
+    "schema_cache_info",
+]
+
+
+class SchemaCacheInfo(NamedTuple):
+    """Statistics of schema cache."""
+
+    hits: int
+    misses: int
+    invalidations: int
+    currsize: int
+
+
+# Reason: Ruff's bug
+def fingerprint(cls: Type[DataClassJsonMixin]) -> Tuple[Any, ...]:  # noqa: UP006
+    """Identify the state of class which marshmallow schema is built from.
+
+    Fields, their defaults and items of "dataclasses_json" metadata are compared by identity, so replacing any of them
+    changes the fingerprint. Nested dataclasses in field types are included since their schemas are built together.
+    """
+    return describe(cls, set())
+
+
+# Reason: Ruff's bug
+def describe(cls: type, seen: Set[type]) -> Tuple[Any, ...]:  # noqa: UP006
+    """Describe the dataclass, stopping at dataclasses already described to support recursive types."""
+    seen.add(cls)
+    return (
+        id(getattr(cls, "dataclass_json_config", None)),
+        tuple(
+            (
+                id(field),
+                field.type,
+                id(field.default),
+                tuple((key, id(value)) for key, value in field.metadata.get("dataclasses_json", {}).items()),
+                describe_nested(field.type, seen),
+            )
+            for field in dataclasses.fields(cls)
+        ),
+    )
+
+
+# Reason: Ruff's bug
+def describe_nested(type_: Any, seen: Set[type]) -> Tuple[Any, ...]:  # noqa: ANN401,UP006
+    """Describe dataclasses in the type hint.
+
+    String annotations aren't resolved, since dataclasses-json doesn't resolve them to build schema either.
+    """
+    if isinstance(type_, type) and dataclasses.is_dataclass(type_):
+        return () if type_ in seen else (describe(type_, seen),)
+    return tuple(description for arg in get_args(type_) for description in describe_nested(arg, seen))
+
+
+class SchemaCache:
+    """Cache of marshmallow schema for each config class."""
+
+    def __init__(self) -> None:
+        # Reason: Ruff's bug
+        self.entries: WeakKeyDictionary[type, Tuple[Tuple[Any, ...], SchemaType[Any]]]  # noqa: UP006
+        self.entries = WeakKeyDictionary()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # Reason: Ruff's bug
+    def get(self, cls: Type[DataClassJsonMixin]) -> SchemaType[Any]:  # noqa: UP006
+        """Get schema of the class, build it when it isn't cached or the class has changed since cached."""
+        current = fingerprint(cls)
+        entry = self.entries.get(cls)
+        if entry is not None and entry[0] == current:
+            with self.lock:
+                self.hits += 1
+            return entry[1]
+        schema = cls.schema()
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.invalidations += 1
+            self.entries[cls] = (current, schema)
+        return schema
+
+    def info(self) -> SchemaCacheInfo:
+        with self.lock:
+            return SchemaCacheInfo(self.hits, self.misses, self.invalidations, len(self.entries))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+
+SCHEMA_CACHE = SchemaCache()
+
+
+def schema_cache_info() -> SchemaCacheInfo:
+    """Report statistics of schema cache shared by all config classes."""
+    return SCHEMA_CACHE.info()
+
+
+def clear_schema_cache() -> None:
+    """Clear schema cache and its statistics."""
+    SCHEMA_CACHE.clear()
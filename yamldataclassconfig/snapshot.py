@@ -0,0 +1,78 @@
+"""Immutable snapshots of loaded config values."""
+
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Iterable
+from typing import Tuple
+from typing import Type
+from weakref import WeakKeyDictionary
+
+from yamldataclassconfig.introspection import field_table
+
+__all__ = ["ConfigSnapshot"]
+
+# Fields of YamlDataClassConfig which hold state of loading rather than config values
+INTERNAL_FIELDS = frozenset({"FILE_PATH", "_loaded", "_needs_property_descriptors"})
+
+
+class ConfigSnapshot(tuple):  # type: ignore[type-arg]
+    """Immutable values of config fields, accessible by attribute like the config instance.
+
+    Each config class has its own subclass whose attributes are generated from the fields, see snapshot_class().
+    """
+
+    __slots__ = ()
+    # Reason: Ruff's bug
+    _fields: ClassVar[Tuple[str, ...]] = ()  # noqa: UP006
+
+    # Reason: Ruff's bug
+    def _asdict(self) -> Dict[str, Any]:  # noqa: UP006
+        """Return values of fields as new dictionary."""
+        return dict(zip(self._fields, self))
+
+    def _replace_at(self, index: int, value: Any) -> ConfigSnapshot:  # noqa: ANN401
+        """Return new snapshot of the same class whose value at index is replaced."""
+        return tuple.__new__(self.__class__, (*self[:index], value, *self[index + 1 :]))
+
+    if TYPE_CHECKING:
+        # Attributes are generated per config class
+        def __getattr__(self, name: str) -> Any: ...  # noqa: ANN401
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        msg = f"{self.__class__.__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in zip(self._fields, self))
+        return f"{self.__class__.__name__}({values})"
+
+
+# Reason: Ruff's bug
+_classes: WeakKeyDictionary[type, Type[ConfigSnapshot]] = WeakKeyDictionary()  # noqa: UP006
+
+
+def snapshot_fields(cls: type) -> Tuple[str, ...]:  # noqa: UP006
+    """Names of config fields which snapshot of the class holds, in order of the fields."""
+    return tuple(name for name in field_table(cls).entries if name not in INTERNAL_FIELDS)
+
+
+def snapshot_class(cls: type) -> Type[ConfigSnapshot]:  # noqa: UP006
+    """Get subclass of ConfigSnapshot for the config class, creating it on the first call."""
+    snapshot_type = _classes.get(cls)
+    if snapshot_type is None:
+        names = snapshot_fields(cls)
+        namespace: Dict[str, Any] = {"__slots__": (), "_fields": names}  # noqa: UP006
+        namespace.update({name: property(itemgetter(index)) for index, name in enumerate(names)})
+        snapshot_type = type(f"{cls.__name__}Snapshot", (ConfigSnapshot,), namespace)
+        _classes[cls] = snapshot_type
+    return snapshot_type
+
+
+def create_snapshot(cls: type, values: Iterable[Any]) -> ConfigSnapshot:
+    """Create snapshot of the config class from values in order of snapshot_fields()."""
+    return tuple.__new__(snapshot_class(cls), values)
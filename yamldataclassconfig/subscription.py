@@ -0,0 +1,133 @@
+"""Notifications of changed config fields after reload.
+
+YamlDataClassConfig.subscribe() registers a callback for field paths such as "database.host" or "database". After each
+reload which applied values, every subscription is checked by comparing the values at its paths before and after the
+reload, and the callback is called once with the list of FieldChange of its changed paths. Subscriptions whose paths
+didn't change are not called, and nothing is dispatched on the first load since there are no old values.
+
+Paths are checked against the fields of the config class and nested sections on subscribe(), so that a typo is reported
+immediately instead of never being notified. Values are compared by identity first, so unchanged sections reused by
+INCREMENTAL_RELOAD cost nothing. Callbacks run in the thread which reloaded, for example the thread of ConfigWatcher,
+after the new values are applied. Exceptions raised by callbacks or by reading values at their paths are logged and
+don't affect loading or other callbacks.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from yamldataclassconfig.env_override import dataclass_of
+from yamldataclassconfig.introspection import introspect
+from yamldataclassconfig.snapshot import snapshot_fields
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from yamldataclassconfig.snapshot import ConfigSnapshot
+
+__all__ = ["FieldChange", "Subscription"]
+
+logger = logging.getLogger(__name__)
+
+SEPARATOR = "."
+
+
+class FieldChange(NamedTuple):
+    """Change of the value at the subscribed path by reload."""
+
+    # Subscribed path to the field, for example, "database.host"
+    path: str
+    old: Any
+    new: Any
+
+
+ChangeCallback = Callable[[List[FieldChange]], Any]
+
+
+class Subscription:
+    """Callback subscribed to field paths of a config instance, returned by YamlDataClassConfig.subscribe()."""
+
+    __slots__ = ("callback", "names", "paths")
+
+    def __init__(self, cls: type, paths: Iterable[str], callback: ChangeCallback) -> None:
+        self.paths = tuple(paths)
+        # Reason: Ruff's bug
+        self.names: Tuple[Tuple[str, ...], ...] = tuple(compile_path(cls, path) for path in self.paths)  # noqa: UP006
+        self.callback = callback
+
+    # Reason: Ruff's bug
+    def changes(self, previous: ConfigSnapshot, current: ConfigSnapshot) -> List[FieldChange]:  # noqa: UP006
+        """Return changes of the subscribed paths in order of the paths."""
+        changes = []
+        for path, names in zip(self.paths, self.names):
+            old = resolve(previous, names)
+            new = resolve(current, names)
+            if old is not new and old != new:
+                changes.append(FieldChange(path, old, new))
+        return changes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self.paths)} -> {self.callback!r})"
+
+
+# Reason: Ruff's bug
+def compile_path(cls: type, path: str) -> Tuple[str, ...]:  # noqa: UP006
+    """Split the path into field names, checking that each of them is a field of the config class or the section."""
+    names = tuple(path.split(SEPARATOR))
+    section: Any = cls
+    for index, name in enumerate(names):
+        prefix = SEPARATOR.join(names[:index])
+        if section is None:
+            msg = f"Field '{prefix}' is not a section"
+            raise ValueError(msg)
+        available = (
+            snapshot_fields(section) if index == 0 else tuple(field.name for field in dataclasses.fields(section))
+        )
+        if name not in available:
+            msg = f"Unknown field '{SEPARATOR.join(names[: index + 1])}'. Available fields: {', '.join(available)}"
+            raise ValueError(msg)
+        section = dataclass_of(introspect(section).type_hints.get(name))
+    return names
+
+
+# Reason: Ruff's bug
+def resolve(snapshot: ConfigSnapshot, names: Tuple[str, ...]) -> Any:  # noqa: ANN401,UP006
+    """Return the value at the path, None when a section on the way is None."""
+    value: Any = snapshot
+    for name in names:
+        if value is None:
+            return None
+        value = getattr(value, name)
+    return value
+
+
+# Reason: Ruff's bug
+def notify(
+    subscriptions: Tuple[Subscription, ...],  # noqa: UP006
+    previous: ConfigSnapshot,
+    current: ConfigSnapshot,
+) -> None:
+    """Call each subscription whose paths changed once with the changes."""
+    for subscription in subscriptions:
+        dispatch(subscription, previous, current)
+
+
+def dispatch(subscription: Subscription, previous: ConfigSnapshot, current: ConfigSnapshot) -> None:
+    """Call the subscription if its paths changed, logging errors of reading values at the paths and of the callback.
+
+    Values are read in this step as well, for example, invalid data of lazy section raises on reading.
+    """
+    try:
+        changes = subscription.changes(previous, current)
+        if changes:
+            subscription.callback(changes)
+    # Reason: Subscriber must not break loading or the other subscribers.
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Subscriber %r failed", subscription)
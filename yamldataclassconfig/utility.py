@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import field
 from pathlib import Path
+from typing import BinaryIO
+from typing import Optional
 from typing import Union
 
+from yamldataclassconfig.exceptions import ConfigFileTooLargeError
+
 __all__ = ["build_path", "create_file_path_field"]
 
 
@@ -51,3 +56,23 @@ def resolve_path(path: Union[Path, str], *, path_is_absolute: bool = False) -> P
     if isinstance(path, str):
         return Path(path)
     return path
+
+
+# Reason: Ruff's bug
+def open_config_file(path: Path, max_size: Optional[int] = None) -> BinaryIO:  # noqa: UP045
+    """Open config file in binary mode so that YAML parser reads it by chunks instead of as one decoded string.
+
+    :param path: Path to the config file.
+    :param max_size: Maximum size of the file in bytes, unlimited when None.
+    :return: The opened file.
+    :raises ConfigFileTooLargeError: When the file is larger than max_size.
+    """
+    file = path.open("rb")
+    if max_size is not None:
+        # Check the opened file rather than the path so that replacing the file after the check doesn't bypass it
+        size = os.fstat(file.fileno()).st_size
+        if size > max_size:
+            file.close()
+            msg = f"Config file {path} is {size} bytes, which exceeds the maximum of {max_size} bytes"
+            raise ConfigFileTooLargeError(msg)
+    return file
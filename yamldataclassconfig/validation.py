@@ -5,12 +5,14 @@ from __future__ import annotations
 import dataclasses
 import sys
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import Union
+from weakref import WeakKeyDictionary
 
 try:
     from typing import get_origin
@@ -22,6 +24,7 @@ except ImportError:  # pragma nocover
 
 
 from yamldataclassconfig.exceptions import ConfigValidationError
+from yamldataclassconfig.introspection import introspect
 from yamldataclassconfig.nullable import is_nullable_type
 
 # Reason: ExceptionGroup is only available in Python 3.11+.
@@ -131,9 +134,73 @@ class YamlFieldValidations:
             raise ExceptionGroup(group_msg, errors)
 
 
+# Marker of the field which is skipped, nested dataclasses are validated by marshmallow
+SKIP = object()
+
+
+class ValidationPlan:
+    """Validation of YAML fields compiled from type hints.
+
+    Each field name is mapped to the type for isinstance() check or to SKIP in advance, so validating a config is a
+    single loop over its items which allocates only for errors.
+    """
+
+    # Reason: Ruff's bug
+    def __init__(self, type_hints: Dict[str, Any]) -> None:  # noqa: UP006
+        self.enabled = any(name != "FILE_PATH" for name in type_hints)
+        self.checks = {
+            field_name: self.compile(expected_type)
+            for field_name, expected_type in type_hints.items()
+            # ClassVar is setting of the class which can't be loaded from YAML
+            if get_origin(expected_type) is not ClassVar
+        }
+
+    @staticmethod
+    def compile(expected_type: Any) -> Any:  # noqa: ANN401
+        """Compile the type hint into the type for isinstance() check or SKIP."""
+        actual_expected_type = ExpectedType(expected_type).get_actual()
+        return SKIP if Validation.is_dataclass_type(actual_expected_type) else actual_expected_type
+
+    # Reason: Ruff's bug
+    def validate(self, dictionary_config: Dict[str, Any]) -> None:  # noqa: UP006
+        """Validate YAML fields against their expected types."""
+        if not self.enabled:
+            return
+        checks = self.checks
+        errors = []
+        for field_name, yaml_value in dictionary_config.items():
+            expected_type = checks.get(field_name, SKIP)
+            if expected_type is SKIP or yaml_value is None or isinstance(yaml_value, expected_type):
+                continue
+            errors.append(self.create_error(field_name, yaml_value, expected_type))
+        if errors:
+            group_msg = "Configuration validation failed"
+            raise ExceptionGroup(group_msg, errors)
+
+    @staticmethod
+    # Reason: Ruff's bug
+    def create_error(
+        field_name: str,
+        yaml_value: Any,  # noqa: ANN401
+        expected_type: Type[Any],  # noqa: UP006
+    ) -> ConfigValidationError:
+        msg = f"Field '{field_name}' expected {expected_type.__name__}, got {type(yaml_value).__name__}"
+        return ConfigValidationError(msg)
+
+
+_plans: WeakKeyDictionary[type, ValidationPlan] = WeakKeyDictionary()
+
+
+def get_validation_plan(cls: type) -> ValidationPlan:
+    """Get validation plan of the class, compiling it on the first call."""
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = ValidationPlan(introspect(cls).type_hints)
+        _plans[cls] = plan
+    return plan
+
+
 # Reason: Ruff's bug
 def validate_config_if_needed(dictionary_config: Dict[str, Any], type_hints: Dict[str, Any]) -> None:  # noqa: UP006
     """Validate configuration if type hints are present."""
-    if not type_hints or not any(name != "FILE_PATH" for name in type_hints):
-        return
-    YamlFieldValidations(dictionary_config, type_hints).validate()
+    ValidationPlan(type_hints).validate(dictionary_config)
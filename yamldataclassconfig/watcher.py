@@ -0,0 +1,344 @@
+"""Hot reload of config instances when their config file changes.
+
+On Linux the parent directories of the config file and its overlays are watched by inotify through ctypes, so that
+editors which write a temporary file and rename it over the config file are also detected. On other platforms, or when
+inotify is not available, the files are polled by os.stat().
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import Union
+from typing import cast
+
+from yamldataclassconfig.change_detection import LoadOptions
+from yamldataclassconfig.utility import resolve_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+    from typing import Self
+
+    from yamldataclassconfig.config import YamlDataClassConfig
+
+__all__ = ["WATCHER_BACKENDS", "ConfigWatcher"]
+
+WATCHER_BACKENDS = ("auto", "inotify", "polling")
+
+logger = logging.getLogger(__name__)
+
+# Constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+READ_SIZE = 64 * 1024
+
+
+# Reason: Ruff's bug
+def load_libc() -> Optional[ctypes.CDLL]:  # noqa: UP045
+    """Load libc which provides inotify, or return None when not available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:  # pragma: nocover
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+class PollingBackend:
+    """Detects changes by comparing os.stat() of the files periodically."""
+
+    def __init__(self, paths: Sequence[Path], interval: float, stopping: threading.Event) -> None:
+        self.paths = paths
+        self.interval = interval
+        self.stopping = stopping
+        self.last = self.stat()
+
+    # Reason: Ruff's bug
+    def stat(self) -> Tuple[Optional[Tuple[int, int, int]], ...]:  # noqa: UP006,UP045
+        return tuple(stat_file(path) for path in self.paths)
+
+    # Reason: Ruff's bug
+    def wait(self, timeout: Optional[float]) -> bool:  # noqa: UP045
+        """Block until the file changes or timeout expires, and return True if it changed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.stopping.is_set():
+            current = self.stat()
+            if current != self.last:
+                self.last = current
+                return True
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining <= 0:
+                return False
+            self.stopping.wait(remaining)
+        return False
+
+    def wake(self) -> None:
+        """Nothing to do since waiting is interrupted by the stopping event."""
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InotifyBackend:
+    """Detects changes by inotify events of the directories which contain the files."""
+
+    def __init__(self, paths: Sequence[Path], libc: ctypes.CDLL) -> None:
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        # Names of the files per watch descriptor of their directory
+        # Reason: Ruff's bug
+        self.names: Dict[int, Set[bytes]] = {}  # noqa: UP006
+        for path in paths:
+            watch = libc.inotify_add_watch(self.fd, os.fsencode(path.parent), WATCH_MASK)
+            if watch < 0:
+                errno = ctypes.get_errno()
+                os.close(self.fd)
+                raise OSError(errno, os.strerror(errno), str(path.parent))
+            self.names.setdefault(watch, set()).add(os.fsencode(path.name))
+        try:
+            self.wake_read, self.wake_write = os.pipe()
+        except OSError:
+            os.close(self.fd)
+            raise
+        # Guards file descriptors against waking after the watching thread closed them
+        self.lock = threading.Lock()
+        self.closed = False
+
+    # Reason: Ruff's bug
+    def wait(self, timeout: Optional[float]) -> bool:  # noqa: UP045
+        """Block until an event of the file arrives or timeout expires, and return True if it arrived."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self.fd, self.wake_read], [], [], remaining)
+            if not readable or self.wake_read in readable:
+                return False
+            if self.read_events():
+                return True
+
+    def read_events(self) -> bool:
+        """Read pending events and return True if any of them is about the file."""
+        try:
+            buffer = os.read(self.fd, READ_SIZE)
+        except BlockingIOError:
+            return False
+        offset = 0
+        found = False
+        while offset < len(buffer):
+            watch, _, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            found = found or name in self.names.get(watch, ())
+        return found
+
+    def wake(self) -> None:
+        """Interrupt waiting."""
+        with self.lock:
+            if not self.closed:
+                os.write(self.wake_write, b"\0")
+
+    def close(self) -> None:
+        """Release file descriptors."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            for fd in (self.fd, self.wake_read, self.wake_write):
+                os.close(fd)
+
+
+# Reason: Ruff's bug
+def stat_file(path: Path) -> Optional[Tuple[int, int, int]]:  # noqa: UP006,UP045
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class ConfigWatcher:
+    """Reloads the config instance in a background thread when its config file changes.
+
+    Reload is done by load() of the config instance, so that the file is parsed and validated off the threads which
+    read the config, and a change which leaves the content same is skipped by its change detection. When the config
+    instance was last loaded from the same file, reload uses the same overlays, YAML backend and deserializer, and the
+    overlays are watched as well. When reload fails, the config instance keeps the values of the last successful load
+    and the exception is passed to on_error.
+
+    Bursts of events such as write-then-rename of editors are debounced: reload starts after no event arrives for
+    debounce seconds.
+    """
+
+    # Reason: Ruff's bug
+    def __init__(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        self,
+        config: YamlDataClassConfig,
+        path: Optional[Union[Path, str]] = None,  # noqa: UP007,UP045
+        *,
+        path_is_absolute: bool = False,
+        backend: str = "auto",
+        debounce: float = 0.1,
+        poll_interval: float = 1.0,
+        on_error: Optional[Callable[[BaseException], Any]] = None,  # noqa: UP045
+    ) -> None:
+        """Create watcher, call start() or use it as context manager to start watching.
+
+        Args:
+            config: Config instance to reload
+            path: Path to YAML file, the file of the last load or FILE_PATH of config is used when omitted
+            path_is_absolute: If True, use path as absolute
+            backend: "inotify", "polling" or "auto" which uses inotify when available and falls back to polling when
+                inotify can't watch the files
+            debounce: Seconds to wait for the following events before reload
+            poll_interval: Seconds between checks of polling backend
+            on_error: Called with the exception when reload fails, the exception is logged when omitted
+        """
+        if backend not in WATCHER_BACKENDS:
+            msg = f"Unknown watcher backend '{backend}'. Available backends: {', '.join(WATCHER_BACKENDS)}"
+            raise ValueError(msg)
+        self.config = config
+        # Reason: Ruff's bug
+        options: Optional[LoadOptions] = getattr(config, "_load_options", None)  # noqa: UP045
+        if path is None and options is None:
+            path = config.FILE_PATH
+        if path is not None:
+            resolved = resolve_path(path, path_is_absolute=path_is_absolute)
+            if options is None or options.paths[0] != resolved:
+                options = LoadOptions((resolved,), config.YAML_BACKEND, config.DESERIALIZER)
+        self.options = cast("LoadOptions", options)
+        self.path = self.options.paths[0]
+        self.backend = backend
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.on_error = on_error
+        self.stopping = threading.Event()
+        # Reason: Ruff's bug
+        self._backend: Optional[Union[InotifyBackend, PollingBackend]] = None  # noqa: UP007,UP045
+        self._thread: Optional[threading.Thread] = None  # noqa: UP045
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self._thread is not None:
+            msg = "Watcher is already started"
+            raise RuntimeError(msg)
+        self.stopping.clear()
+        self._backend = self._create_backend()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._backend,),
+            name=f"ConfigWatcher({self.path.name})",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # Reason: Ruff's bug
+    def stop(self, timeout: Optional[float] = None) -> None:  # noqa: UP045
+        """Stop watching and wait for the thread to finish.
+
+        When timeout expires while the thread is reloading, the watcher stays started and the thread releases the
+        resources of the backend when it finishes, so stop() can be called again to wait for it.
+        """
+        if self._thread is None or self._backend is None:
+            return
+        self.stopping.set()
+        self._backend.wake()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return
+        self._thread = None
+        self._backend = None
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # UP037: To support Python 3.10 or lower
+    def __enter__(self) -> "Self":  # noqa: UP037
+        self.start()
+        return self
+
+    # Reason: Ruff's bug
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],  # noqa: UP006,UP045
+        exc_value: Optional[BaseException],  # noqa: UP045
+        traceback: Optional[TracebackType],  # noqa: UP045
+    ) -> None:
+        self.stop()
+
+    def _create_backend(self) -> Union[InotifyBackend, PollingBackend]:  # noqa: UP007
+        if self.backend != "polling":
+            libc = load_libc()
+            if libc is not None:
+                try:
+                    return InotifyBackend(self.options.paths, libc)
+                # Reason: Limit of watches, seccomp or file system may not allow inotify even if libc has it.
+                except OSError:
+                    if self.backend == "inotify":
+                        raise
+                    logger.warning("Watch %s by polling since inotify failed", self.path, exc_info=True)
+                    return PollingBackend(self.options.paths, self.poll_interval, self.stopping)
+            if self.backend == "inotify":
+                msg = "inotify is not available on this platform"
+                raise OSError(msg)
+        return PollingBackend(self.options.paths, self.poll_interval, self.stopping)
+
+    def _run(self, backend: Union[InotifyBackend, PollingBackend]) -> None:  # noqa: UP007
+        try:
+            while not self.stopping.is_set():
+                if not backend.wait(None):
+                    continue
+                # Debounce: wait until events stop arriving
+                while backend.wait(self.debounce):
+                    pass
+                if not self.stopping.is_set():
+                    self.reload()
+        finally:
+            # Closed by this thread so that file descriptors are not closed while waiting on them
+            backend.close()
+
+    def reload(self) -> None:
+        """Reload the config instance, passing the exception to on_error when failed."""
+        try:
+            self.config.load(
+                self.path,
+                path_is_absolute=True,
+                yaml_backend=self.options.yaml_backend,
+                deserializer=self.options.deserializer,
+                overlays=self.options.paths[1:],
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if self.on_error is None:
+                logger.exception("Failed to reload %s", self.path)
+            else:
+                self.on_error(error)
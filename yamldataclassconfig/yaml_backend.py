@@ -0,0 +1,111 @@
+"""This module implements registry of YAML parser backends.
+
+PyYAML is imported when a backend is used for the first time, not when this module is imported.
+"""
+
+from __future__ import annotations
+
+from typing import IO
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+__all__ = [
+    "DEFAULT_YAML_BACKEND",
+    "YamlBackend",
+    "get_yaml_backend",
+    "register_yaml_backend",
+    "yaml_backend_names",
+]
+
+# Prefers libyaml and falls back to pure-Python loader when PyYAML is built without it
+DEFAULT_YAML_BACKEND = "auto"
+
+YamlStream = Union[str, bytes, IO[str], IO[bytes]]
+
+
+class YamlBackend:
+    """Parser backend which wraps a PyYAML loader class."""
+
+    # Reason: Ruff's bug
+    def __init__(self, name: str, loader: Type[Any]) -> None:  # noqa: UP006
+        self.name = name
+        self.loader = loader
+
+    @property
+    def is_libyaml(self) -> bool:
+        """Whether the loader is implemented in C by libyaml."""
+        return self.loader.__module__ == "yaml.cyaml"
+
+    def load(self, stream: YamlStream) -> Any:  # noqa: ANN401
+        """Parse the first document in the stream."""
+        import yaml  # noqa: PLC0415  # pylint: disable=import-outside-toplevel  # Reason: Already imported by loader.
+
+        # Reason: The loader is chosen by configuration, not by untrusted input.
+        return yaml.load(stream, Loader=self.loader)  # nosec  # noqa: S506
+
+    def load_all(self, stream: YamlStream) -> Iterator[Any]:
+        """Parse all documents in the stream lazily."""
+        import yaml  # noqa: PLC0415  # pylint: disable=import-outside-toplevel  # Reason: Already imported by loader.
+
+        # Reason: The loader is chosen by configuration, not by untrusted input.
+        return yaml.load_all(stream, Loader=self.loader)  # nosec
+
+
+# Reason: Ruff's bug
+_backends: Dict[str, YamlBackend] = {}  # noqa: UP006
+# Names of PyYAML loader classes of built-in backends in order of preference, registered on the first use
+_BUILTIN_BACKENDS: Dict[str, Tuple[str, ...]] = {  # noqa: UP006
+    "full": ("FullLoader",),
+    "safe": ("SafeLoader",),
+    "c_full": ("CFullLoader", "FullLoader"),
+    "c_safe": ("CSafeLoader", "SafeLoader"),
+    DEFAULT_YAML_BACKEND: ("CFullLoader", "FullLoader"),
+}
+
+
+# Reason: Ruff's bug
+def register_yaml_backend(name: str, *loaders: Optional[Type[Any]]) -> YamlBackend:  # noqa: UP006,UP045
+    """Register YAML parser backend.
+
+    The first loader which is not None is used, so optional loaders like libyaml ones can be listed before their
+    pure-Python fallback.
+
+    Args:
+        name: Name to select the backend by YamlDataClassConfig.YAML_BACKEND or load(yaml_backend=...)
+        *loaders: Candidates of PyYAML loader class in order of preference
+
+    Returns:
+        Registered backend
+    """
+    available = [loader for loader in loaders if loader is not None]
+    if not available:
+        msg = f"No loader is available for YAML backend '{name}'"
+        raise ValueError(msg)
+    backend = YamlBackend(name, available[0])
+    _backends[name] = backend
+    return backend
+
+
+def get_yaml_backend(name: str) -> YamlBackend:
+    """Get registered YAML parser backend by name."""
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend
+    if name in _BUILTIN_BACKENDS:
+        import yaml  # noqa: PLC0415  # pylint: disable=import-outside-toplevel  # Reason: To import PyYAML lazily.
+
+        return register_yaml_backend(name, *(getattr(yaml, loader, None) for loader in _BUILTIN_BACKENDS[name]))
+    msg = f"Unknown YAML backend '{name}'. Available backends: {', '.join(yaml_backend_names())}"
+    raise ValueError(msg)
+
+
+# Reason: Ruff's bug
+def yaml_backend_names() -> List[str]:  # noqa: UP006
+    """List names of registered YAML parser backends."""
+    return sorted({*_backends, *_BUILTIN_BACKENDS})